@@ -0,0 +1,383 @@
+# ---------- TDAU asyncio Device Personality Module
+# Awaitable version of the TDAU command set for driving several units
+# from one event loop. Each unit allows one command in flight; separate
+# units run concurrently with no thread per port.
+#
+# Frames are built and decoded by a TDAU_c.TDAU instance (self.Codec)
+# that never opens a port, so this module and TDAU_c cannot drift apart.
+#
+# fnConnect() needs pyserial-asyncio. fnAttach() accepts any asyncio
+# StreamReader/StreamWriter pair instead.
+#
+# Functions in this module (all awaitable unless noted):
+#           fnAttach()                           Use existing reader/writer (not awaitable)
+#           fnCalibration()                      Initiate Auto Calibration
+#           fnCalRTD()                           Initiate RTD Calibration
+#           fnConnect()                          Connect via RS-232 (USB)
+#           fnDisconnect()                       Disconnect
+#           fnExtendedCalibration()              Initiate Extended Calibration
+#           fnFlush()                            Flush log
+#           fnRdExtendedError()                  Read Extended Error
+#           fnRdFloat()                          Return float of value in memory
+#           fnRdFWVersion()                      Request Firmware Version
+#           fnRdLog()                            Send block of logged data
+#           fnRdMemory()                         Read Memory
+#           fnRdRange()                          Read span of memory as bytes
+#           fnRdSerialNumber()                   Read Unit Serial Number
+#           fnRdTemperature()                    Read Temperature
+#           fnSaveMemory()                       Save RAM to EEPROM
+#           fnSCOCalibration()                   Initiate Single Current Offset Calibration
+#           fnStartConversion()                  Start Temperature Conversion
+#           fnStopConversion()                   Stop Temperature Conversion
+#           fnWrBlock()                          Write block of memory (any length)
+#           fnWrFloat()                          Write float to memory
+#           fnWrMemory()                         Write Memory
+#
+# Return values match the TDAU_c.TDAU function of the same name.
+
+import asyncio
+import struct
+import TDAU_c
+from TDAU_c import (CMD_CAL,CMD_EXTC,CMD_FLLOG,CMD_BLOCK,CMD_RDERR,CMD_RDSER,
+                    CMD_RTD,CMD_SCO,CMD_START,CMD_STOP,CMD_VREQ,MEM_MAP,WRMEM_MAX)
+
+
+class AsyncTDAU():
+    def __init__(self):
+        self.Module_Name = "AsyncTDAU"
+        self.bCommEnabled = False
+        self.Reader = None                       # asyncio StreamReader
+        self.Writer = None                       # asyncio StreamWriter
+        self.Codec = TDAU_c.TDAU()               # Builds and decodes frames only
+        self.Lock = asyncio.Lock()               # One command in flight per unit
+        return
+
+# ---------- Use existing reader/writer ----------
+    def fnAttach(self,Reader,Writer):
+        """
+        Use an existing asyncio stream pair (not awaitable)
+        Parameters: asyncio.StreamReader: bytes from TDAU
+                    asyncio.StreamWriter: bytes to TDAU
+        Returns:    bool: True
+        """
+        self.Reader = Reader
+        self.Writer = Writer
+        self.bCommEnabled = True
+        return True
+
+# ---------- Connect to TDAU ----------
+    async def fnConnect(self,COMPort):
+        """
+        Connect to TDAU
+        Parameters: int: Port number
+                     OR string: port name or pyserial URL
+        Returns:    bool: True if successful
+                          False if unsuccessful
+        """
+        try:
+            import serial_asyncio
+        except ImportError:
+            print("pyserial-asyncio is required for AsyncTDAU.fnConnect")
+            return False
+        if type(COMPort) == int:
+            sCOMPort = "COM{}".format(COMPort)
+        else:
+            sCOMPort = COMPort
+        try:
+            Reader,Writer = await serial_asyncio.open_serial_connection(url=sCOMPort,baudrate=38400,
+                                                                       bytesize=8,parity="N",stopbits=1)
+        except Exception:
+            print("Unable to open port {}".format(sCOMPort))
+            return False
+        self.fnAttach(Reader,Writer)
+        sVersion = await self.fnRdFWVersion()
+        if (type(sVersion) != str) or ("." not in sVersion):
+            print("Unable to communicate on port {}".format(sCOMPort))
+            await self.fnDisconnect()
+            return False
+        return True
+
+# ---------- Disconnect TDAU ----------
+    async def fnDisconnect(self):
+        """
+        Disconnect TDAU
+        Parameters: None
+        Returns:    bool: True if successful
+                          False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        self.bCommEnabled = False
+        async with self.Lock:                        # Let a command in flight finish
+            self.Writer.close()
+            try:
+                await self.Writer.wait_closed()
+            except Exception:
+                pass
+        return True
+
+# ========== TDAU SPECIFIC FUNCTIONS =========================================
+
+    async def fnCalibration(self,PrintMode=False):
+        return await self.fnCommand(CMD_CAL,PrintMode)
+
+    async def fnCalRTD(self,PrintMode=False):
+        return await self.fnCommand(CMD_RTD,PrintMode)
+
+    async def fnExtendedCalibration(self,PrintMode=False):
+        return await self.fnCommand(CMD_EXTC,PrintMode)
+
+    async def fnFlush(self,PrintMode=False):
+        return await self.fnCommand(CMD_FLLOG,PrintMode)
+
+    async def fnRdExtendedError(self,PrintMode=False):
+        return await self.fnCommand(CMD_RDERR,PrintMode)
+
+    async def fnRdFWVersion(self,PrintMode=False):
+        return await self.fnCommand(CMD_VREQ,PrintMode)
+
+    async def fnRdLog(self,PrintMode=False):
+        return await self.fnCommand(CMD_BLOCK,PrintMode)
+
+    async def fnRdSerialNumber(self,PrintMode=False):
+        return await self.fnCommand(CMD_RDSER,PrintMode)
+
+    async def fnSCOCalibration(self,PrintMode=False):
+        return await self.fnCommand(CMD_SCO,PrintMode)
+
+    async def fnStartConversion(self,PrintMode=False):
+        return await self.fnCommand(CMD_START,PrintMode)
+
+    async def fnStopConversion(self,PrintMode=False):
+        return await self.fnCommand(CMD_STOP,PrintMode)
+
+# ---------- Read Float from memory ----------
+    async def fnRdFloat(self,iAddress,PrintMode=False):
+        """
+        Read Float from memory
+        Parameters: 16 bit int: memory address
+                    bool: display messages (optional)
+        Returns:    float: value
+                     OR bool: False if not connected
+                     OR string of error
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        async with self.Lock:
+            CountRx = self.Codec.fnBuildRdMemory(iAddress,4)
+            RxChars = await self.fnExchange(CountRx)
+        return self.Codec.fnParseFloat(RxChars,iAddress,PrintMode)
+
+# ---------- Read Memory ----------
+    async def fnRdMemory(self,iAddress,iType=4,PrintMode=False):
+        """
+        Read Memory
+        Parameters: 16 bit int: memory address
+                    int: memory type/map (see TDAU_c.TDAU.fnRdMemory)
+                    bool: display messages (optional)
+        Returns:    string: 16 hex bytes from TDAU
+                     OR bool: False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        async with self.Lock:
+            CountRx = self.Codec.fnBuildRdMemory(iAddress,16,iType)
+            RxChars = await self.fnExchange(CountRx)
+        return self.Codec.fnParseMemory(RxChars,iAddress,iType,PrintMode)
+
+# ---------- Read span of memory as bytes ----------
+    async def fnRdRange(self,iAddress,iLength,iType=4):
+        """
+        Read span of memory as bytes
+        Parameters: 16 bit int: first memory address
+                    int: number of bytes to read
+                    int: memory type/map (see TDAU_c.TDAU.fnRdMemory)
+        Returns:    bytes: memory contents
+                     OR bool: False if not connected or upon error
+        Note:       Holds the unit for the whole span
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if (iType not in MEM_MAP) or (iLength < 1):
+            return False
+        Data = bytearray()
+        iNext = iAddress
+        async with self.Lock:
+            while len(Data) < iLength:
+                iQuan = min(16,iLength - len(Data))
+                CountRx = self.Codec.fnBuildRdMemory(iNext,iQuan,iType)
+                Block = self.Codec.fnParseBlock(await self.fnExchange(CountRx),iNext,iQuan,iType)
+                if type(Block) != bytes:
+                    return False
+                Data.extend(Block)
+                iNext += iQuan
+        return bytes(Data)
+
+# ---------- Read Temperature ----------
+    async def fnRdTemperature(self,ChannelMap,PrintMode=False):
+        """
+        Read Temperature
+        Parameters: int: ChannelMap (bit 0 = channel 1 ... bit 3 = channel 4)
+                    bool: display messages (optional)
+        Returns:    string: see TDAU_c.TDAU.fnRdTemperature
+                     OR bool: False if not connected or bad map
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if (ChannelMap < 1) or (ChannelMap > 15):
+            return False                             # Must specify at least 1 channel
+        return await self.fnCommand(0x10 | ChannelMap,PrintMode)
+
+# ---------- Save Memory ----------
+    async def fnSaveMemory(self,iAddress,iQuan,PrintMode=False):
+        """
+        Save Memory to EEPROM
+        Parameters: 16 bit int: memory address
+                    8 bit int: quantity of bytes to save
+                    bool: display messages (optional)
+        Returns:    string: string from TDAU
+                     OR bool: False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if iQuan == 0:
+            return False                             # No data to save
+        async with self.Lock:
+            self.Codec.fnBuildSaveMemory(iAddress,iQuan)
+            RxChars = await self.fnExchange()
+        return self.Codec.fnParseReply(RxChars,PrintMode)
+
+# ---------- Write block of memory ----------
+    async def fnWrBlock(self,iAddress,Data,PrintMode=False):
+        """
+        Write block of memory
+        Parameters: 16 bit int: first memory address
+                    tuple/list/bytes: int for each byte of data (any length)
+                    bool: display messages (optional)
+        Returns:    string: string from TDAU (first error if any)
+                     OR bool: False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if len(Data) == 0:
+            return False                             # No data to write
+        for x in range(0,len(Data),WRMEM_MAX):
+            sReply = await self.fnWrMemory(iAddress + x,Data[x:(x+WRMEM_MAX)],PrintMode)
+            if str(sReply) != "PASS":
+                break
+        return sReply
+
+# ---------- Write Float to memory ----------
+    async def fnWrFloat(self,iAddress,fValue,PrintMode=False):
+        """
+        Write Float to memory
+        Parameters: 16 bit int: memory address
+                    float: value
+                    bool: display messages (optional)
+        Returns:    string: string from TDAU
+                     OR bool: False if not connected
+        """
+        return await self.fnWrMemory(iAddress,struct.pack("<f",float(fValue)),PrintMode)
+
+# ---------- Write Memory ----------
+    async def fnWrMemory(self,iAddress,tData,PrintMode=False):
+        """
+        Write Memory
+        Parameters: 16 bit int: memory address
+                    int: single byte of data
+                     OR tuple/list/bytes: int for each byte of data (max 32)
+                    bool: display messages (optional)
+        Returns:    string: string from TDAU
+                     OR bool: False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        async with self.Lock:
+            if not self.Codec.fnBuildWrMemory(iAddress,tData):
+                return False
+            RxChars = await self.fnExchange()
+        return self.Codec.fnParseReply(RxChars,PrintMode)
+
+
+# =================== SUBROUTINES ===================
+
+# ---------- Send single byte command and decode reply ----------
+    async def fnCommand(self,iCommand,PrintMode=False):
+        """
+        INTERNAL USE ONLY: Send single byte command and decode reply
+        Parameters: int: command
+                    bool: display messages (optional)
+        Returns:    string: decoded reply
+                     OR bool: False if not connected
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        async with self.Lock:
+            self.Codec.TxBuffer[0] = iCommand
+            self.Codec.TxCount = 1
+            RxChars = await self.fnExchange()
+        return self.Codec.fnParseReply(RxChars,PrintMode)
+
+# ---------- Send Codec TxBuffer and read reply frame ----------
+    async def fnExchange(self,iLength=0):
+        """
+        INTERNAL USE ONLY: Send Codec TxBuffer and read reply frame
+        Parameters: int: expected length of R_MEM reply (optional)
+        Returns:    list: int for each byte received
+        Note:       Caller must hold self.Lock. Unread bytes (a late reply
+                    to an earlier command) are discarded before the write
+                    and after a partial or unknown frame.
+        """
+        if not self.bCommEnabled:                    # Disconnected while waiting for Lock
+            return []
+        fTimeout = self.Codec.dReplyTimeout.get(self.Codec.TxBuffer[0],self.Codec.ReplyTimeout)
+        await self.fnDrain()                         # Drop late replies
+        self.Writer.write(self.Codec.fnTxFrame())
+        await self.Writer.drain()
+        RxChars = []
+        try:
+            await asyncio.wait_for(self.fnRdFrame(RxChars,iLength),fTimeout)
+        except asyncio.TimeoutError:
+            pass                                     # Partial frame is decoded as insufficient
+        iTotal = self.Codec.fnFrameLength(RxChars,iLength) if RxChars else 1
+        if (iTotal == None) or (len(RxChars) < iTotal):
+            await self.fnDrain()                     # Late or unknown reply, resync
+        return RxChars
+
+# ---------- Discard bytes waiting in Reader ----------
+    async def fnDrain(self):
+        """
+        INTERNAL USE ONLY: Discard bytes waiting in Reader
+        Parameters: None
+        Returns:    int: number of bytes discarded
+        Note:       Only takes what is already buffered, never waits for
+                    more. StreamReader has no public count of buffered
+                    bytes, so its _buffer is measured.
+        """
+        iWaiting = len(getattr(self.Reader,"_buffer",b""))
+        if iWaiting == 0:
+            return 0
+        return len(await self.Reader.read(iWaiting))   # Buffered, returns at once
+
+# ---------- Read one reply frame from TDAU ----------
+    async def fnRdFrame(self,RxChars,iLength=0):
+        """
+        INTERNAL USE ONLY: Read one reply frame from TDAU
+        Parameters: list: bytes received are appended here
+                    int: expected length of R_MEM reply (optional)
+        Returns:    list: RxChars
+        """
+        iTotal = 1                                   # Reply code tells the rest
+        while len(RxChars) < iTotal:
+            Rx = await self.Reader.read(iTotal - len(RxChars))
+            if len(Rx) == 0:
+                break                                # Stream closed
+            RxChars.extend(Rx)
+            iTotal = self.Codec.fnFrameLength(RxChars,iLength)
+            if iTotal == None:                       # Unknown reply, drain it
+                try:
+                    RxChars.extend(await asyncio.wait_for(self.Reader.read(255),0.05))
+                except asyncio.TimeoutError:
+                    pass
+                break
+        return RxChars
@@ -15,6 +15,7 @@
 #
 # Standard functions in this module:
 #           fnAskRawString()                     Write query, return reply
+#           fnAttach()                           Use an already open port (e.g. TDAU_sim.TDAUSim)
 #           fnConnect()                          Connect via RS-232 (USB)
 #           fnDict()                             Get module dictionary
 #           fnDisconnect()                       Disconnect
@@ -27,39 +28,60 @@
 # TDAU specific functions:
 #           fnCalibration()                      Initiate Auto Calibration
 #           fnCalRTD()                           Initiate RTD Calibration
+#           fnDiffSnapshot()                     Compare configuration snapshot with unit
+#           fnDrainLog()                         Read every log record into a binary store
 #           fnExtendedCalibration()              Initiate Extended Calibration
 #           fnFactoryCalibration()               Factory Calibration
 #           fnFlush()                            Flush log
 #           fnLock()                             Lock memory access
+#           fnRdDynamic()                        Read all dynamic readings in one pass
 #           fnRdExtendedError()                  Read Extended Error
 #           fnRdFloat()                          Return float of value in memory
 #           fnRdFWVersion()                      Request Firmware Version
 #           fnRdLog()                            Send block of logged data
 #           fnRdMemory()                         Read Memory
+#           fnRdRange()                          Read span of memory as bytes
+#           fnRdRegisters()                      Read named registers (REG_MAP)
 #           fnRdReply()                          Read Reply from TDAU
 #           fnRdSerialNumber()                   Read Unit Serial Number
 #           fnRdTemperature()                    Read Temperature
+#           fnRecord()                           Record serial traffic to a trace file
 #           fnResend()                           Resend prior response
+#           fnRestoreSnapshot()                  Write back changed bytes of a snapshot
 #           fnSaveMemory()                       Save RAM to EEPROM
 #           fnSaveToFile()                       Save User memory to file (was fnWriteFile)
 #           fnSCOCalibration()                   Initiate Single Current Offset Calibration
+#           fnShadow()                           Enable/disable host copy of user RAM
+#           fnShadowDirty()                      List RAM spans written but not saved
 #           fnShowConfiguration()                Display TDAU's user configuration
 #           fnShowDynamic()                      Display TDAU's dynamic readings
 #           fnShowProtected()                    Display TDAU's factory configuration
 #           fnShowTemperatures()                 Display TDAU's temperature memory
+#           fnSnapshot()                         Save configuration image (binary/JSON)
 #           fnStartConversion()                  Start Temperature Conversion
+#           fnStats()                            Per-command latency/byte counters
+#           fnStatsReset()                       Enable/disable/clear fnStats counters
 #           fnStopConversion()                   Stop Temperature Conversion
+#           fnStream()                           Generator of temperature samples
 #           fnUnlock()                           Unlock memory access
+#           fnWrBlock()                          Write block of memory (any length)
+#           fnWrFloat()                          Write float to memory
 #           fnWrFWUpdate()                       Update Firmware from HEX file
 #           fnWrMemory()                         Write Memory
+#           fnWrWord()                           Write 16 bit int to memory
 
 import re
 import sys
 import string
 import time
+import queue                             # Used by fnStream
+import threading                         # Used by fnStream
 import serial
 import struct                            # Used by unpack
+import json                              # Used by fnSnapshot
 import math                              # Used by powerise10, floor, log10
+import bisect                            # Used by fnStatsTime
+import copy                              # Used by fnStats
 from ctypes import *                     # Used by cnvfloat
 
 CR = chr(13)
@@ -129,6 +151,1134 @@ C_NODATA   = 0x48                        # No more data
 C_OVERF    = 0x49                        # Receiver overflow
 C_BOOT     = 0x4A                        # Boot code not found
 
+WRMEM_MAX  = 32                          # Max data bytes in one CMD_WRMEM frame
+
+# ----- Memory regions: command, reply length, command length, name
+MEM_MAP    = {0:(CMD_RDR0,17,3,"SRAM pg0:"),
+              1:(CMD_RDR1,17,3,"SRAM pg1"),
+              2:(CMD_RDF0,17,3,"FLASH p0:"),
+              3:(CMD_RDF1,17,3,"FLASH p1:"),
+              4:(CMD_RDMEM,18,4,"USER RAM:")}
+
+# ----- Host shadow of user RAM
+#  Only the configuration/calibration map is cached. ADC readings
+#  (0x240-0x344) and temperatures (0x404+) always go to the wire.
+SHADOW_SIZE = 0x240                      # Cached span is 0x000 to SHADOW_SIZE-1
+SHADOW_CAL  = {CMD_CAL:(0x184,0x84),     # Span rewritten by each calibration
+               CMD_EXTC:(0x184,0x84),    #   (address, quantity)
+               CMD_FACC:(0x184,0xBC),
+               CMD_RTD:(0x184,0xBC),
+               CMD_SCO:(0x03C,0x08)}
+
+# ----- Per-command statistics (fnStatsReset/fnStats)
+#  Keyed by command byte (CMD_*), "RAW" for frames not sent to SLAVE.
+#  Write = port write, Sleep = fixed delay after the write (fnWrBuffer),
+#  Wait = end of that delay to first reply byte, Read = first to last
+#  byte of the reply frame.
+STAT_PHASES  = ("Write","Sleep","Wait","Read")
+STAT_NOCS    = (CMD_RDR0,CMD_RDR1,       # Commands whose R_MEM reply has no checksum
+                CMD_RDF0,CMD_RDF1)
+STAT_BUCKETS = (0.0001,0.0002,0.0005,    # Histogram upper bounds (seconds),
+                0.001,0.002,0.005,       #   one more bucket for anything slower
+                0.01,0.02,0.05,
+                0.1,0.2,0.5,
+                1.0,2.0,5.0)
+
+# ----- Configuration snapshot file (fnSnapshot)
+#  Binary: header then Length bytes of user RAM from Address
+#  JSON:   {"serial":, "firmware":, "address":, "data": hex string}
+SNAP_MAGIC  = b"TDAU"
+SNAP_HEADER = "<4sIBBHH"                 # magic, serial, FW major, FW minor, address, length
+
+# ----- Register map of user RAM
+#  name: (address, width, type, scale)
+#  Types (see REG_TYPE):
+#    u8/u16/s16/u32  little endian integer
+#    f32             float
+#    adc             status byte, then signed 24 bit ADC count (big endian)
+#    adct            adc count as internal ADC temperature (deg C)
+#    temp            <sign.status.decimal> <integer degrees> (as R_STATn)
+#  scale: value = raw / scale, None = unscaled
+#  Names are the fnSaveToFile row names; several names may share bytes.
+#  Decode with RegDecoder (below) or TDAU.fnRdRegisters.
+REG_TYPE   = {"u8":("B",None),           # type: (struct format, convert)
+              "u16":("H",None),
+              "s16":("h",None),
+              "u32":("I",None),
+              "f32":("f",None),
+              "adc":("x3s",lambda Raw: int.from_bytes(Raw,"big",signed=True)),
+              "adct":("x3s",lambda Raw: (((int.from_bytes(Raw,"big",signed=True) * 6.357829E-7) - 168E-3) / 394E-6) + 25),
+              "temp":("2s",lambda Raw: (-1 if (Raw[0] & 0x10) else 1) * ((Raw[1] * 10) + min(Raw[0] & 0x0F,9)) / 10)}
+REG_MAP    = {"Control Word 1":                    (0x000,2,"u16",None),
+              "Control Word 2":                    (0x002,2,"u16",None),
+              "Control Word 3":                    (0x004,2,"u16",None),
+              "Control Word 4":                    (0x006,2,"u16",None),
+              "Trigger Delay":                     (0x008,2,"u16",None),
+              "Sampling Interval":                 (0x00A,2,"u16",None),
+              "Number of samples to acquire":      (0x00C,2,"u16",None),
+              "Measurement Averaging":             (0x00E,1,"u8",None),
+              "Temperature Averaging":             (0x010,1,"u8",None),
+              "Base Offset DAC Default":           (0x012,2,"u16",None),
+              "Single I Offset Sampling Interval": (0x014,2,"u16",None),
+              "Single I Offset Number of samples": (0x016,1,"u8",None),
+              "Temperature DAC Offset":            (0x018,2,"u16",None),
+              "Temperature DAC Slope":             (0x01A,2,"u16",None),
+              "Ch1 Ideality Factor":               (0x01C,4,"f32",None),
+              "Ch2 Ideality Factor":               (0x020,4,"f32",None),
+              "Ch3 Ideality Factor":               (0x024,4,"f32",None),
+              "Ch4 Ideality Factor":               (0x028,4,"f32",None),
+              "Ch1 Early Voltage":                 (0x02C,4,"f32",None),
+              "Ch2 Early Voltage":                 (0x030,4,"f32",None),
+              "Ch3 Early Voltage":                 (0x034,4,"f32",None),
+              "Ch4 Early Voltage":                 (0x038,4,"f32",None),
+              "Ch1 Single I Slope":                (0x03C,2,"s16",None),
+              "Ch2 Single I Slope":                (0x03E,2,"s16",None),
+              "Ch3 Single I Slope":                (0x040,2,"s16",None),
+              "Ch4 Single I Slope":                (0x042,2,"s16",None),
+              "Ch1 Temperature Offset":            (0x044,4,"f32",None),
+              "Ch2 Temperature Offset":            (0x048,4,"f32",None),
+              "Ch3 Temperature Offset":            (0x04C,4,"f32",None),
+              "Ch4 Temperature Offset":            (0x050,4,"f32",None),
+              "Ch1 Force Current 1 (Ie1)":         (0x054,4,"f32",None),
+              "Ch1 Force Current 2 (Ie2)":         (0x058,4,"f32",None),
+              "Ch1 Force Current 3 (Ie3)":         (0x05C,4,"f32",None),
+              "Ch2 Force Current 1 (Ie1)":         (0x060,4,"f32",None),
+              "Ch2 Force Current 2 (Ie2)":         (0x064,4,"f32",None),
+              "Ch2 Force Current 3 (Ie3)":         (0x068,4,"f32",None),
+              "Ch3 Force Current 1 (Ie1)":         (0x06C,4,"f32",None),
+              "Ch3 Force Current 2 (Ie2)":         (0x070,4,"f32",None),
+              "Ch3 Force Current 3 (Ie3)":         (0x074,4,"f32",None),
+              "Ch4 Force Current 1 (Ie1)":         (0x078,4,"f32",None),
+              "Ch4 Force Current 2 (Ie2)":         (0x07C,4,"f32",None),
+              "Ch4 Force Current 3 (Ie3)":         (0x080,4,"f32",None),
+              "Ch1 BJT Temp Lo-Limit":             (0x084,4,"f32",None),
+              "Ch1 BJT Temp Hi-Limit":             (0x088,4,"f32",None),
+              "Ch2 BJT Temp Lo-Limit":             (0x08C,4,"f32",None),
+              "Ch2 BJT Temp Hi-Limit":             (0x090,4,"f32",None),
+              "Ch3 BJT Temp Lo-Limit":             (0x094,4,"f32",None),
+              "Ch3 BJT Temp Hi-Limit":             (0x098,4,"f32",None),
+              "Ch4 BJT Temp Lo-Limit":             (0x09C,4,"f32",None),
+              "Ch4 BJT Temp Hi-Limit":             (0x0A0,4,"f32",None),
+              "Ch1 Force ie1 Lo-Limit":            (0x0A4,4,"f32",None),
+              "Ch1 Force ie1 Hi-Limit":            (0x0A8,4,"f32",None),
+              "Ch1 Force ie2 Lo-Limit":            (0x0AC,4,"f32",None),
+              "Ch1 Force ie2 Hi-Limit":            (0x0B0,4,"f32",None),
+              "Ch1 Force ie3 Lo-Limit":            (0x0B4,4,"f32",None),
+              "Ch1 Force ie3 Hi-Limit":            (0x0B8,4,"f32",None),
+              "Ch2 Force ie1 Lo-Limit":            (0x0BC,4,"f32",None),
+              "Ch2 Force ie1 Hi-Limit":            (0x0C0,4,"f32",None),
+              "Ch2 Force ie2 Lo-Limit":            (0x0C4,4,"f32",None),
+              "Ch2 Force ie2 Hi-Limit":            (0x0C8,4,"f32",None),
+              "Ch2 Force ie3 Lo-Limit":            (0x0CC,4,"f32",None),
+              "Ch2 Force ie3 Hi-Limit":            (0x0D0,4,"f32",None),
+              "Ch3 Force ie1 Lo-Limit":            (0x0D4,4,"f32",None),
+              "Ch3 Force ie1 Hi-Limit":            (0x0D8,4,"f32",None),
+              "Ch3 Force ie2 Lo-Limit":            (0x0DC,4,"f32",None),
+              "Ch3 Force ie2 Hi-Limit":            (0x0E0,4,"f32",None),
+              "Ch3 Force ie3 Lo-Limit":            (0x0E4,4,"f32",None),
+              "Ch3 Force ie3 Hi-Limit":            (0x0E8,4,"f32",None),
+              "Ch4 Force ie1 Lo-Limit":            (0x0EC,4,"f32",None),
+              "Ch4 Force ie1 Hi-Limit":            (0x0F0,4,"f32",None),
+              "Ch4 Force ie2 Lo-Limit":            (0x0F4,4,"f32",None),
+              "Ch4 Force ie2 Hi-Limit":            (0x0F8,4,"f32",None),
+              "Ch4 Force ie3 Lo-Limit":            (0x0FC,4,"f32",None),
+              "Ch4 Force ie3 Hi-Limit":            (0x100,4,"f32",None),
+              "Ch1 Current ib1 Lo-Limit":          (0x104,4,"f32",None),
+              "Ch1 Current ib1 Hi-Limit":          (0x108,4,"f32",None),
+              "Ch1 Current ib2 Lo-Limit":          (0x10C,4,"f32",None),
+              "Ch1 Current ib2 Hi-Limit":          (0x110,4,"f32",None),
+              "Ch1 Current ib3 Lo-Limit":          (0x114,4,"f32",None),
+              "Ch1 Current ib3 Hi-Limit":          (0x118,4,"f32",None),
+              "Ch2 Current ib1 Lo-Limit":          (0x11C,4,"f32",None),
+              "Ch2 Current ib1 Hi-Limit":          (0x120,4,"f32",None),
+              "Ch2 Current ib2 Lo-Limit":          (0x124,4,"f32",None),
+              "Ch2 Current ib2 Hi-Limit":          (0x128,4,"f32",None),
+              "Ch2 Current ib3 Lo-Limit":          (0x12C,4,"f32",None),
+              "Ch2 Current ib3 Hi-Limit":          (0x130,4,"f32",None),
+              "Ch3 Current ib1 Lo-Limit":          (0x134,4,"f32",None),
+              "Ch3 Current ib1 Hi-Limit":          (0x138,4,"f32",None),
+              "Ch3 Current ib2 Lo-Limit":          (0x13C,4,"f32",None),
+              "Ch3 Current ib2 Hi-Limit":          (0x140,4,"f32",None),
+              "Ch3 Current ib3 Lo-Limit":          (0x144,4,"f32",None),
+              "Ch3 Current ib3 Hi-Limit":          (0x148,4,"f32",None),
+              "Ch4 Current ib1 Lo-Limit":          (0x14C,4,"f32",None),
+              "Ch4 Current ib1 Hi-Limit":          (0x150,4,"f32",None),
+              "Ch4 Current ib2 Lo-Limit":          (0x154,4,"f32",None),
+              "Ch4 Current ib2 Hi-Limit":          (0x158,4,"f32",None),
+              "Ch4 Current ib3 Lo-Limit":          (0x15C,4,"f32",None),
+              "Ch4 Current ib3 Hi-Limit":          (0x160,4,"f32",None),
+              "Ch1 Leakage Hi-Limit":              (0x164,4,"f32",None),
+              "Ch2 Leakage Hi-Limit":              (0x168,4,"f32",None),
+              "Ch3 Leakage Hi-Limit":              (0x16C,4,"f32",None),
+              "Ch4 Leakage Hi-Limit":              (0x170,4,"f32",None),
+              "Too Hot Threshold":                 (0x174,2,"u16",100),
+              "Catastrophic Threshold":            (0x176,2,"u16",100),
+              "Reserved5":                         (0x178,2,"u16",None),
+              "Reserved6":                         (0x17A,2,"u16",None),
+              "Reserved7":                         (0x17C,2,"u16",None),
+              "Reserved8":                         (0x17E,2,"u16",None),
+              "Serial Number":                     (0x180,4,"u32",None),
+              "Voltage A-D VREF":                  (0x184,4,"f32",None),
+              "Voltage A-D FS Calibration":        (0x188,4,"f32",None),
+              "Current A-D VREF":                  (0x18C,4,"f32",None),
+              "Current A-D FS Calibration":        (0x190,4,"f32",None),
+              "Current DAC VREF":                  (0x194,4,"f32",None),
+              "Current DAC Offset":                (0x198,2,"s16",None),
+              "Current DAC Scale":                 (0x19A,4,"f32",None),
+              "CPU ADC VRef":                      (0x19E,2,"s16",None),
+              "Base DAC Offset":                   (0x1A0,2,"s16",None),
+              "Base DAC Scale":                    (0x1A2,4,"f32",None),
+              "System Temperature Delta":          (0x1A6,2,"temp",None),
+              "System Temperature Delta Hi-Limit": (0x1A6,2,"u16",100),
+              "Voltage A-D In 1 Offset":           (0x1A8,2,"s16",None),
+              "Voltage A-D In 2 Offset":           (0x1AA,2,"s16",None),
+              "Voltage A-D In 3 Offset":           (0x1AC,2,"s16",None),
+              "Voltage A-D In 4 Offset":           (0x1AE,2,"s16",None),
+              "Voltage A-D In 5 Offset":           (0x1B0,2,"s16",None),
+              "Voltage A-D In 6 Offset":           (0x1B2,2,"s16",None),
+              "Voltage A-D In 7 Offset":           (0x1B4,2,"s16",None),
+              "Voltage A-D In 8 Offset":           (0x1B6,2,"s16",None),
+              "Voltage A-D In 1 Scale":            (0x1B8,4,"f32",None),
+              "Voltage A-D In 2 Scale":            (0x1BC,4,"f32",None),
+              "Voltage A-D In 3 Scale":            (0x1C0,4,"f32",None),
+              "Voltage A-D In 4 Scale":            (0x1C4,4,"f32",None),
+              "Voltage A-D In 5 Scale":            (0x1C8,4,"f32",None),
+              "Voltage A-D In 6 Scale":            (0x1CC,4,"f32",None),
+              "Voltage A-D In 7 Scale":            (0x1D0,4,"f32",None),
+              "Voltage A-D In 8 Scale":            (0x1D4,4,"f32",None),
+              "Current A-D In 1 Offset":           (0x1D8,2,"s16",None),
+              "Current A-D In 2 Offset":           (0x1DA,2,"s16",None),
+              "Current A-D In 3 Offset":           (0x1DC,2,"s16",None),
+              "Current A-D In 4 Offset":           (0x1DE,2,"s16",None),
+              "Current A-D In 5 Offset":           (0x1E0,2,"s16",None),
+              "Current A-D In 6 Offset":           (0x1E2,2,"s16",None),
+              "Current A-D In 7 Offset":           (0x1E4,2,"s16",None),
+              "Current A-D In 8 Offset":           (0x1E6,2,"s16",None),
+              "Current A-D In 1 Scale":            (0x1E8,4,"f32",None),
+              "Current A-D In 2 Scale":            (0x1EC,4,"f32",None),
+              "Current A-D In 3 Scale":            (0x1F0,4,"f32",None),
+              "Current A-D In 4 Scale":            (0x1F4,4,"f32",None),
+              "Current A-D In 5 Scale":            (0x1F8,4,"f32",None),
+              "Current A-D In 6 Scale":            (0x1FC,4,"f32",None),
+              "Current A-D In 7 Scale":            (0x200,4,"f32",None),
+              "Current A-D In 8 Scale":            (0x204,4,"f32",None),
+              "+2.5v PS Voltage Lo-Limit":         (0x208,2,"u16",None),
+              "+2.5v PS Voltage Hi-Limit":         (0x20A,2,"u16",None),
+              "-2.5v PS Voltage Lo-Limit":         (0x20C,2,"u16",None),
+              "-2.5v PS Voltage Hi-Limit":         (0x20E,2,"u16",None),
+              "+5v Analog PS Voltage Lo-Limit":    (0x210,2,"u16",None),
+              "+5v Analog PS Voltage Hi-Limit":    (0x212,2,"u16",None),
+              "+5v Digital PS Voltage Lo-Limit":   (0x214,2,"u16",None),
+              "+5v Digital PS Voltage Hi-Limit":   (0x216,2,"u16",None),
+              "Internal ADC VRef Lo-Limit":        (0x218,2,"u16",None),
+              "Internal ADC VRef Hi-Limit":        (0x21A,2,"u16",None),
+              "10ua Test Resistance Lo Limit":     (0x21C,4,"f32",None),
+              "10ua Test Resistance Hi Limit":     (0x220,4,"f32",None),
+              "175ua Test Resistance Lo Limit":    (0x224,4,"f32",None),
+              "175ua Test Resistance Hi Limit":    (0x228,4,"f32",None),
+              "Temperature DAC Calibration Offset":(0x22C,2,"s16",None),
+              "Temperature DAC Calibration Slope": (0x22E,4,"f32",None),
+              "Reserved1":                         (0x232,2,"u16",None),
+              "Reserved2":                         (0x234,2,"u16",None),
+              "Reserved3":                         (0x236,2,"u16",None),
+              "Reserved4":                         (0x238,2,"u16",None),
+              "Month":                             (0x23A,1,"u8",None),
+              "Date":                              (0x23B,1,"u8",None),
+              "Year":                              (0x23C,2,"u16",None),
+              "Voltage A-D In1 Ie1":               (0x240,4,"adc",None),
+              "Voltage A-D In1 Ie2":               (0x244,4,"adc",None),
+              "Voltage A-D In1 Ie3":               (0x248,4,"adc",None),
+              "Voltage A-D In2 Ie1":               (0x24C,4,"adc",None),
+              "Voltage A-D In2 Ie2":               (0x250,4,"adc",None),
+              "Voltage A-D In2 Ie3":               (0x254,4,"adc",None),
+              "Voltage A-D In3 Ie1":               (0x258,4,"adc",None),
+              "Voltage A-D In3 Ie2":               (0x25C,4,"adc",None),
+              "Voltage A-D In3 Ie3":               (0x260,4,"adc",None),
+              "Voltage A-D In4 Ie1":               (0x264,4,"adc",None),
+              "Voltage A-D In4 Ie2":               (0x268,4,"adc",None),
+              "Voltage A-D In4 Ie3":               (0x26C,4,"adc",None),
+              "Voltage A-D In5 VbOs":              (0x270,4,"adc",None),
+              "Voltage A-D In6 ie1":               (0x274,4,"adc",None),
+              "Voltage A-D In6 ie2":               (0x278,4,"adc",None),
+              "Voltage A-D In6 ie3":               (0x27C,4,"adc",None),
+              "Voltage A-D In7 FullScale":         (0x280,4,"adc",None),
+              "Voltage A-D In8 Offset":            (0x284,4,"adc",None),
+              "Voltage A-D Internal Offset":       (0x288,4,"adc",None),
+              "Voltage A-D Internal Supply":       (0x28C,4,"adc",None),
+              "Voltage A-D Int Temperature":       (0x290,4,"adc",None),
+              "Voltage A-D Internal Gain":         (0x294,4,"adc",None),
+              "Voltage A-D External Ref":          (0x298,4,"adc",None),
+              "Voltage A-D Factory":               (0x29C,4,"adc",None),
+              "Current A-D In1 Ib1":               (0x2A0,4,"adc",None),
+              "Current A-D In1 Ib2":               (0x2A4,4,"adc",None),
+              "Current A-D In1 Ib3":               (0x2A8,4,"adc",None),
+              "Current A-D In2 Ib1":               (0x2AC,4,"adc",None),
+              "Current A-D In2 Ib2":               (0x2B0,4,"adc",None),
+              "Current A-D In2 Ib3":               (0x2B4,4,"adc",None),
+              "Current A-D In3 Ib1":               (0x2B8,4,"adc",None),
+              "Current A-D In3 Ib2":               (0x2BC,4,"adc",None),
+              "Current A-D In3 Ib3":               (0x2C0,4,"adc",None),
+              "Current A-D In4 Ib1":               (0x2C4,4,"adc",None),
+              "Current A-D In4 Ib2":               (0x2C8,4,"adc",None),
+              "Current A-D In4 Ib3":               (0x2CC,4,"adc",None),
+              "Current A-D In6 Ch1 ie1":           (0x2D0,4,"adc",None),
+              "Current A-D In6 Ch1 ie2":           (0x2D4,4,"adc",None),
+              "Current A-D In6 Ch1 ie3":           (0x2D8,4,"adc",None),
+              "Current A-D In6 Ch2 ie1":           (0x2DC,4,"adc",None),
+              "Current A-D In6 Ch2 ie2":           (0x2E0,4,"adc",None),
+              "Current A-D In6 Ch2 ie3":           (0x2E4,4,"adc",None),
+              "Current A-D In6 Ch3 ie1":           (0x2E8,4,"adc",None),
+              "Current A-D In6 Ch3 ie2":           (0x2EC,4,"adc",None),
+              "Current A-D In6 Ch3 ie3":           (0x2F0,4,"adc",None),
+              "Current A-D In6 Ch4 ie1":           (0x2F4,4,"adc",None),
+              "Current A-D In6 Ch4 ie2":           (0x2F8,4,"adc",None),
+              "Current A-D In6 Ch4 ie3":           (0x2FC,4,"adc",None),
+              "Current A-D In7 FullScale":         (0x300,4,"adc",None),
+              "Current A-D In8 Offset":            (0x304,4,"adc",None),
+              "Current A-D Internal Offset":       (0x308,4,"adc",None),
+              "Current A-D Internal Supply":       (0x30C,4,"adc",786432),
+              "Current A-D Int Temperature":       (0x310,4,"adct",None),
+              "Current A-D Internal Gain":         (0x314,4,"adc",None),
+              "Current A-D External Ref":          (0x318,4,"adc",786432),
+              "Current A-D Factory":               (0x31C,4,"adc",None),
+              "uC A-D In1 +2.5V":                  (0x320,2,"u16",None),
+              "uC A-D In2 -2.5V":                  (0x322,2,"u16",None),
+              "uC A-D In3 +5V Analog":             (0x324,2,"u16",None),
+              "uC A-D In4 +5V Digital":            (0x326,2,"u16",None),
+              "uC A-D Internal Vref":              (0x330,2,"u16",400),
+              "uC A-D Internal Offset":            (0x332,2,"s16",None),
+              "Raw DAC Leakage":                   (0x334,4,"f32",None),
+              "Voltage A-D In6 10ua Test":         (0x338,4,"adc",None),
+              "Voltage A-D In6 175ua Test":        (0x33C,4,"adc",None),
+              "Current A-D In6 10ua Test":         (0x340,4,"adc",None),
+              "Current A-D In6 175ua Test":        (0x344,4,"adc",None),
+              "Ch1 Single I Offset":               (0x348,4,"f32",None),
+              "Ch2 Single I Offset":               (0x34C,4,"f32",None),
+              "Ch3 Single I Offset":               (0x350,4,"f32",None),
+              "Ch4 Single I Offset":               (0x354,4,"f32",None),
+              "Current Internal Gain":             (0x35C,4,"f32",None),
+              "uC A-D In1 +2.5V Result":           (0x360,2,"u16",10000),
+              "uC A-D In2 -2.5V Result":           (0x362,2,"u16",10000),
+              "uC A-D In3 +5V Analog Result":      (0x364,2,"u16",10000),
+              "uC A-D In4 +5V Digital Result":     (0x366,2,"u16",10000),
+              "VbOs":                              (0x368,4,"f32",None),
+              "V@ie1":                             (0x36C,4,"f32",None),
+              "V@ie2":                             (0x370,4,"f32",None),
+              "V@ie3":                             (0x374,4,"f32",None),
+              "Voltage FullScale":                 (0x378,4,"f32",None),
+              "Current FullScale":                 (0x37C,4,"f32",None),
+              "Voltage Internal Supply":           (0x380,4,"f32",None),
+              "Voltage Int Temperature":           (0x384,4,"f32",None),
+              "Voltage Internal Gain":             (0x388,4,"f32",None),
+              "Voltage External Ref":              (0x38C,4,"f32",None),
+              "10uA Test Voltage":                 (0x3F0,4,"f32",None),
+              "175uA Test Voltage":                (0x3F4,4,"f32",None),
+              "10uA Test Current":                 (0x3F8,4,"f32",None),
+              "175uA Test Current":                (0x3FC,4,"f32",None),
+              "Ch1 Minimum":                       (0x404,2,"temp",None),
+              "Ch1 Maximum":                       (0x406,2,"temp",None),
+              "Ch1 Average":                       (0x408,2,"temp",None),
+              "Ch2 Minimum":                       (0x40A,2,"temp",None),
+              "Ch2 Maximum":                       (0x40C,2,"temp",None),
+              "Ch2 Average":                       (0x40E,2,"temp",None),
+              "Ch3 Minimum":                       (0x410,2,"temp",None),
+              "Ch3 Maximum":                       (0x412,2,"temp",None),
+              "Ch3 Average":                       (0x414,2,"temp",None),
+              "Ch4 Minimum":                       (0x416,2,"temp",None),
+              "Ch4 Maximum":                       (0x418,2,"temp",None),
+              "Ch4 Average":                       (0x41A,2,"temp",None),
+              "Ch1 I@ie1":                         (0x41C,4,"f32",None),
+              "Ch1 I@ie2":                         (0x420,4,"f32",None),
+              "Ch1 I@ie3":                         (0x424,4,"f32",None),
+              "Ch2 I@ie1":                         (0x428,4,"f32",None),
+              "Ch2 I@ie2":                         (0x42C,4,"f32",None),
+              "Ch2 I@ie3":                         (0x430,4,"f32",None),
+              "Ch3 I@ie1":                         (0x434,4,"f32",None),
+              "Ch3 I@ie2":                         (0x438,4,"f32",None),
+              "Ch3 I@ie3":                         (0x43C,4,"f32",None),
+              "Ch4 I@ie1":                         (0x440,4,"f32",None),
+              "Ch4 I@ie2":                         (0x444,4,"f32",None),
+              "Ch4 I@ie3":                         (0x448,4,"f32",None),
+              "Ch1 Logged Minimum":                (0x44C,2,"temp",None),
+              "Ch1 Logged Maximum":                (0x44E,2,"temp",None),
+              "Ch1 Logged Average":                (0x450,2,"temp",None),
+              "Ch2 Logged Minimum":                (0x452,2,"temp",None),
+              "Ch2 Logged Maximum":                (0x454,2,"temp",None),
+              "Ch2 Logged Average":                (0x456,2,"temp",None),
+              "Ch3 Logged Minimum":                (0x458,2,"temp",None),
+              "Ch3 Logged Maximum":                (0x45A,2,"temp",None),
+              "Ch3 Logged Average":                (0x45C,2,"temp",None),
+              "Ch4 Logged Minimum":                (0x45E,2,"temp",None),
+              "Ch4 Logged Maximum":                (0x460,2,"temp",None),
+              "Ch4 Logged Average":                (0x462,2,"temp",None),
+              "Ch1 Vbe1":                          (0x464,4,"f32",None),
+              "Ch1 Ib1":                           (0x468,4,"f32",None),
+              "Ch1 Vbe2":                          (0x46C,4,"f32",None),
+              "Ch1 Ib2":                           (0x470,4,"f32",None),
+              "Ch1 Vbe3":                          (0x474,4,"f32",None),
+              "Ch1 Ib3":                           (0x478,4,"f32",None),
+              "Ch1 Temperature":                   (0x47C,2,"temp",None),
+              "Ch2 Vbe1":                          (0x47E,4,"f32",None),
+              "Ch2 Ib1":                           (0x482,4,"f32",None),
+              "Ch2 Vbe2":                          (0x486,4,"f32",None),
+              "Ch2 Ib2":                           (0x48A,4,"f32",None),
+              "Ch2 Vbe3":                          (0x48E,4,"f32",None),
+              "Ch2 Ib3":                           (0x492,4,"f32",None),
+              "Ch2 Temperature":                   (0x496,2,"temp",None),
+              "Ch3 Vbe1":                          (0x498,4,"f32",None),
+              "Ch3 Ib1":                           (0x49C,4,"f32",None),
+              "Ch3 Vbe2":                          (0x4A0,4,"f32",None),
+              "Ch3 Ib2":                           (0x4A4,4,"f32",None),
+              "Ch3 Vbe3":                          (0x4A8,4,"f32",None),
+              "Ch3 Ib3":                           (0x4AC,4,"f32",None),
+              "Ch3 Temperature":                   (0x4B0,2,"temp",None),
+              "Ch4 Vbe1":                          (0x4B2,4,"f32",None),
+              "Ch4 Ib1":                           (0x4B6,4,"f32",None),
+              "Ch4 Vbe2":                          (0x4BA,4,"f32",None),
+              "Ch4 Ib2":                           (0x4BE,4,"f32",None),
+              "Ch4 Vbe3":                          (0x4C2,4,"f32",None),
+              "Ch4 Ib3":                           (0x4C6,4,"f32",None),
+              "Ch4 Temperature":                   (0x4CA,2,"temp",None)}
+
+# ----- fnSaveToFile rows, in file order
+#  "name"            raw bytes and value of name
+#  ("name",None)     raw bytes only
+#  ("name","other")  raw bytes of name, value of other
+EXPORT_ROWS = (("Control Word 1",None),
+               ("Control Word 2",None),
+               ("Control Word 3",None),
+               ("Control Word 4",None),
+               "Trigger Delay",
+               "Sampling Interval",
+               "Number of samples to acquire",
+               "Measurement Averaging",
+               "Temperature Averaging",
+               "Base Offset DAC Default",
+               "Single I Offset Sampling Interval",
+               "Single I Offset Number of samples",
+               "Temperature DAC Offset",
+               "Temperature DAC Slope",
+               "Too Hot Threshold",
+               "Catastrophic Threshold",
+               "System Temperature Delta Hi-Limit",
+               "Ch1 Ideality Factor",
+               "Ch2 Ideality Factor",
+               "Ch3 Ideality Factor",
+               "Ch4 Ideality Factor",
+               "Ch1 Early Voltage",
+               "Ch2 Early Voltage",
+               "Ch3 Early Voltage",
+               "Ch4 Early Voltage",
+               "Ch1 Single I Slope",
+               "Ch2 Single I Slope",
+               "Ch3 Single I Slope",
+               "Ch4 Single I Slope",
+               "Ch1 Temperature Offset",
+               "Ch2 Temperature Offset",
+               "Ch3 Temperature Offset",
+               "Ch4 Temperature Offset",
+               "Ch1 Force Current 1 (Ie1)",
+               "Ch1 Force Current 2 (Ie2)",
+               "Ch1 Force Current 3 (Ie3)",
+               "Ch2 Force Current 1 (Ie1)",
+               "Ch2 Force Current 2 (Ie2)",
+               "Ch2 Force Current 3 (Ie3)",
+               "Ch3 Force Current 1 (Ie1)",
+               "Ch3 Force Current 2 (Ie2)",
+               "Ch3 Force Current 3 (Ie3)",
+               "Ch4 Force Current 1 (Ie1)",
+               "Ch4 Force Current 2 (Ie2)",
+               "Ch4 Force Current 3 (Ie3)",
+               "Ch1 BJT Temp Lo-Limit",
+               "Ch1 BJT Temp Hi-Limit",
+               "Ch2 BJT Temp Lo-Limit",
+               "Ch2 BJT Temp Hi-Limit",
+               "Ch3 BJT Temp Lo-Limit",
+               "Ch3 BJT Temp Hi-Limit",
+               "Ch4 BJT Temp Lo-Limit",
+               "Ch4 BJT Temp Hi-Limit",
+               "Ch1 Force ie1 Lo-Limit",
+               "Ch1 Force ie1 Hi-Limit",
+               "Ch1 Force ie2 Lo-Limit",
+               "Ch1 Force ie2 Hi-Limit",
+               "Ch1 Force ie3 Lo-Limit",
+               "Ch1 Force ie3 Hi-Limit",
+               "Ch2 Force ie1 Lo-Limit",
+               "Ch2 Force ie1 Hi-Limit",
+               "Ch2 Force ie2 Lo-Limit",
+               "Ch2 Force ie2 Hi-Limit",
+               "Ch2 Force ie3 Lo-Limit",
+               "Ch2 Force ie3 Hi-Limit",
+               "Ch3 Force ie1 Lo-Limit",
+               "Ch3 Force ie1 Hi-Limit",
+               "Ch3 Force ie2 Lo-Limit",
+               "Ch3 Force ie2 Hi-Limit",
+               "Ch3 Force ie3 Lo-Limit",
+               "Ch3 Force ie3 Hi-Limit",
+               "Ch4 Force ie1 Lo-Limit",
+               "Ch4 Force ie1 Hi-Limit",
+               "Ch4 Force ie2 Lo-Limit",
+               "Ch4 Force ie2 Hi-Limit",
+               "Ch4 Force ie3 Lo-Limit",
+               "Ch4 Force ie3 Hi-Limit",
+               "Ch1 Current ib1 Lo-Limit",
+               "Ch1 Current ib1 Hi-Limit",
+               "Ch1 Current ib2 Lo-Limit",
+               "Ch1 Current ib2 Hi-Limit",
+               "Ch1 Current ib3 Lo-Limit",
+               "Ch1 Current ib3 Hi-Limit",
+               "Ch2 Current ib1 Lo-Limit",
+               "Ch2 Current ib1 Hi-Limit",
+               "Ch2 Current ib2 Lo-Limit",
+               "Ch2 Current ib2 Hi-Limit",
+               "Ch2 Current ib3 Lo-Limit",
+               "Ch2 Current ib3 Hi-Limit",
+               "Ch3 Current ib1 Lo-Limit",
+               "Ch3 Current ib1 Hi-Limit",
+               "Ch3 Current ib2 Lo-Limit",
+               "Ch3 Current ib2 Hi-Limit",
+               "Ch3 Current ib3 Lo-Limit",
+               "Ch3 Current ib3 Hi-Limit",
+               "Ch4 Current ib1 Lo-Limit",
+               "Ch4 Current ib1 Hi-Limit",
+               "Ch4 Current ib2 Lo-Limit",
+               "Ch4 Current ib2 Hi-Limit",
+               "Ch4 Current ib3 Lo-Limit",
+               "Ch4 Current ib3 Hi-Limit",
+               "Ch1 Leakage Hi-Limit",
+               "Ch2 Leakage Hi-Limit",
+               "Ch3 Leakage Hi-Limit",
+               "Ch4 Leakage Hi-Limit",
+               "Voltage A-D VREF",
+               "Voltage A-D FS Calibration",
+               "Current A-D VREF",
+               "Current A-D FS Calibration",
+               "Current DAC VREF",
+               "Current DAC Offset",
+               "Current DAC Scale",
+               ("CPU ADC VRef",None),
+               "Base DAC Offset",
+               "Base DAC Scale",
+               "Voltage A-D In 1 Offset",
+               "Voltage A-D In 2 Offset",
+               "Voltage A-D In 3 Offset",
+               "Voltage A-D In 4 Offset",
+               "Voltage A-D In 5 Offset",
+               "Voltage A-D In 6 Offset",
+               "Voltage A-D In 7 Offset",
+               "Voltage A-D In 8 Offset",
+               "Voltage A-D In 1 Scale",
+               "Voltage A-D In 2 Scale",
+               "Voltage A-D In 3 Scale",
+               "Voltage A-D In 4 Scale",
+               "Voltage A-D In 5 Scale",
+               "Voltage A-D In 6 Scale",
+               "Voltage A-D In 7 Scale",
+               "Voltage A-D In 8 Scale",
+               "Current A-D In 1 Offset",
+               "Current A-D In 2 Offset",
+               "Current A-D In 3 Offset",
+               "Current A-D In 4 Offset",
+               "Current A-D In 5 Offset",
+               "Current A-D In 6 Offset",
+               "Current A-D In 7 Offset",
+               "Current A-D In 8 Offset",
+               "Current A-D In 1 Scale",
+               "Current A-D In 2 Scale",
+               "Current A-D In 3 Scale",
+               "Current A-D In 4 Scale",
+               "Current A-D In 5 Scale",
+               "Current A-D In 6 Scale",
+               "Current A-D In 7 Scale",
+               "Current A-D In 8 Scale",
+               "+2.5v PS Voltage Lo-Limit",
+               "+2.5v PS Voltage Hi-Limit",
+               "-2.5v PS Voltage Lo-Limit",
+               "-2.5v PS Voltage Hi-Limit",
+               "+5v Analog PS Voltage Lo-Limit",
+               "+5v Analog PS Voltage Hi-Limit",
+               "+5v Digital PS Voltage Lo-Limit",
+               "+5v Digital PS Voltage Hi-Limit",
+               "Internal ADC VRef Lo-Limit",
+               "Internal ADC VRef Hi-Limit",
+               "10ua Test Resistance Lo Limit",
+               "10ua Test Resistance Hi Limit",
+               "175ua Test Resistance Lo Limit",
+               "175ua Test Resistance Hi Limit",
+               ("Voltage A-D In6 10ua Test","10uA Test Voltage"),
+               ("Voltage A-D In6 175ua Test","175uA Test Voltage"),
+               ("Current A-D In6 10ua Test","10uA Test Current"),
+               ("Current A-D In6 175ua Test","175uA Test Current"),
+               "Temperature DAC Calibration Offset",
+               "Raw DAC Leakage",
+               "Temperature DAC Calibration Slope",
+               ("Reserved1",None),
+               ("Reserved2",None),
+               ("Reserved3",None),
+               ("Reserved4",None),
+               ("Reserved5",None),
+               ("Reserved6",None),
+               ("Reserved7",None),
+               ("Reserved8",None),
+               "Month",
+               "Date",
+               "Year",
+               ("Voltage A-D In1 Ie1","Ch1 Vbe1"),
+               ("Voltage A-D In1 Ie2","Ch1 Vbe2"),
+               ("Voltage A-D In1 Ie3","Ch1 Vbe3"),
+               ("Voltage A-D In2 Ie1","Ch2 Vbe1"),
+               ("Voltage A-D In2 Ie2","Ch2 Vbe2"),
+               ("Voltage A-D In2 Ie3","Ch2 Vbe3"),
+               ("Voltage A-D In3 Ie1","Ch3 Vbe1"),
+               ("Voltage A-D In3 Ie2","Ch3 Vbe2"),
+               ("Voltage A-D In3 Ie3","Ch3 Vbe3"),
+               ("Voltage A-D In4 Ie1","Ch4 Vbe1"),
+               ("Voltage A-D In4 Ie2","Ch4 Vbe2"),
+               ("Voltage A-D In4 Ie3","Ch4 Vbe3"),
+               ("Voltage A-D In5 VbOs","VbOs"),
+               ("Voltage A-D In6 ie1","V@ie1"),
+               ("Voltage A-D In6 ie2","V@ie2"),
+               ("Voltage A-D In6 ie3","V@ie3"),
+               ("Voltage A-D In7 FullScale","Voltage FullScale"),
+               "Voltage A-D In8 Offset",
+               "Voltage A-D Internal Offset",
+               ("Voltage A-D Internal Supply","Voltage Internal Supply"),
+               ("Voltage A-D Int Temperature","Voltage Int Temperature"),
+               ("Voltage A-D Internal Gain","Voltage Internal Gain"),
+               ("Voltage A-D External Ref","Voltage External Ref"),
+               "Voltage A-D Factory",
+               ("Current A-D In1 Ib1","Ch1 Ib1"),
+               ("Current A-D In1 Ib2","Ch1 Ib2"),
+               ("Current A-D In1 Ib3","Ch1 Ib3"),
+               ("Current A-D In2 Ib1","Ch2 Ib1"),
+               ("Current A-D In2 Ib2","Ch2 Ib2"),
+               ("Current A-D In2 Ib3","Ch2 Ib3"),
+               ("Current A-D In3 Ib1","Ch3 Ib1"),
+               ("Current A-D In3 Ib2","Ch3 Ib2"),
+               ("Current A-D In3 Ib3","Ch3 Ib3"),
+               ("Current A-D In4 Ib1","Ch4 Ib1"),
+               ("Current A-D In4 Ib2","Ch4 Ib2"),
+               ("Current A-D In4 Ib3","Ch4 Ib3"),
+               ("Current A-D In6 Ch1 ie1","Ch1 I@ie1"),
+               ("Current A-D In6 Ch1 ie2","Ch1 I@ie2"),
+               ("Current A-D In6 Ch1 ie3","Ch1 I@ie3"),
+               ("Current A-D In6 Ch2 ie1","Ch2 I@ie1"),
+               ("Current A-D In6 Ch2 ie2","Ch2 I@ie2"),
+               ("Current A-D In6 Ch2 ie3","Ch2 I@ie3"),
+               ("Current A-D In6 Ch3 ie1","Ch3 I@ie1"),
+               ("Current A-D In6 Ch3 ie2","Ch3 I@ie2"),
+               ("Current A-D In6 Ch3 ie3","Ch3 I@ie3"),
+               ("Current A-D In6 Ch4 ie1","Ch4 I@ie1"),
+               ("Current A-D In6 Ch4 ie2","Ch4 I@ie2"),
+               ("Current A-D In6 Ch4 ie3","Ch4 I@ie3"),
+               ("Current A-D In7 FullScale","Current FullScale"),
+               "Current A-D In8 Offset",
+               "Current A-D Internal Offset",
+               "Current A-D Internal Supply",
+               "Current A-D Int Temperature",
+               ("Current A-D Internal Gain","Current Internal Gain"),
+               "Current A-D External Ref",
+               "Current A-D Factory",
+               ("uC A-D In1 +2.5V","uC A-D In1 +2.5V Result"),
+               ("uC A-D In2 -2.5V","uC A-D In2 -2.5V Result"),
+               ("uC A-D In3 +5V Analog","uC A-D In3 +5V Analog Result"),
+               ("uC A-D In4 +5V Digital","uC A-D In4 +5V Digital Result"),
+               "uC A-D Internal Vref",
+               "uC A-D Internal Offset",
+               "Ch1 Single I Offset",
+               "Ch2 Single I Offset",
+               "Ch3 Single I Offset",
+               "Ch4 Single I Offset",
+               "Ch1 Temperature",
+               "Ch1 Minimum",
+               "Ch1 Maximum",
+               "Ch1 Average",
+               "Ch1 Logged Minimum",
+               "Ch1 Logged Maximum",
+               "Ch1 Logged Average",
+               "Ch2 Temperature",
+               "Ch2 Minimum",
+               "Ch2 Maximum",
+               "Ch2 Average",
+               "Ch2 Logged Minimum",
+               "Ch2 Logged Maximum",
+               "Ch2 Logged Average",
+               "Ch3 Temperature",
+               "Ch3 Minimum",
+               "Ch3 Maximum",
+               "Ch3 Average",
+               "Ch3 Logged Minimum",
+               "Ch3 Logged Maximum",
+               "Ch3 Logged Average",
+               "Ch4 Temperature",
+               "Ch4 Minimum",
+               "Ch4 Maximum",
+               "Ch4 Average",
+               "Ch4 Logged Minimum",
+               "Ch4 Logged Maximum",
+               "Ch4 Logged Average",
+               "Serial Number")
+
+# ----- Display layouts: label, register name (None = blank)
+#  SHOW_*:           label 1, name 1, label 2, name 2
+#  SHOW_TEMPERATURES label, minimum, maximum, average
+#  DYNAMIC_ADC:      label, ADC count, derived float
+#  DYNAMIC_INTERNAL: label, uC A-D word, value
+SHOW_CONFIG = (("Ch1 Force Ie1   ","Ch1 Force Current 1 (Ie1)","Ch1 Force Ie2    ","Ch1 Force Current 2 (Ie2)"),
+               ("Ch1 Force Ie3   ","Ch1 Force Current 3 (Ie3)","Ch1 Temp Offset  ","Ch1 Temperature Offset"),
+               ("Ch2 Force Ie1   ","Ch2 Force Current 1 (Ie1)","Ch2 Force Ie2    ","Ch2 Force Current 2 (Ie2)"),
+               ("Ch2 Force Ie3   ","Ch2 Force Current 3 (Ie3)","Ch2 Temp Offset  ","Ch2 Temperature Offset"),
+               ("Ch3 Force Ie1   ","Ch3 Force Current 1 (Ie1)","Ch3 Force Ie2    ","Ch3 Force Current 2 (Ie2)"),
+               ("Ch3 Force Ie3   ","Ch3 Force Current 3 (Ie3)","Ch3 Temp Offset  ","Ch3 Temperature Offset"),
+               ("Ch4 Force Ie1   ","Ch4 Force Current 1 (Ie1)","Ch4 Force Ie2    ","Ch4 Force Current 2 (Ie2)"),
+               ("Ch4 Force Ie3   ","Ch4 Force Current 3 (Ie3)","Ch4 Temp Offset  ","Ch4 Temperature Offset"),
+               ("Ch1 Ideality    ","Ch1 Ideality Factor","Ch1 Early Voltage","Ch1 Early Voltage"),
+               ("Ch2 Ideality    ","Ch2 Ideality Factor","Ch2 Early Voltage","Ch2 Early Voltage"),
+               ("Ch3 Ideality    ","Ch3 Ideality Factor","Ch3 Early Voltage","Ch3 Early Voltage"),
+               ("Ch4 Ideality    ","Ch4 Ideality Factor","Ch4 Early Voltage","Ch4 Early Voltage"))
+SHOW_LIMITS = (("Ch1 BJT Lo Limit","Ch1 BJT Temp Lo-Limit","Ch1 BJT Hi Limit","Ch1 BJT Temp Hi-Limit"),
+               ("Ch2 BJT Lo Limit","Ch2 BJT Temp Lo-Limit","Ch2 BJT Hi Limit","Ch2 BJT Temp Hi-Limit"),
+               ("Ch3 BJT Lo Limit","Ch3 BJT Temp Lo-Limit","Ch3 BJT Hi Limit","Ch3 BJT Temp Hi-Limit"),
+               ("Ch4 BJT Lo Limit","Ch4 BJT Temp Lo-Limit","Ch4 BJT Hi Limit","Ch4 BJT Temp Hi-Limit"),
+               ("Ch1 Ie1 Lo Limit","Ch1 Force ie1 Lo-Limit","Ch1 Ie1 Hi Limit","Ch1 Force ie1 Hi-Limit"),
+               ("Ch1 Ie2 Lo Limit","Ch1 Force ie2 Lo-Limit","Ch1 Ie2 Hi Limit","Ch1 Force ie2 Hi-Limit"),
+               ("Ch1 Ie3 Lo Limit","Ch1 Force ie3 Lo-Limit","Ch1 Ie3 Hi Limit","Ch1 Force ie3 Hi-Limit"),
+               ("Ch2 Ie1 Lo Limit","Ch2 Force ie1 Lo-Limit","Ch2 Ie1 Hi Limit","Ch2 Force ie1 Hi-Limit"),
+               ("Ch2 Ie2 Lo Limit","Ch2 Force ie2 Lo-Limit","Ch2 Ie2 Hi Limit","Ch2 Force ie2 Hi-Limit"),
+               ("Ch2 Ie3 Lo Limit","Ch2 Force ie3 Lo-Limit","Ch2 Ie3 Hi Limit","Ch2 Force ie3 Hi-Limit"),
+               ("Ch3 Ie1 Lo Limit","Ch3 Force ie1 Lo-Limit","Ch3 Ie1 Hi Limit","Ch3 Force ie1 Hi-Limit"),
+               ("Ch3 Ie2 Lo Limit","Ch3 Force ie2 Lo-Limit","Ch3 Ie2 Hi Limit","Ch3 Force ie2 Hi-Limit"),
+               ("Ch3 Ie3 Lo Limit","Ch3 Force ie3 Lo-Limit","Ch3 Ie3 Hi Limit","Ch3 Force ie3 Hi-Limit"),
+               ("Ch4 Ie1 Lo Limit","Ch4 Force ie1 Lo-Limit","Ch4 Ie1 Hi Limit","Ch4 Force ie1 Hi-Limit"),
+               ("Ch4 Ie2 Lo Limit","Ch4 Force ie2 Lo-Limit","Ch4 Ie2 Hi Limit","Ch4 Force ie2 Hi-Limit"),
+               ("Ch4 Ie3 Lo Limit","Ch4 Force ie3 Lo-Limit","Ch4 Ie3 Hi Limit","Ch4 Force ie3 Hi-Limit"),
+               ("Ch1 Ib1 Lo Limit","Ch1 Current ib1 Lo-Limit","Ch1 Ib1 Hi Limit","Ch1 Current ib1 Hi-Limit"),
+               ("Ch1 Ib2 Lo Limit","Ch1 Current ib2 Lo-Limit","Ch1 Ib2 Hi Limit","Ch1 Current ib2 Hi-Limit"),
+               ("Ch1 Ib3 Lo Limit","Ch1 Current ib3 Lo-Limit","Ch1 Ib3 Hi Limit","Ch1 Current ib3 Hi-Limit"),
+               ("Ch2 Ib1 Lo Limit","Ch2 Current ib1 Lo-Limit","Ch2 Ib1 Hi Limit","Ch2 Current ib1 Hi-Limit"),
+               ("Ch2 Ib2 Lo Limit","Ch2 Current ib2 Lo-Limit","Ch2 Ib2 Hi Limit","Ch2 Current ib2 Hi-Limit"),
+               ("Ch2 Ib3 Lo Limit","Ch2 Current ib3 Lo-Limit","Ch2 Ib3 Hi Limit","Ch2 Current ib3 Hi-Limit"),
+               ("Ch3 Ib1 Lo Limit","Ch3 Current ib1 Lo-Limit","Ch3 Ib1 Hi Limit","Ch3 Current ib1 Hi-Limit"),
+               ("Ch3 Ib2 Lo Limit","Ch3 Current ib2 Lo-Limit","Ch3 Ib2 Hi Limit","Ch3 Current ib2 Hi-Limit"),
+               ("Ch3 Ib3 Lo Limit","Ch3 Current ib3 Lo-Limit","Ch3 Ib3 Hi Limit","Ch3 Current ib3 Hi-Limit"),
+               ("Ch4 Ib1 Lo Limit","Ch4 Current ib1 Lo-Limit","Ch4 Ib1 Hi Limit","Ch4 Current ib1 Hi-Limit"),
+               ("Ch4 Ib2 Lo Limit","Ch4 Current ib2 Lo-Limit","Ch4 Ib2 Hi Limit","Ch4 Current ib2 Hi-Limit"),
+               ("Ch4 Ib3 Lo Limit","Ch4 Current ib3 Lo-Limit","Ch4 Ib3 Hi Limit","Ch4 Current ib3 Hi-Limit"),
+               ("Ch1 Leak H Limit","Ch1 Leakage Hi-Limit","Ch2 Leak H Limit","Ch2 Leakage Hi-Limit"),
+               ("Ch3 Leak H Limit","Ch3 Leakage Hi-Limit","Ch4 Leak H Limit","Ch4 Leakage Hi-Limit"))
+SHOW_OFFSCALE = (("Voltage A-D in 1 Offset ","Voltage A-D In 1 Offset","Voltage A-D in 1 Scale","Voltage A-D In 1 Scale"),
+                 ("Voltage A-D in 2 Offset ","Voltage A-D In 2 Offset","Voltage A-D in 2 Scale","Voltage A-D In 2 Scale"),
+                 ("Voltage A-D in 3 Offset ","Voltage A-D In 3 Offset","Voltage A-D in 3 Scale","Voltage A-D In 3 Scale"),
+                 ("Voltage A-D in 4 Offset ","Voltage A-D In 4 Offset","Voltage A-D in 4 Scale","Voltage A-D In 4 Scale"),
+                 ("Voltage A-D in 5 Offset ","Voltage A-D In 5 Offset","Voltage A-D in 5 Scale","Voltage A-D In 5 Scale"),
+                 ("Voltage A-D in 6 Offset ","Voltage A-D In 6 Offset","Voltage A-D in 6 Scale","Voltage A-D In 6 Scale"),
+                 ("Voltage A-D in 7 Offset ","Voltage A-D In 7 Offset","Voltage A-D in 7 Scale","Voltage A-D In 7 Scale"),
+                 ("Voltage A-D in 8 Offset ","Voltage A-D In 8 Offset","Voltage A-D in 8 Scale","Voltage A-D In 8 Scale"),
+                 ("Current A-D in 1 Offset ","Current A-D In 1 Offset","Current A-D in 1 Scale","Current A-D In 1 Scale"),
+                 ("Current A-D in 2 Offset ","Current A-D In 2 Offset","Current A-D in 2 Scale","Current A-D In 2 Scale"),
+                 ("Current A-D in 3 Offset ","Current A-D In 3 Offset","Current A-D in 3 Scale","Current A-D In 3 Scale"),
+                 ("Current A-D in 4 Offset ","Current A-D In 4 Offset","Current A-D in 4 Scale","Current A-D In 4 Scale"),
+                 ("Current A-D in 5 Offset ","Current A-D In 5 Offset","Current A-D in 5 Scale","Current A-D In 5 Scale"),
+                 ("Current A-D in 6 Offset ","Current A-D In 6 Offset","Current A-D in 6 Scale","Current A-D In 6 Scale"),
+                 ("Current A-D in 7 Offset ","Current A-D In 7 Offset","Current A-D in 7 Scale","Current A-D In 7 Scale"),
+                 ("Current A-D in 8 Offset ","Current A-D In 8 Offset","Current A-D in 8 Scale","Current A-D In 8 Scale"),
+                 ("Current DAC Offset      ","Current DAC Offset","Current DAC Scale     ","Current DAC Scale"),
+                 ("Base DAC Offset         ","Base DAC Offset","Base DAC Scale        ","Base DAC Scale"),
+                 ("Temperature DAC Offset  ","Temperature DAC Calibration Offset","Temperature DAC Scale ","Temperature DAC Calibration Slope"),
+                 ("uC ADC internal Vref    ","CPU ADC VRef",None,None))
+SHOW_VREF = (("Voltage A-D Vref        ","Voltage A-D VREF","Voltage A-D FS Calib     ","Voltage A-D FS Calibration"),
+             ("Current A-D Vref        ","Current A-D VREF","Current A-D FS Calib     ","Current A-D FS Calibration"))
+SHOW_TEMPERATURES = (("Ch1 Cur  Min  Max  Avg","Ch1 Minimum","Ch1 Maximum","Ch1 Average"),
+                     ("Ch2 Cur  Min  Max  Avg","Ch2 Minimum","Ch2 Maximum","Ch2 Average"),
+                     ("Ch3 Cur  Min  Max  Avg","Ch3 Minimum","Ch3 Maximum","Ch3 Average"),
+                     ("Ch4 Cur  Min  Max  Avg","Ch4 Minimum","Ch4 Maximum","Ch4 Average"),
+                     ("Ch1 Log  Min  Max  Avg","Ch1 Logged Minimum","Ch1 Logged Maximum","Ch1 Logged Average"),
+                     ("Ch2 Log  Min  Max  Avg","Ch2 Logged Minimum","Ch2 Logged Maximum","Ch2 Logged Average"),
+                     ("Ch3 Log  Min  Max  Avg","Ch3 Logged Minimum","Ch3 Logged Maximum","Ch3 Logged Average"),
+                     ("Ch4 Log  Min  Max  Avg","Ch4 Logged Minimum","Ch4 Logged Maximum","Ch4 Logged Average"))
+DYNAMIC_ADC = (("Voltage A-D in1 (Ch1 Vbe1) ","Voltage A-D In1 Ie1","Ch1 Vbe1"),
+               ("Voltage A-D in1 (Ch1 Vbe2) ","Voltage A-D In1 Ie2","Ch1 Vbe2"),
+               ("Voltage A-D in1 (Ch1 Vbe3) ","Voltage A-D In1 Ie3","Ch1 Vbe3"),
+               ("Voltage A-D in2 (Ch2 Vbe1) ","Voltage A-D In2 Ie1","Ch2 Vbe1"),
+               ("Voltage A-D in2 (Ch2 Vbe2) ","Voltage A-D In2 Ie2","Ch2 Vbe2"),
+               ("Voltage A-D in2 (Ch2 Vbe3) ","Voltage A-D In2 Ie3","Ch2 Vbe3"),
+               ("Voltage A-D in3 (Ch3 Vbe1) ","Voltage A-D In3 Ie1","Ch3 Vbe1"),
+               ("Voltage A-D in3 (Ch3 Vbe2) ","Voltage A-D In3 Ie2","Ch3 Vbe2"),
+               ("Voltage A-D in3 (Ch3 Vbe3) ","Voltage A-D In3 Ie3","Ch3 Vbe3"),
+               ("Voltage A-D in4 (Ch4 Vbe1) ","Voltage A-D In4 Ie1","Ch4 Vbe1"),
+               ("Voltage A-D in4 (Ch4 Vbe2) ","Voltage A-D In4 Ie2","Ch4 Vbe2"),
+               ("Voltage A-D in4 (Ch4 Vbe3) ","Voltage A-D In4 Ie3","Ch4 Vbe3"),
+               ("Voltage A-D in5 (VbOs)     ","Voltage A-D In5 VbOs","VbOs"),
+               ("Voltage A-D in6 (V@ie1)    ","Voltage A-D In6 ie1","V@ie1"),
+               ("Voltage A-D in6 (V@ie2)    ","Voltage A-D In6 ie2","V@ie2"),
+               ("Voltage A-D in6 (V@ie3)    ","Voltage A-D In6 ie3","V@ie3"),
+               ("Voltage A-D in7 (FullScale)","Voltage A-D In7 FullScale","Voltage FullScale"),
+               ("Voltage A-D in8 (V-Offset) ","Voltage A-D In8 Offset",None),
+               ("Voltage A-D (Int Offset)   ","Voltage A-D Internal Offset",None),
+               ("Voltage A-D (Int Supply)   ","Voltage A-D Internal Supply","Voltage Internal Supply"),
+               ("Voltage A-D (Temperature)  ","Voltage A-D Int Temperature","Voltage Int Temperature"),
+               ("Voltage A-D (Internal Gain)","Voltage A-D Internal Gain","Voltage Internal Gain"),
+               ("Voltage A-D (External Ref) ","Voltage A-D External Ref","Voltage External Ref"),
+               ("Voltage A-D (Factory Calib)","Voltage A-D Factory",None),
+               ("Current A-D in1 (Ch1 Ib1)  ","Current A-D In1 Ib1","Ch1 Ib1"),
+               ("Current A-D in1 (Ch1 Ib2)  ","Current A-D In1 Ib2","Ch1 Ib2"),
+               ("Current A-D in1 (Ch1 Ib3)  ","Current A-D In1 Ib3","Ch1 Ib3"),
+               ("Current A-D in2 (Ch2 Ib1)  ","Current A-D In2 Ib1","Ch2 Ib1"),
+               ("Current A-D in2 (Ch2 Ib2)  ","Current A-D In2 Ib2","Ch2 Ib2"),
+               ("Current A-D in2 (Ch2 Ib3)  ","Current A-D In2 Ib3","Ch2 Ib3"),
+               ("Current A-D in3 (Ch3 Ib1)  ","Current A-D In3 Ib1","Ch3 Ib1"),
+               ("Current A-D in3 (Ch3 Ib2)  ","Current A-D In3 Ib2","Ch3 Ib2"),
+               ("Current A-D in3 (Ch3 Ib3)  ","Current A-D In3 Ib3","Ch3 Ib3"),
+               ("Current A-D in4 (Ch4 Ib1)  ","Current A-D In4 Ib1","Ch4 Ib1"),
+               ("Current A-D in4 (Ch4 Ib2)  ","Current A-D In4 Ib2","Ch4 Ib2"),
+               ("Current A-D in4 (Ch4 Ib3)  ","Current A-D In4 Ib3","Ch4 Ib3"),
+               ("Current A-D in6 (Ch1@Ie1)  ","Current A-D In6 Ch1 ie1","Ch1 I@ie1"),
+               ("Current A-D in6 (Ch1@Ie2)  ","Current A-D In6 Ch1 ie2","Ch1 I@ie2"),
+               ("Current A-D in6 (Ch1@Ie3)  ","Current A-D In6 Ch1 ie3","Ch1 I@ie3"),
+               ("Current A-D in6 (Ch2@Ie1)  ","Current A-D In6 Ch2 ie1","Ch2 I@ie1"),
+               ("Current A-D in6 (Ch2@Ie2)  ","Current A-D In6 Ch2 ie2","Ch2 I@ie2"),
+               ("Current A-D in6 (Ch2@Ie3)  ","Current A-D In6 Ch2 ie3","Ch2 I@ie3"),
+               ("Current A-D in6 (Ch3@Ie1)  ","Current A-D In6 Ch3 ie1","Ch3 I@ie1"),
+               ("Current A-D in6 (Ch3@Ie2)  ","Current A-D In6 Ch3 ie2","Ch3 I@ie2"),
+               ("Current A-D in6 (Ch3@Ie3)  ","Current A-D In6 Ch3 ie3","Ch3 I@ie3"),
+               ("Current A-D in6 (Ch4@Ie1)  ","Current A-D In6 Ch4 ie1","Ch4 I@ie1"),
+               ("Current A-D in6 (Ch4@Ie2)  ","Current A-D In6 Ch4 ie2","Ch4 I@ie2"),
+               ("Current A-D in6 (Ch4@Ie3)  ","Current A-D In6 Ch4 ie3","Ch4 I@ie3"),
+               ("Current A-D in7 (FullScale)","Current A-D In7 FullScale","Current FullScale"),
+               ("Current A-D in8 (I-Offset) ","Current A-D In8 Offset",None),
+               ("Current A-D (Int Offset)   ","Current A-D Internal Offset",None),
+               ("Current A-D (Int Supply)   ","Current A-D Internal Supply",None),
+               ("Current A-D (Temperature)  ","Current A-D Int Temperature",None),
+               ("Current A-D (Internal Gain)","Current A-D Internal Gain","Current Internal Gain"),
+               ("Current A-D (External Ref) ","Current A-D External Ref",None),
+               ("Current A-D (Factory Calib)","Current A-D Factory",None),
+               ("Raw DAC Leakage            ","Raw DAC Leakage",None),
+               ("Voltage A-D in6 (10uA test)","Voltage A-D In6 10ua Test","10uA Test Voltage"),
+               ("Voltage A-D in6 (175uA tst)","Voltage A-D In6 175ua Test","175uA Test Voltage"),
+               ("Current A-D in6 (10uA test)","Current A-D In6 10ua Test","10uA Test Current"),
+               ("Current A-D in6 (175uA tst)","Current A-D In6 175ua Test","175uA Test Current"),
+               ("Ch 1 Single I Offset       ",None,"Ch1 Single I Offset"),
+               ("Ch 2 Single I Offset       ",None,"Ch2 Single I Offset"),
+               ("Ch 3 Single I Offset       ",None,"Ch3 Single I Offset"),
+               ("Ch 4 Single I Offset       ",None,"Ch4 Single I Offset"))
+DYNAMIC_INTERNAL = (("          uC A-D in1 +2P5A ","uC A-D In1 +2.5V","uC A-D In1 +2.5V Result"),
+                    ("          uC A-D in2 -2P5A ","uC A-D In2 -2.5V","uC A-D In2 -2.5V Result"),
+                    ("          uC A-D in3 +5A   ","uC A-D In3 +5V Analog","uC A-D In3 +5V Analog Result"),
+                    ("          uC A-D in4 +5D   ","uC A-D In4 +5V Digital","uC A-D In4 +5V Digital Result"),
+                    ("          uC A-D Int Vref  ","uC A-D Internal Vref","uC A-D Internal Vref"),
+                    ("          uC A-D Int offset","uC A-D Internal Offset",None))
+
+# ----- Reply frame lengths (rep code + data + checksum)
+#  R_MEM length depends on the request, R_LOG on its quan/size header
+REPLY_LEN  = {R_COND:3,R_ERR:6,R_FWVER:4,R_SER:6,
+              R_STAT1:4,R_STAT2:6,R_STAT3:8,R_STAT4:10}
+
+# ----- Reply condition names (see ShowError)
+COND_NAME  = {C_PASS:"PASS",C_INVC:"INVALID COMMAND",C_INAC:"INACTIVE COMMAND",
+              C_BADCS:"BAD CHECKSUM",C_BUSY:"BUSY",C_ERR:"ERROR",C_RANGE:"RANGE",
+              C_NODATA:"END OF DATA",C_OVERF:"Rx BUFFER FULL",C_BOOT:"NO BOOT LOADER"}
+
+# ----- Extended error bits (R_ERR bytes 1-2, byte 4) and condition (byte 3)
+EXT_ERROR1 = {0:"External SRAM test fail",
+              1:"Thermal variation detected",
+              2:"Final temperature out of range",
+              3:"Error from ADC during conversion",
+              4:"Current measurement outside of limits",
+              5:"Internal ADC voltage error detected",
+              6:"SRAM not loaded from EEPROM",
+              7:"Power on CPU reset detected",
+              8:"External CPU reset detected",
+              9:"CPU reset from Brown-out detected",
+             10:"CPU reset from WDT detected",
+             11:"CPU reset from JTAG detected",
+             12:"-2.5V power supply failure",
+             13:"+2.5V power supply failure",
+             14:"+5VA power supply failure",
+             15:"+5VD power supply failure"}
+EXT_ERROR2 = {0:"System busy",
+              1:"Factory calibration required",
+              2:"Boot loader not detected",
+              3:"Too hot condition detected",
+              4:"Catastrophic hot condition detected",
+              5:"Unknown1",
+              6:"Unknown2",
+              7:"Unknown3"}
+EXT_COND   = {C_PASS:"PASS",
+              C_INVC:"Invalid command",
+              C_INAC:"Inactive command",
+              C_BADCS:"Bad checksum",
+              C_BUSY:"Busy",
+              C_ERR:"Hardware error",
+              C_RANGE:"Out of range value",
+              C_NODATA:"No more data",
+              C_OVERF:"Buffer full",
+              C_BOOT:"No Boot code"}
+
+
+# ---------- Decoded replies ----------
+#  fnDecodeReply/fnDecodeMemory build these straight from the received
+#  bytes. The string each one stands for (what fnRdReply/fnRdMemory have
+#  always returned) is only built when str() is called, then kept.
+class TDAUReply():
+    __slots__ = ("Code","_sString")
+
+    def __str__(self):
+        if self._sString == None:
+            self._sString = self.fnFormat()
+        return self._sString
+
+    def __repr__(self):
+        return "<{} {}>".format(type(self).__name__,str(self))
+
+    def fnLegacy(self):
+        """Value returned by fnRdReply when bTypedReplies is False"""
+        return str(self)
+
+    def fnShow(self):
+        """Print reply as fnRdReply(PrintMode=True) does"""
+        print("TDAU reply: {}".format(str(self)))
+
+
+class ReplyRaw(TDAUReply):
+    """Short, corrupt or unexpected reply: Error = None, "INSUFFICIENT REPLY" or "BAD CHECKSUM" """
+    __slots__ = ("Data","Error")
+
+    def __init__(self,RxChars,sError=None):
+        self.Code = RxChars[0] if len(RxChars) > 0 else None
+        self.Data = bytes(RxChars)
+        self.Error = sError
+        self._sString = None
+
+    def fnFormat(self):
+        return "".join(["{:02x} ".format(b) for b in self.Data])
+
+    def fnLegacy(self):
+        if (self.Error == "BAD CHECKSUM") and (self.Code in (R_STAT1,R_STAT2,R_STAT3,R_STAT4)):
+            return False                         # fnRdTemperature has always returned False
+        return str(self)
+
+
+class ReplyCond(TDAUReply):
+    """R_COND: Cond = condition code (C_PASS etc)"""
+    __slots__ = ("Cond",)
+
+    def __init__(self,iCond):
+        self.Code = R_COND
+        self.Cond = iCond
+        self._sString = None
+
+    def fnFormat(self):
+        return COND_NAME.get(self.Cond,"UNKNOWN")
+
+
+class ReplyTemps(TDAUReply):
+    """R_STATn: Temps = [(temperature, status), ...] in channel order"""
+    __slots__ = ("Temps",)
+
+    def __init__(self,iCode,LTemps):
+        self.Code = iCode
+        self.Temps = LTemps
+        self._sString = None
+
+    def fnFormat(self):
+        return ",".join(["{},{:x}".format(fTemperature,iStatus) for fTemperature,iStatus in self.Temps])
+
+    def fnShow(self):
+        print("Temperatures: {}".format(str(self)))
+
+
+class ReplyVersion(TDAUReply):
+    """R_FWVER: Major, Minor"""
+    __slots__ = ("Major","Minor")
+
+    def __init__(self,iMajor,iMinor):
+        self.Code = R_FWVER
+        self.Major = iMajor
+        self.Minor = iMinor
+        self._sString = None
+
+    def fnFormat(self):
+        return "{}.{}".format(self.Major,self.Minor)
+
+    def fnShow(self):
+        print("FW Version: {}".format(str(self)))
+
+
+class ReplySerial(TDAUReply):
+    """R_SER: Serial = 32 bit serial number"""
+    __slots__ = ("Serial",)
+
+    def __init__(self,iSerial):
+        self.Code = R_SER
+        self.Serial = iSerial
+        self._sString = None
+
+    def __int__(self):
+        return self.Serial
+
+    def fnFormat(self):
+        return str(self.Serial)
+
+    def fnLegacy(self):
+        return self.Serial
+
+    def fnShow(self):
+        print("Serial Number: {}".format(self.Serial))
+
+
+class ReplyExtError(TDAUReply):
+    """R_ERR: Error1 = 16 bit flags, Cond = last condition, Error2 = 8 bit flags"""
+    __slots__ = ("Error1","Cond","Error2")
+
+    def __init__(self,iError1,iCond,iError2):
+        self.Code = R_ERR
+        self.Error1 = iError1
+        self.Cond = iCond
+        self.Error2 = iError2
+        self._sString = None
+
+    def fnFormat(self):
+        return "{:02x} {:02x} {:02x} {:02x} ".format(self.Error1 >> 8,self.Error1 & 0xFF,self.Cond,self.Error2)
+
+    def fnMessages(self):
+        """List of text for each flag set, then the condition"""
+        LMessages = [EXT_ERROR1[x] for x in range(16) if (self.Error1 >> x) & 0x01]
+        LMessages += [EXT_ERROR2[x] for x in range(8) if (self.Error2 >> x) & 0x01]
+        if self.Cond in EXT_COND:
+            LMessages.append(EXT_COND[self.Cond])
+        return LMessages
+
+    def fnShow(self):
+        print("Extended Error: {}".format(str(self)))
+        for sMessage in self.fnMessages():
+            print(sMessage)
+
+
+class ReplyLog(TDAUReply):
+    """R_LOG: Quan records of Size bytes in Data"""
+    __slots__ = ("Quan","Size","Data")
+
+    def __init__(self,iQuan,iSize,Data):
+        self.Code = R_LOG
+        self.Quan = iQuan
+        self.Size = iSize
+        self.Data = Data
+        self._sString = None
+
+    def fnFormat(self):
+        return " ".join(["{:02X}".format(b) for b in self.Data])
+
+    def fnRecords(self):
+        """List of bytes, one per record"""
+        return [self.Data[x:x+self.Size] for x in range(0,self.Quan * self.Size,self.Size)]
+
+    def fnShow(self):
+        print(str(self))
+
+
+class ReplyMemory(TDAUReply):
+    """R_MEM: Data read from Address of Region (see MEM_MAP)"""
+    __slots__ = ("Address","Region","Data")
+
+    def __init__(self,iAddress,sRegion,Data):
+        self.Code = R_MEM
+        self.Address = iAddress
+        self.Region = sRegion
+        self.Data = Data
+        self._sString = None
+
+    def fnFormat(self):
+        return " ".join(["{:02X}".format(b) for b in self.Data])
+
+    def fnShow(self):
+        print("{} {}".format(self.Region,str(self)))
+
+
+# ---------- Register map decoder ----------
+#  Compiled once from a list of REG_MAP names. Fields are sorted by
+#  address and packed into a struct format with pad bytes between them,
+#  so a memory image decodes with one unpack_from per layer. Names that
+#  share bytes (e.g. System Temperature Delta) go in separate layers.
+class RegDecoder():
+    __slots__ = ("Names","Spans","Layers")
+
+    def __init__(self,LNames):
+        self.Names = []                          # Register names, in given order
+        for sName in LNames:
+            if (sName != None) and (sName not in self.Names):
+                if sName not in REG_MAP:
+                    raise KeyError("Unknown TDAU register {}".format(sName))
+                self.Names.append(sName)
+        self.Spans = [REG_MAP[sName][0:2] for sName in self.Names]
+        LLayers = []                             # [end address, [names]] per layer
+        for sName in sorted(self.Names,key=lambda sName: REG_MAP[sName][0]):
+            iAddress,iWidth = REG_MAP[sName][0:2]
+            Layer = None
+            for LLayer in LLayers:
+                if LLayer[0] <= iAddress:
+                    Layer = LLayer
+                    break
+            if Layer == None:
+                Layer = [0,[]]
+                LLayers.append(Layer)
+            Layer[0] = iAddress + iWidth
+            Layer[1].append(sName)
+        self.Layers = []                         # (base address, struct, [(name, convert, scale)])
+        for iEnd,LLayer in LLayers:
+            iBase = REG_MAP[LLayer[0]][0]
+            iNext = iBase
+            sFormat = "<"
+            LConvert = []
+            for sName in LLayer:
+                iAddress,iWidth,sType,Scale = REG_MAP[sName]
+                if iAddress > iNext:
+                    sFormat += "{:d}x".format(iAddress - iNext)
+                sFormat += REG_TYPE[sType][0]
+                iNext = iAddress + iWidth
+                LConvert.append((sName,REG_TYPE[sType][1],Scale))
+            self.Layers.append((iBase,struct.Struct(sFormat),LConvert))
+
+    def fnDecode(self,Image):
+        """
+        Decode every register from a copy of user RAM
+        Parameters: bytes/bytearray: user RAM from address 0
+        Returns:    dict: name: value
+        """
+        dValue = {}
+        for iBase,Format,LConvert in self.Layers:
+            for (sName,fnConvert,Scale),Value in zip(LConvert,Format.unpack_from(Image,iBase)):
+                if fnConvert != None:
+                    Value = fnConvert(Value)
+                if Scale != None:
+                    Value = Value / Scale
+                dValue[sName] = Value
+        return dValue
+
+
+# ----- Precompiled decoders for the display and export functions
+REG_CONFIG       = RegDecoder(["Control Word 1","Control Word 2","Control Word 3","Control Word 4",
+                               "Trigger Delay","Sampling Interval","Number of samples to acquire",
+                               "Measurement Averaging","Temperature Averaging","Base Offset DAC Default",
+                               "Single I Offset Sampling Interval","Single I Offset Number of samples",
+                               "Temperature DAC Offset","Temperature DAC Slope",
+                               "Too Hot Threshold","Catastrophic Threshold",
+                               "Ch1 Single I Slope","Ch2 Single I Slope","Ch3 Single I Slope","Ch4 Single I Slope",
+                               "Month","Date","Year"] +
+                              [sReg for Row in SHOW_CONFIG + SHOW_LIMITS for sReg in (Row[1],Row[3])])
+REG_PROTECTED    = RegDecoder([sReg for Row in SHOW_OFFSCALE + SHOW_VREF for sReg in (Row[1],Row[3])] +
+                              ["System Temperature Delta",
+                               "+2.5v PS Voltage Lo-Limit","+2.5v PS Voltage Hi-Limit",
+                               "-2.5v PS Voltage Lo-Limit","-2.5v PS Voltage Hi-Limit",
+                               "+5v Analog PS Voltage Lo-Limit","+5v Analog PS Voltage Hi-Limit",
+                               "+5v Digital PS Voltage Lo-Limit","+5v Digital PS Voltage Hi-Limit",
+                               "Internal ADC VRef Lo-Limit","Internal ADC VRef Hi-Limit",
+                               "10ua Test Resistance Lo Limit","10ua Test Resistance Hi Limit",
+                               "175ua Test Resistance Lo Limit","175ua Test Resistance Hi Limit",
+                               "Month","Date","Year"])
+REG_DYNAMIC      = RegDecoder([sReg for Row in DYNAMIC_ADC + DYNAMIC_INTERNAL for sReg in Row[1:]])
+REG_TEMPERATURES = RegDecoder([sReg for Row in SHOW_TEMPERATURES for sReg in Row[1:]])
+REG_EXPORT       = RegDecoder([sReg for Row in EXPORT_ROWS for sReg in ((Row,) if type(Row) == str else Row)])
+
 
 class TDAU():
     def __init__(self):
@@ -145,8 +1295,24 @@ class TDAU():
         self.TxBuffer = [None] * 39              # Tx Buffer
         self.TxCount = 0                         # Number of bytes to transmit
         self.SerialTimeout = 5                   # Seconds to wait before serial timeout
+        self.ReplyTimeout = 1.0                  # Seconds to wait for a complete reply frame
+        self.dReplyTimeout = {CMD_CAL:5.0,       # Per-command reply deadlines (seconds)
+                              CMD_EXTC:5.0,
+                              CMD_FACC:5.0,
+                              CMD_RTD:5.0,
+                              CMD_SCO:5.0,
+                              CMD_SAVEM:2.0}
         self.bExceptionEnableConnect = False     # Exception error if fail to connect?
         self.bExceptionEnableComError = False    # Enable exception error for general communication error?
+        self.Shadow = None                       # Host copy of user RAM (see fnShadow)
+        self.ShadowValid = None                  # 1 per byte of Shadow read from/written to TDAU
+        self.ShadowDirty = None                  # 1 per byte of Shadow written but not saved
+        self.StreamErrors = 0                    # Undecodable replies during fnStream
+        self.StreamException = None              # Exception that stopped fnStream's worker
+        self.bTypedReplies = False               # fnRdReply/fnRdMemory return TDAUReply objects
+        self.Stats = None                        # Per-command counters (see fnStatsReset)
+        self.StatsOpen = None                    # (command, counters, sleep end) of command awaiting reply
+        self.LogPending = None                   # ReplyLog block fnDrainLog read but did not store
         return
 
 # ---------- Simulate ASK Command with Raw String to TDAU ----------
@@ -181,6 +1347,7 @@ class TDAU():
                           False if unsuccessful
         """
         sCOMPort = "COM{}".format(COMPort)
+        self.fnShadowClear()                     # Host copy may be of another unit
         self.bCommEnabled = True                 # Must be set to run fnCheckCommunication
         print("Connecting to Thermal Diode Acq Unit... ",end="")
         try:
@@ -205,6 +1372,27 @@ class TDAU():
             return False
         return True
 
+# ---------- Use an already open port ----------
+    def fnAttach(self,hPort):
+        """
+        Use an already open port instead of opening a COM port
+        Parameters: object: pyserial Serial, serial_for_url() port
+                     OR TDAU_sim.TDAUSim
+        Returns:    bool: True if successful
+                          False if unable to communicate
+        """
+        self.hTDAU = hPort
+        self.fnShadowClear()                     # Host copy may be of another unit
+        self.bCommEnabled = True                 # Must be set to run fnCheckCommunication
+        if self.fnCheckCommunication():
+            return True
+        print("Unable to communicate with TDAU")
+        if self.bExceptionEnableConnect:
+            raise Exception("Unable to communicate with TDAU")
+        self.hTDAU = None
+        self.bCommEnabled = False
+        return False
+
 # ---------- Return dictionary ----------
     def fnDict(self,bPrint=False):
         """
@@ -232,6 +1420,7 @@ class TDAU():
             return False
         self.hTDAU.close()
         #print("TDAU Communication Port Closed")
+        self.fnShadowClear()
         self.bCommEnabled = False
         return True
 
@@ -355,6 +1544,9 @@ class TDAU():
             sReceivedData += str(self.fnHex2Asc((RxChar >> 4) & 0x0F))
             sReceivedData += str(self.fnHex2Asc(RxChar & 0x0F))
             sReceivedData += " "
+        if (self.Stats != None) and (self.StatsOpen != None):
+            self.StatsOpen[1]["Received"] += len(sReceivedData) // 3
+            self.StatsOpen = None                    # Raw replies are not framed
         return sReceivedData
 
 # ---------- Return Module Version Information ----------
@@ -408,6 +1600,7 @@ class TDAU():
         """
         bDebug = False
         if self.bCommEnabled:                        # Port open
+            self.fnShadowInvalidate()                # Can't tell what a raw string changes
             self.fnWrSerialPort(sString)             # Send command to controller
             if bDebug:
                 print(sString)
@@ -433,8 +1626,9 @@ class TDAU():
         self.TxBuffer[0] = CMD_CAL                   # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        self.fnShadowInvalidate(*SHADOW_CAL[CMD_CAL])
+        return sReply
 
 # ---------- RTD Calibration ----------
     def fnCalRTD(self,PrintMode=False):
@@ -452,8 +1646,108 @@ class TDAU():
         self.TxBuffer[0] = CMD_RTD                   # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        self.fnShadowInvalidate(*SHADOW_CAL[CMD_RTD])
+        return sReply
+
+# ---------- Compare configuration snapshot with unit ----------
+    def fnDiffSnapshot(self,Snapshot,PrintMode=False):
+        """
+        Compare configuration snapshot with unit
+        Parameters: dict: from fnSnapshot
+                     OR string: snapshot file name
+                    bool: display messages (optional)
+        Returns:    list: (address, snapshot bytes, unit bytes) per changed span
+                     OR bool: False if not connected/unreadable
+        Example: [(0x54, b'\x00\x00\xc0?', b'\x00\x00\x80?')]
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        dSnap = self.fnSnapshotLoad(Snapshot)
+        if dSnap == None:
+            return False
+        iBase = dSnap["Address"]
+        Data = dSnap["Data"]
+        Live = self.fnRdRange(iBase,len(Data))
+        if type(Live) != bytes:
+            return False
+        LDiff = []
+        for iAddress,iQuan in self.fnChangedSpans(Data,Live):
+            LDiff.append((iBase + iAddress,bytes(Data[iAddress:(iAddress+iQuan)]),Live[iAddress:(iAddress+iQuan)]))
+        if PrintMode:
+            for iAddress,Old,New in LDiff:
+                print("x{:04X} snapshot {} unit {}".format(iAddress,Old.hex().upper(),New.hex().upper()))
+            print("{} changed spans".format(len(LDiff)))
+        return LDiff
+
+# ---------- Read every log record into a binary store ----------
+    def fnDrainLog(self,Store=None,bFlush=False,PrintMode=False):
+        """
+        Read every log record into a binary store
+        Parameters: bytearray: records are appended (optional)
+                     OR file opened "wb"/"ab": records are written
+                     None = new bytearray DEFAULT
+                    bool: fnFlush once every record is read (optional)
+                    bool: display messages (optional)
+        Returns:    tuple: (records read, record size, Store)
+                     OR bool: False if not connected
+        Note:       Sends CMD_BLOCK until C_NODATA. A block with a bad
+                    checksum is re-requested with CMD_RSEND (3 tries).
+                    Records are stored back to back, record size bytes
+                    each, e.g. numpy.frombuffer(Store,"u1").reshape(-1,size)
+                    The log is only flushed when the drain completed.
+                    A block whose record size differs from the blocks
+                    before it ends the drain unflushed. The TDAU has
+                    already sent it, so it is held in LogPending and
+                    stored first by the next fnDrainLog (give it a
+                    separate Store, the records have the new size).
+        Example: (120, 8, bytearray(b'...'))
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if Store == None:
+            Store = bytearray()
+        iRecords = 0
+        iSize = 0
+        bComplete = False
+        while True:
+            if self.LogPending != None:              # Held back by the previous drain
+                Reply = self.LogPending
+                self.LogPending = None
+            else:
+                self.TxBuffer[0] = CMD_BLOCK         # Command to send
+                self.TxCount = 1
+                self.fnWrBuffer(0)
+                Reply = self.fnDecodeReply(self.fnRdFrame())
+            for x in range(3):
+                if (type(Reply) != ReplyRaw) or (Reply.Error == None):
+                    break
+                print("Log block {}: {}, resending".format(Reply.Error,str(Reply)))
+                self.TxBuffer[0] = CMD_RSEND
+                self.TxCount = 1
+                self.fnWrBuffer(0)
+                Reply = self.fnDecodeReply(self.fnRdFrame())
+            if (type(Reply) == ReplyCond) and (Reply.Cond == C_NODATA):
+                bComplete = True
+                break
+            if type(Reply) != ReplyLog:
+                print("Log drain stopped, TDAU reply: {}".format(str(Reply)))
+                break
+            if (iSize != 0) and (Reply.Size != iSize):
+                print("Log record size changed from {} to {}, block held for next drain".format(iSize,Reply.Size))
+                self.LogPending = Reply              # Already taken off the unit, keep it
+                break
+            iSize = Reply.Size
+            if type(Store) == bytearray:
+                Store.extend(Reply.Data)
+            else:
+                Store.write(Reply.Data)
+            iRecords += Reply.Quan
+        if PrintMode:
+            print("Log: {} records of {} bytes".format(iRecords,iSize))
+        if bFlush and bComplete:
+            self.fnFlush(PrintMode)
+        return (iRecords,iSize,Store)
 
 # ---------- Extended Calibration ----------
     def fnExtendedCalibration(self,PrintMode=False):
@@ -471,8 +1765,9 @@ class TDAU():
         self.TxBuffer[0] = CMD_EXTC                  # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        self.fnShadowInvalidate(*SHADOW_CAL[CMD_EXTC])
+        return sReply
 
 # ---------- Factory Calibration ----------
     def fnFactoryCalibration(self,Mode,Value,PrintMode=False):
@@ -530,8 +1825,9 @@ class TDAU():
             self.TxBuffer[5] = (iValue >> 24) & 0xFF
         self.TxCount = 6
         self.fnWrBuffer()
-        time.sleep(0.25)
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        self.fnShadowInvalidate(*SHADOW_CAL[CMD_FACC])
+        return sReply
 
 # ---------- Flush Log ----------
     def fnFlush(self,PrintMode=False):
@@ -549,7 +1845,6 @@ class TDAU():
         self.TxBuffer[0] = CMD_FLLOG                 # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
 # ---------- Lock ----------
@@ -568,9 +1863,60 @@ class TDAU():
         self.TxBuffer[0] = CMD_LOCK                  # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
+# ---------- Read all dynamic readings ----------
+    def fnRdDynamic(self,PrintMode=False):
+        """
+        Read all dynamic readings (ADC words, derived floats, uC A-D)
+        Parameters: bool:  (optional)
+                        True = display messages
+                        False = don't display messages DEFAULT
+        Returns:    dict: "Time": time.time() before the reads
+                          "ADC": list of (name, address, 4 bytes, float)
+                          "Internal": list of (name, address, int, float)
+                           (bytes/float None where the reading has none)
+                     OR bool: False if not connected or upon error
+        Note:       Only the registers in DYNAMIC_ADC and DYNAMIC_INTERNAL
+                    are read, back to back (REG_DYNAMIC), instead of one
+                    request per value, so all values are from the same moment
+        Example: fnRdDynamic()["ADC"][0]
+                 ('Voltage A-D in1 (Ch1 Vbe1) ', 576, b'\xf2\xff\x000', 0.6523)
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        fTime = time.time()
+        Image = self.fnRdImage(REG_DYNAMIC.Spans)
+        if Image == None:
+            return False
+        dValue = REG_DYNAMIC.fnDecode(Image)
+        LADC = []
+        for sName,sADC,sFloat in DYNAMIC_ADC:
+            iADC = 0
+            Raw = None
+            fFloat = None
+            if sADC != None:
+                iADC = REG_MAP[sADC][0]
+                Raw = bytes(Image[iADC:(iADC+4)])
+            if sFloat != None:
+                fFloat = dValue[sFloat]
+            LADC.append((sName,iADC,Raw,fFloat))
+        LInternal = []
+        for sName,sWord,sValue in DYNAMIC_INTERNAL:
+            iADC = REG_MAP[sWord][0]
+            iWord = Image[iADC] + (Image[iADC+1] << 8)
+            fValue = None
+            if sValue != None:
+                fValue = dValue[sValue]
+            LInternal.append((sName,iADC,iWord,fValue))
+        if PrintMode:
+            for sName,iADC,Raw,fFloat in LADC:
+                print("{}: {}    {}".format(sName,"" if Raw == None else Raw.hex(),
+                                            "" if fFloat == None else self.fnEng(fFloat)))
+            for sName,iADC,iWord,fValue in LInternal:
+                print("{}: {:04X}    {}".format(sName,iWord,"" if fValue == None else fValue))
+        return {"Time":fTime,"ADC":LADC,"Internal":LInternal}
+
 # ---------- Read Extended Error ----------
     def fnRdExtendedError(self,PrintMode=False):
         """
@@ -587,7 +1933,6 @@ class TDAU():
         self.TxBuffer[0] = CMD_RDERR                 # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
 # ---------- Read Float from memory ----------
@@ -605,31 +1950,29 @@ class TDAU():
         """
         if not self.bCommEnabled:                    # Port not open
             return False
-        self.TxBuffer[0] = CMD_RDMEM                 # Command to send
-        self.TxBuffer[1] = (iAddress & 0xFF)         # Address
-        self.TxBuffer[2] = ((iAddress >> 8) & 0xFF)
-        self.TxBuffer[3] = 4                         # Quantity of bytes to read
-        self.TxCount = 4                             # Number of chars to send
+        Cached = self.fnShadowGet(iAddress,4)
+        if Cached != None:
+            fValue = struct.unpack("<f",Cached)[0]
+            if PrintMode:
+                print(self.fnEng(fValue))
+            return fValue
+        CountRx = self.fnBuildRdMemory(iAddress,4)   # R_MEM + 4 bytes + CS
         self.fnWrBuffer()
-        sReceivedData = ""                           # Clear receive buffer
-        RxChars = [0] * 18
-        Count = 0                                    # Number of characters received
-        time.sleep(0.25)                             # Wait for reply
-        for i in range(0,18,1):                      # Expect 18 characters MAX
-            if self.hTDAU.inWaiting() == 0:
-                break                                # No characters waiting
-            Rx = self.hTDAU.read()                   # Get character
-            try:
-                RxChar = ord(Rx.decode())
-            except:
-                RxChar = ord(Rx)
-            RxChars[Count] = RxChar
-            Count += 1                               # Count it
-            sReceivedData += str(self.fnHex2Asc((RxChar >> 4) & 0x0F))
-            sReceivedData += str(self.fnHex2Asc(RxChar & 0x0F))
-            sReceivedData += " "
+        return self.fnParseFloat(self.fnRdFrame(CountRx),iAddress,PrintMode)
+
+# ---------- Decode Float reply ----------
+    def fnParseFloat(self,RxChars,iAddress,PrintMode=False):
+        """
+        INTERNAL USE ONLY: Decode reply to fnRdFloat request
+        Parameters: list: int for each byte received
+                    16 bit int: memory address requested
+                    bool: display messages (optional)
+        Returns:    float: value
+                     OR string of error
+        """
+        Count = len(RxChars)                         # Number of characters received
         if Count < 3:
-            print("Insufficient reply from TDAU {}".format(sReceivedData))
+            print("Insufficient reply from TDAU {}".format(self.fnFrame2Asc(RxChars)))
             return "INSUFFICIENT REPLY"
         if RxChars[0] == R_COND:                     # Error response
             return self.ShowError(RxChars[1],PrintMode)
@@ -637,27 +1980,15 @@ class TDAU():
             print("Incorrect reply from TDAU")
             return "INCORRECT REPLY"
         if Count < 6:                                # Number of chars received
-            print("Insufficient reply from TDAU {}".format(sReceivedData))
+            print("Insufficient reply from TDAU {}".format(self.fnFrame2Asc(RxChars)))
             return "INSUFFICIENT REPLY"
-        CalcCs = 0                                   # Calculate checksum
-        for x in range(0,5,1):
-            CalcCs += RxChars[x]
-        if (CalcCs & 0xFF) != RxChars[5]:
-            print("Checksum error: {}".format(sReceivedData))
+        if (sum(RxChars[0:5]) & 0xFF) != RxChars[5]:
+            print("Checksum error: {}".format(self.fnFrame2Asc(RxChars)))
             return "BAD CHECKSUM"
-        sData = [None] * 4
-        for x in range(0,4,1):
-            char1 = self.fnHex2Asc(((RxChars[(x+1)] >> 4) & 0x0F),True)
-            char2 = self.fnHex2Asc((RxChars[(x+1)] & 0x0F),True)
-            sData[x] = str(char1) + str(char2)
-        sValue = "{}{}{}{}".format(sData[3],sData[2],sData[1],sData[0])
-        iValue = bytes.fromhex(sValue)
-        fValue = struct.unpack(">f",iValue)[0]
-        #print(sValue)
+        self.fnShadowPut(iAddress,RxChars[1:5])
+        fValue = struct.unpack("<f",bytes(RxChars[1:5]))[0]
         if PrintMode:
-            #print(self.cnvfloat(sValue))
             print(self.fnEng(fValue))
-        #return self.cnvfloat(sValue)
         return fValue
 
 # ---------- Convert string of hex chars to float ----------
@@ -684,7 +2015,6 @@ class TDAU():
         self.TxBuffer[0] = CMD_VREQ                  # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
 # ---------- Read Block of data from log ----------
@@ -703,7 +2033,6 @@ class TDAU():
         self.TxBuffer[0] = CMD_BLOCK                 # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
 # ---------- Read Memory ----------
@@ -721,69 +2050,187 @@ class TDAU():
                         True = display messages
                         False = don't display messages DEFAULT
         Returns:    string: string from TDAU
+                     OR ReplyMemory: decoded reply when bTypedReplies is True
                      OR bool: False if not connected
         Example: F2 FF 00 30 00 00 00 00 00 00 0F 00 01 00 01 00
         """
         if not self.bCommEnabled:                    # Port not open
             return False
-        self.TxBuffer[1] = (iAddress & 0xFF)         # Address
-        self.TxBuffer[2] = ((iAddress >> 8) & 0xFF)
-        self.TxBuffer[3] = 16                        # Quantity of bytes to read (type 4 only)
-        dMemMap = {0:(CMD_RDR0,17,3,"SRAM pg0:"),
-                   1:(CMD_RDR1,17,3,"SRAM pg1"),
-                   2:(CMD_RDF0,17,3,"FLASH p0:"),
-                   3:(CMD_RDF1,17,3,"FLASH p1:"),
-                   4:(CMD_RDMEM,18,4,"USER RAM:")}
-        TxCmd,CountRx,self.TxCount,sRegion = dMemMap[iType]
-        self.TxBuffer[0] = TxCmd                     # Command to send
+        TxCmd,CountRx,TxCount,sRegion = MEM_MAP[iType]
+        if iType == 4:
+            Cached = self.fnShadowGet(iAddress,16)
+            if Cached != None:
+                Reply = ReplyMemory(iAddress,sRegion,bytes(Cached))
+                if PrintMode:
+                    Reply.fnShow()
+                if self.bTypedReplies:
+                    return Reply
+                return str(Reply)
+        CountRx = self.fnBuildRdMemory(iAddress,16,iType)
         self.fnWrBuffer()
-        sReceivedData = ""                           # Clear receive buffer
-        RxChars = [0] * 18
-        Count = 0                                    # Number of characters received
-        time.sleep(0.25)                             # Wait for reply
-        for i in range(0,18,1):                      # Expect 18 characters MAX
-            if self.hTDAU.inWaiting() == 0:
-                break                                # No characters waiting
-            Rx = self.hTDAU.read()                   # Get character
-            try:
-                RxChar = ord(Rx.decode())
-            except:
-                RxChar = ord(Rx)
-            RxChars[Count] = RxChar
-            Count += 1                               # Count it
-            sReceivedData += str(self.fnHex2Asc((RxChar >> 4) & 0x0F))
-            sReceivedData += str(self.fnHex2Asc(RxChar & 0x0F))
-            sReceivedData += " "
+        return self.fnParseMemory(self.fnRdFrame(CountRx),iAddress,iType,PrintMode)
+
+# ---------- Decode Memory reply ----------
+    def fnParseMemory(self,RxChars,iAddress,iType=4,PrintMode=False):
+        """
+        INTERNAL USE ONLY: Decode reply to fnRdMemory request
+        Parameters: list: int for each byte received
+                    16 bit int: memory address requested
+                    int: memory type/map (see fnRdMemory)
+                    bool: display messages (optional)
+        Returns:    ReplyMemory: when bTypedReplies is True
+                     OR string: 16 hex bytes
+                     OR string of error/raw reply
+        """
+        Reply = self.fnDecodeMemory(RxChars,iAddress,iType)
+        if type(Reply) == ReplyRaw:
+            if Reply.Error == "INSUFFICIENT REPLY":
+                print("Insufficient reply from TDAU {}".format(str(Reply)))
+            elif Reply.Error == "BAD CHECKSUM":
+                print("Checksum error: {}".format(str(Reply)))
+            else:
+                print("TDAU reply: {}".format(str(Reply)))# Unexpected response
+        elif PrintMode:
+            Reply.fnShow()
+        if self.bTypedReplies:
+            return Reply
+        return str(Reply)
+
+# ---------- Decode Memory reply bytes to typed result ----------
+    def fnDecodeMemory(self,RxChars,iAddress,iType=4):
+        """
+        INTERNAL USE ONLY: Decode reply bytes to fnRdMemory request
+        Parameters: list: int for each byte received
+                    16 bit int: memory address requested
+                    int: memory type/map (see fnRdMemory)
+        Returns:    ReplyMemory: 16 bytes read
+                     OR ReplyCond: TDAU refused the request
+                     OR ReplyRaw: short, corrupt or unexpected reply
+        """
+        TxCmd,CountRx,TxCount,sRegion = MEM_MAP[iType]
+        Count = len(RxChars)                         # Number of characters received
         if Count < 3:
-            print("Insufficient reply from TDAU {}".format(sReceivedData))
-            return sReceivedData
+            return ReplyRaw(RxChars,"INSUFFICIENT REPLY")
         if RxChars[0] == R_COND:                     # Error response
-            return self.ShowError(RxChars[1],PrintMode)
+            return ReplyCond(RxChars[1])
         if Count < CountRx:
-            print("Insufficient reply from TDAU {}".format(sReceivedData))
-            return sReceivedData
+            return ReplyRaw(RxChars,"INSUFFICIENT REPLY")
         if iType == 4:                               # Reading memory map
-            CalcCs = 0                               # Calculate checksum
-            for x in range(0,17,1):
-                CalcCs += RxChars[x]
-            if (CalcCs & 0xFF) != RxChars[17]:
-                print("Checksum error: {}".format(sReceivedData))
-                return sReceivedData
+            if (sum(RxChars[0:17]) & 0xFF) != RxChars[17]:
+                return ReplyRaw(RxChars,"BAD CHECKSUM")
+            self.fnShadowPut(iAddress,RxChars[1:17])
         if RxChars[0] == R_MEM:
-            sString = ""
-            for x in range(0,15,1):# """*********************************************************************************"""
-            #for x in range(0,1,1):
-                char1 = self.fnHex2Asc(((RxChars[(x+1)] >> 4) & 0x0F),True)
-                char2 = self.fnHex2Asc((RxChars[(x+1)] & 0x0F),True)
-                sString += str(char1) + str(char2) + " "
-            char1 = self.fnHex2Asc(((RxChars[16] >> 4) & 0x0F),True)
-            char2 = self.fnHex2Asc((RxChars[16] & 0x0F),True)
-            sString += str(char1) + str(char2)
-            if PrintMode:
-                print("{} {}".format(sRegion,sString))
-            return sString
-        print("TDAU reply: {}".format(sReceivedData))# Unexpected response
-        return sReceivedData
+            return ReplyMemory(iAddress,sRegion,bytes(RxChars[1:17]))
+        return ReplyRaw(RxChars)
+
+# ---------- Read span of memory as bytes ----------
+    def fnRdRange(self,iAddress,iLength,iType=4,PrintMode=False):
+        """
+        Read span of memory as bytes
+        Parameters: 16 bit int: first memory address
+                    int: number of bytes to read
+                    int: memory type/map (see fnRdMemory) default = 4
+                    bool:  (optional)
+                        True = display messages
+                        False = don't display messages DEFAULT
+        Returns:    bytes: memory contents
+                     OR bool: False if not connected or upon error
+        Note:       Issues back-to-back 16 byte reads with no delays
+        Example: fnRdRange(0x54,48) returns the 12 force current floats
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if (iType not in MEM_MAP) or (iLength < 1):
+            return False
+        sRegion = MEM_MAP[iType][3]
+        Data = bytearray()
+        iNext = iAddress
+        while len(Data) < iLength:
+            iQuan = min(16,iLength - len(Data))
+            if iType == 4:
+                Cached = self.fnShadowGet(iNext,iQuan)
+                if Cached != None:
+                    Data.extend(Cached)
+                    iNext += iQuan
+                    continue
+            CountRx = self.fnBuildRdMemory(iNext,iQuan,iType)
+            self.fnWrBuffer(0)
+            Block = self.fnParseBlock(self.fnRdFrame(CountRx),iNext,iQuan,iType)
+            if type(Block) != bytes:
+                return False
+            Data.extend(Block)
+            iNext += iQuan
+        if PrintMode:
+            for x in range(0,iLength,16):
+                print("{} x{:04X}: {}".format(sRegion,iAddress+x,
+                      " ".join(["{:02X}".format(b) for b in Data[x:(x+16)]])))
+        return bytes(Data)
+
+# ---------- Decode one block of a range read ----------
+    def fnParseBlock(self,RxChars,iAddress,iQuan,iType=4):
+        """
+        INTERNAL USE ONLY: Decode reply to one block of fnRdRange
+        Parameters: list: int for each byte received
+                    16 bit int: memory address requested
+                    int: quantity of bytes requested
+                    int: memory type/map (see fnRdMemory)
+        Returns:    bytes: memory contents
+                     OR bool: False upon error
+        """
+        CountRx = iQuan + 2                          # R_MEM + data + CS
+        if iType != 4:
+            CountRx = MEM_MAP[iType][1]              # R_MEM + 16 bytes, no CS
+        Count = len(RxChars)
+        sError = None
+        if Count < 3:
+            sError = "Insufficient reply from TDAU {}".format(self.fnFrame2Asc(RxChars))
+        elif RxChars[0] == R_COND:
+            sError = "TDAU reply: {}".format(self.ShowError(RxChars[1]))
+        elif (RxChars[0] != R_MEM) or (Count < CountRx):
+            sError = "Incorrect reply from TDAU {}".format(self.fnFrame2Asc(RxChars))
+        elif (iType == 4) and ((sum(RxChars[0:(Count-1)]) & 0xFF) != RxChars[(Count-1)]):
+            sError = "Checksum error: {}".format(self.fnFrame2Asc(RxChars))
+        if sError != None:
+            print("{} at x{:04X}".format(sError,iAddress))
+            if self.bExceptionEnableComError:
+                raise Exception("TDAU ERROR")
+            return False
+        if iType == 4:
+            self.fnShadowPut(iAddress,RxChars[1:(iQuan+1)])
+        return bytes(RxChars[1:(iQuan+1)])
+
+# ---------- Read named registers ----------
+    def fnRdRegisters(self,Registers,PrintMode=False):
+        """
+        Read named registers (see REG_MAP)
+        Parameters: list: register names
+                     OR RegDecoder: precompiled decoder (e.g. REG_CONFIG)
+                    bool:  (optional)
+                        True = display messages
+                        False = don't display messages DEFAULT
+        Returns:    dict: name: value (scaled, see REG_MAP)
+                     OR bool: False if not connected or upon error
+        Note:       Only the registers' bytes are read, with as few
+                    fnRdRange calls as possible (see fnPlanWindows)
+        Example: fnRdRegisters(["Ch1 Ideality Factor","Too Hot Threshold"])
+                 {'Ch1 Ideality Factor': 1.0081, 'Too Hot Threshold': 110.0}
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        Decoder = Registers
+        if type(Decoder) != RegDecoder:
+            Decoder = RegDecoder(Registers)
+        Image = self.fnRdImage(Decoder.Spans)
+        if Image == None:
+            return False
+        dValue = Decoder.fnDecode(Image)
+        if PrintMode:
+            for sName in Decoder.Names:
+                if type(dValue[sName]) == float:
+                    print("{}: {}".format(sName,self.fnEng(dValue[sName])))
+                else:
+                    print("{}: {}".format(sName,dValue[sName]))
+        return dValue
 
 # ---------- Read Reply from TDAU ----------
     def fnRdReply(self,PrintMode=False):
@@ -793,212 +2240,80 @@ class TDAU():
                         True = display messages
                         False = don't display messages DEFAULT
         Returns:    string: string from TDAU
+                     OR TDAUReply: decoded reply when bTypedReplies is True
                      OR bool: False if not connected
         """
         if not self.bCommEnabled:                    # Port not open
             return False
-        dDebug = False
-        sReceivedData = ""                           # Clear receive buffer
-        RxChars = [0] * 255                          # Maximum number of bytes to Rx
-        Count = 0                                    # Number of characters received
-        time.sleep(0.25)                             # Wait for reply
-        for i in range(0,255,1):                     # Expect 255 characters MAX
-            if self.hTDAU.inWaiting() == 0:
-                break                                # No characters waiting
-            Rx = self.hTDAU.read()                   # Get character
-            try:
-                RxChar = ord(Rx.decode())
-            except:
-                RxChar = ord(Rx)
-            RxChars[Count] = RxChar
-            Count += 1                               # Count it
-            sReceivedData += str(self.fnHex2Asc((RxChar >> 4) & 0x0F))
-            sReceivedData += str(self.fnHex2Asc(RxChar & 0x0F))
-            sReceivedData += " "
-        if dDebug:
-            for x in range(Count):
-                print(hex(RxChars[x]),end="")
-            print
+        return self.fnParseReply(self.fnRdFrame(),PrintMode)
+
+# ---------- Decode Reply from TDAU ----------
+    def fnParseReply(self,RxChars,PrintMode=False):
+        """
+        INTERNAL USE ONLY: Decode Reply from TDAU
+        Parameters: list: int for each byte received
+                    bool: display messages (optional)
+        Returns:    TDAUReply: when bTypedReplies is True
+                     OR string: decoded reply (see fnRdReply callers)
+                     OR bool: False upon status checksum error
+        """
+        Reply = self.fnDecodeReply(RxChars)
+        if type(Reply) == ReplyRaw:
+            if Reply.Error == "INSUFFICIENT REPLY":
+                print("Insufficient reply from TDAU {}".format(str(Reply)))
+            elif Reply.Error == "BAD CHECKSUM":
+                print("Checksum error: {}".format(str(Reply)))
+            elif PrintMode:
+                print("TDAU reply: {}".format(str(Reply)))
+        elif PrintMode:
+            Reply.fnShow()
+        if self.bTypedReplies:
+            return Reply
+        return Reply.fnLegacy()
+
+# ---------- Decode reply bytes to typed result ----------
+    def fnDecodeReply(self,RxChars):
+        """
+        INTERNAL USE ONLY: Decode reply bytes to typed result
+        Parameters: list: int for each byte received
+        Returns:    TDAUReply: ReplyCond, ReplyTemps, ReplyVersion, ReplySerial,
+                               ReplyExtError, ReplyLog
+                     OR ReplyRaw: short, corrupt or unrecognized reply
+        """
+        Count = len(RxChars)                         # Number of characters received
         if Count < 3:                                # All transmissions are 3 bytes min
-            print("Insufficient reply from TDAU {}".format(sReceivedData))
-            return sReceivedData
-# Condition response
-        if RxChars[0] == R_COND:
-            return self.ShowError(RxChars[1],PrintMode)
-# Status/Temperature response
-        if ((RxChars[0] == R_STAT1)
-         or (RxChars[0] == R_STAT2)
-         or (RxChars[0] == R_STAT3)
-         or (RxChars[0] == R_STAT4)):
-            CalcCS = 0
-            for i in range(0,(Count-1),1):
-                CalcCS += RxChars[i]
-            if (CalcCS & 0xFF) != RxChars[(Count-1)]:
-                print("Checksum error: {}".format(sReceivedData))
-                return False                             # Checksum error
-            sString = ""
-            LoopCount = (Count-2) // 2
-            for i in range(0,(LoopCount),1):
-                sTemperature = ("0x" + str(self.fnHex2Asc((RxChars[((i*2)+2)] >> 4) & 0x0F))
-                                     + str(self.fnHex2Asc(RxChars[((i*2)+2)] & 0x0F)))
-                iTemp = eval(sTemperature)
-                iDecimal = eval(str(self.fnHex2Asc(RxChars[((i*2)+1)] & 0x0F)))
-                if iDecimal > 9:
-                    iDecimal = 9
-                fTemperature = float(iTemp) * 10
-                fTemperature = (fTemperature + iDecimal) / 10
-                if (RxChars[((i*2)+1)] & 0x10) != 0:
-                    fTemperature = 0 - fTemperature      # Negative number
-                if len(sString) != 0:                    # If appending another channel
-                    sString += ","
-                sString += str(fTemperature) + "," + str(self.fnHex2Asc((RxChars[((i*2)+1)] >> 4) & 0x0E))
-            if PrintMode:
-                print("Temperatures: {}".format(sString))
-            return sString
-# Extended Error response
-        if RxChars[0] == R_ERR:
-            if Count < 6:
-                print("Insufficient reply from TDAU {}".format(sReceivedData))
-                return sReceivedData
-            if ((RxChars[0] + RxChars[1] + RxChars[2] + RxChars[3] + RxChars[4]) & 0xFF) != RxChars[5]:
-                print("Checksum error: {}".format(sReceivedData))
-                return sReceivedData
-            sString = (str(self.fnHex2Asc((RxChars[1] >> 4) & 0x0F))
-                     + str(self.fnHex2Asc(RxChars[1] & 0x0F)) + " "
-                     + str(self.fnHex2Asc((RxChars[2] >> 4) & 0x0F))
-                     + str(self.fnHex2Asc(RxChars[2] & 0x0F)) + " "
-                     + str(self.fnHex2Asc((RxChars[3] >> 4) & 0x0F))
-                     + str(self.fnHex2Asc(RxChars[3] & 0x0F)) + " "
-                     + str(self.fnHex2Asc((RxChars[4] >> 4) & 0x0F))
-                     + str(self.fnHex2Asc(RxChars[4] & 0x0F)) + " ")
-            if PrintMode:
-                print("Extended Error: {}".format(sString))
-                dError1 = {0:"External SRAM test fail",
-                           1:"Thermal variation detected",
-                           2:"Final temperature out of range",
-                           3:"Error from ADC during conversion",
-                           4:"Current measurement outside of limits",
-                           5:"Internal ADC voltage error detected",
-                           6:"SRAM not loaded from EEPROM",
-                           7:"Power on CPU reset detected",
-                           8:"External CPU reset detected",
-                           9:"CPU reset from Brown-out detected",
-                          10:"CPU reset from WDT detected",
-                          11:"CPU reset from JTAG detected",
-                          12:"-2.5V power supply failure",
-                          13:"+2.5V power supply failure",
-                          14:"+5VA power supply failure",
-                          15:"+5VD power supply failure"}
-                dError2 = {0:"System busy",
-                           1:"Factory calibration required",
-                           2:"Boot loader not detected",
-                           3:"Too hot condition detected",
-                           4:"Catastrophic hot condition detected",
-                           5:"Unknown1",
-                           6:"Unknown2",
-                           7:"Unknown3"}
-                dError3 = {0x41:"PASS",
-                           0x42:"Invalid command",
-                           0x43:"Inactive command",
-                           0x44:"Bad checksum",
-                           0x45:"Busy",
-                           0x46:"Hardware error",
-                           0x47:"Out of range value",
-                           0x48:"No more data",
-                           0x49:"Buffer full",
-                           0x4A:"No Boot code"}
-                iError1 = (RxChars[1]  << 8) | RxChars[2]
-                if iError1 != 0:
-                    for x in range(16):
-                        if (iError1 & 0x01) != 0:
-                            print(dError1[x])
-                        iError1 = iError1 >> 1
-                iError2 = RxChars[4]
-                if iError2 != 0:
-                    for x in range(8):
-                        if (iError2 & 0x01) != 0:
-                            print(dError2[x])
-                        iError2 = iError2 >> 1
-                iError3 = RxChars[3]
-                if iError3 in dError3.keys():
-                    print(dError3[iError3])
-            return sString
-# FirmWare Version response
-        if RxChars[0] == R_FWVER:
-            if Count < 4:
-                print("Insufficient reply from TDAU {}".format(sReceivedData))
-                return sReceivedData
-            if ((RxChars[0] + RxChars[1] + RxChars[2]) & 0xFF) != RxChars[3]:
-                print("Checksum error: {}".format(sReceivedData))
-                return sReceivedData
-            sChar1 = "0x" + (str(self.fnHex2Asc((RxChars[1] >> 4) & 0x0F))
-                           + str(self.fnHex2Asc(RxChars[1] & 0x0F)))
-            sChar2 = "0x" + (str(self.fnHex2Asc((RxChars[2] >> 4) & 0x0F))
-                           + str(self.fnHex2Asc(RxChars[2] & 0x0F)))
-            sString = (str(eval(sChar1)) + "."
-                     + str(eval(sChar2)))
-            if PrintMode:
-                print("FW Version: {}".format(sString))
-            return sString                           # Return major.minor
-# Serial Number response
-        if RxChars[0] == R_SER:
-            if Count < 6:
-                print("Insufficient reply from TDAU {}".format(sReceivedData))
-                return sReceivedData
-            if ((RxChars[0] + RxChars[1] + RxChars[2] + RxChars[3] + RxChars[4]) & 0xFF) != RxChars[5]:
-                print("Checksum error: {}".format(sReceivedData))
-                return sReceivedData
-            sSerialNo = eval("0x"
-                        + str(self.fnHex2Asc((RxChars[4] >> 4) & 0x0F))
-                        + str(self.fnHex2Asc(RxChars[4] & 0x0F))
-                        + str(self.fnHex2Asc((RxChars[3] >> 4) & 0x0F))
-                        + str(self.fnHex2Asc(RxChars[3] & 0x0F))
-                        + str(self.fnHex2Asc((RxChars[2] >> 4) & 0x0F))
-                        + str(self.fnHex2Asc(RxChars[2] & 0x0F))
-                        + str(self.fnHex2Asc((RxChars[1] >> 4) & 0x0F))
-                        + str(self.fnHex2Asc(RxChars[1] & 0x0F)))
-            if PrintMode:
-                print("Serial Number: {}".format(sSerialNo))
-            return sSerialNo
-# RdLog response
-        if RxChars[0] == R_LOG:
-            if Count < 4:
-                print("Insufficient reply from TDAU {}".format(sReceivedData))
-                return sReceivedData
-            #print(sReceivedData)                        # Debug
-            iReplySize = RxChars[1] * RxChars[2]         # Quan * record size
-            iTotalSize = iReplySize + 3                  # Plus REP Quan Size
-            CalcCs = 0                                   # Calculate checksum
-            for x in range(0,iTotalSize,1):
-                CalcCs += RxChars[x]
-            if (CalcCs & 0xFF) != RxChars[iTotalSize]:
-                print("Checksum error: {}".format(sReceivedData))
-                return sReceivedData
-            sString = ""
-            for x in range(3,iTotalSize,1):
-                char1 = self.fnHex2Asc(((RxChars[x] >> 4) & 0x0F),True)
-                char2 = self.fnHex2Asc((RxChars[x] & 0x0F),True)
-                sString += str(char1) + str(char2) + " "
-            char1 = self.fnHex2Asc(((RxChars[x] >> 4) & 0x0F),True)
-            char2 = self.fnHex2Asc((RxChars[x] & 0x0F),True)
-            sString += str(char1) + str(char2)
-            if PrintMode:
-                print(sString)
-            return sString
-# All other conditions
-        if PrintMode:
-            print("TDAU reply: {}".format(sReceivedData))
-        return sReceivedData
+            return ReplyRaw(RxChars,"INSUFFICIENT REPLY")
+        iCode = RxChars[0]
+        if iCode == R_COND:                          # Condition response
+            return ReplyCond(RxChars[1])
+        if iCode in (R_STAT1,R_STAT2,R_STAT3,R_STAT4):
+            LTemps = self.fnDecodeTemperatures(RxChars)
+            if LTemps == None:
+                return ReplyRaw(RxChars,"BAD CHECKSUM")
+            return ReplyTemps(iCode,LTemps)
+        if iCode in (R_ERR,R_FWVER,R_SER):
+            iLength = REPLY_LEN[iCode]
+            if Count < iLength:
+                return ReplyRaw(RxChars,"INSUFFICIENT REPLY")
+            if (sum(RxChars[0:(iLength-1)]) & 0xFF) != RxChars[(iLength-1)]:
+                return ReplyRaw(RxChars,"BAD CHECKSUM")
+            if iCode == R_ERR:
+                return ReplyExtError((RxChars[1] << 8) | RxChars[2],RxChars[3],RxChars[4])
+            if iCode == R_FWVER:
+                return ReplyVersion(RxChars[1],RxChars[2])
+            return ReplySerial(int.from_bytes(bytes(RxChars[1:5]),"little"))
+        if iCode == R_LOG:
+            iTotalSize = (RxChars[1] * RxChars[2]) + 3   # Quan * record size plus REP Quan Size
+            if (Count < 4) or (Count <= iTotalSize):
+                return ReplyRaw(RxChars,"INSUFFICIENT REPLY")
+            if (sum(RxChars[0:iTotalSize]) & 0xFF) != RxChars[iTotalSize]:
+                return ReplyRaw(RxChars,"BAD CHECKSUM")
+            return ReplyLog(RxChars[1],RxChars[2],bytes(RxChars[3:iTotalSize]))
+        return ReplyRaw(RxChars)                     # All other conditions
 
 
     def ShowError(self,code,PrintMode=False):
-        ErrorList = {C_PASS:"PASS",C_INVC:"INVALID COMMAND",C_INAC:"INACTIVE COMMAND",
-                     C_BADCS:"BAD CHECKSUM",C_BUSY:"BUSY",C_ERR:"ERROR",C_RANGE:"RANGE",
-                     C_NODATA:"END OF DATA",C_OVERF:"Rx BUFFER FULL",C_BOOT:"NO BOOT LOADER"}
-        if code in ErrorList.keys():
-            sError = ErrorList[code]
-        else:
-            sError = "UNKNOWN"
+        sError = COND_NAME.get(code,"UNKNOWN")
         if PrintMode:
             print("TDAU reply: {}".format(sError))
         return sError
@@ -1019,7 +2334,6 @@ class TDAU():
         self.TxBuffer[0] = CMD_RDSER                 # Command to send
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
 # ---------- Read Temperature ----------
@@ -1056,9 +2370,33 @@ class TDAU():
         self.TxBuffer[0] = iCommand
         self.TxCount = 1                             # Number of chars to send
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
         return self.fnRdReply(PrintMode)
 
+# ---------- Record serial traffic to a trace file ----------
+    def fnRecord(self,sFile=None):
+        """
+        Record serial traffic to a trace file
+        Parameters: string: trace file name (optional)
+                        None = stop recording DEFAULT
+        Returns:    bool: True
+                          False if not connected
+        Note:       Every frame written and every byte read is stored with
+                    its time, see TDAU_trace. Starting again closes the
+                    previous file. The trace starts with the version
+                    request fnAttach sends (about 1 second), so it plays
+                    back without hardware with
+                    fnAttach(TDAU_trace.TraceReplay(sFile)).
+        """
+        if self.hTDAU == None:
+            return False
+        import TDAU_trace                            # Not needed unless recording (module may be loaded from a string)
+        if type(self.hTDAU) == TDAU_trace.TraceRecorder:
+            self.hTDAU = self.hTDAU.fnStop()
+        if sFile != None:
+            self.hTDAU = TDAU_trace.TraceRecorder(self.hTDAU,sFile)
+            self.fnCheckCommunication()              # Same handshake as fnAttach on replay
+        return True
+
 # ---------- Resend prior response ----------
     def fnResend(self):
         """
@@ -1075,6 +2413,60 @@ class TDAU():
         time.sleep(0.25)                             # Wait for reply
         return self.fnRdRawString()
 
+# ---------- Write back changed bytes of a snapshot ----------
+    def fnRestoreSnapshot(self,Snapshot,bSave=True,bForce=False,PrintMode=False):
+        """
+        Write back the bytes of a snapshot that differ from the unit
+        Parameters: dict: from fnSnapshot
+                     OR string: snapshot file name
+                    bool: fnSaveMemory each written span (optional, default True)
+                    bool: restore even if serial/firmware differ (optional)
+                    bool: display messages (optional)
+        Returns:    string: PASS, or first reply that was not PASS
+                     OR bool: False if not connected/refused
+        Note:       One fnWrBlock and one fnSaveMemory per contiguous changed
+                    span, so unchanged EEPROM is never rewritten.
+                    Calibration data is per unit: a snapshot from another
+                    serial number is refused unless bForce, a unit whose
+                    serial number cannot be read is always refused.
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        dSnap = self.fnSnapshotLoad(Snapshot)
+        if dSnap == None:
+            return False
+        iSerial = self.fnSerialNumber()
+        if iSerial == None:                          # Even with bForce: unit not identified
+            print("Unable to read serial number, snapshot not restored")
+            return False
+        sFirmware = str(self.fnRdFWVersion())
+        if not bForce:
+            if iSerial != dSnap["Serial"]:
+                print("Snapshot is from serial number {}, unit is {}".format(dSnap["Serial"],iSerial))
+                return False
+            if sFirmware != dSnap["Firmware"]:
+                print("Snapshot is from firmware {}, unit has {}".format(dSnap["Firmware"],sFirmware))
+                return False
+        LDiff = self.fnDiffSnapshot(dSnap,PrintMode)
+        if LDiff == False:
+            return False
+        sReply = "PASS"
+        for iAddress,Data,Live in LDiff:
+            sReply = self.fnWrBlock(iAddress,Data,PrintMode)
+            if str(sReply) != "PASS":
+                break
+            if not bSave:
+                continue
+            for x in range(0,len(Data),255):         # fnSaveMemory quantity is 8 bit
+                sReply = self.fnSaveMemory(iAddress + x,min(255,len(Data) - x),PrintMode)
+                if str(sReply) != "PASS":
+                    break
+            if str(sReply) != "PASS":
+                break
+        if PrintMode:
+            print("Restored {} spans: {}".format(len(LDiff),str(sReply)))
+        return sReply
+
 # ---------- Save Memory ----------
     def fnSaveMemory(self,iAddress,iQuan,PrintMode=False):
         """
@@ -1094,21 +2486,13 @@ class TDAU():
             return False
         if iQuan == 0:
             return False                             # No data to save
-        iCS = iQuan
-        self.TxBuffer[3] = iQuan
-        iTemp = (iAddress & 0xFF)                    # Low half of address
-        iCS += iTemp
-        self.TxBuffer[1] = iTemp                     # Address L
-        iTemp = ((iAddress >> 8) & 0xFF)             # High half of address
-        iCS += iTemp
-        self.TxBuffer[2] = iTemp                     # Address H
-        iCS += CMD_SAVEM
-        self.TxBuffer[0] = CMD_SAVEM                 # Command
-        self.TxBuffer[4] = (iCS & 0xFF)              # CS
-        self.TxCount = 5                             # Number of chars to send
+        self.fnBuildSaveMemory(iAddress,iQuan)
         self.fnWrBuffer()
-        time.sleep(0.25)                             # Wait for reply
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        if (str(sReply) == "PASS") and (self.ShadowDirty != None):
+            for x in range(iAddress,min(iAddress+iQuan,SHADOW_SIZE),1):
+                self.ShadowDirty[x] = 0              # Now matches EEPROM
+        return sReply
 
 # ---------- Save User memory to file ----------
     def fnSaveToFile(self,sFile="abc"):
@@ -1117,6 +2501,7 @@ class TDAU():
         Parameters: string: File name
         Returns:    bool: True if successful
                           False if unsuccessful
+        Note:       Rows are EXPORT_ROWS, read in one pass (REG_EXPORT)
         """
         if not self.bCommEnabled:                    # Port not open
             return False
@@ -1135,444 +2520,35 @@ class TDAU():
         except:
             print("{} did NOT open".format(FileName))
             return False
-        # Type:
-        # 0 = No int, show float in raw & float
-        # 1 = 1 byte int, float optional
-        #     FFF = no float
-        #     FF0 = output decimal
-        # 2 = 2 byte int, float optional
-        #     FFF = no float
-        #     FFC = Vref
-        #     FFA = temp.status
-        #     FF8 = +/- offset calculation
-        #     FF4 = divide by 100
-        #     FF0 = output decimal
-        # 3 = 2 byte int, 2 byte int
-        # 4 = 4 byte ADC, float separate
-        #     FFF = no float
-        #     FF8 = +/- offset calculation
-        #     FF6 = Ext ADC temperature
-        #     FF2 = Ext ADC voltage
-        # 5 = 4 byte int, no float
-        # 6 = 2 byte int, 2 byte voltage (x1000.0)
-        dMemory = {0:("Control Word 1",                   0x00,2,0xFFF),
-                   1:("Control Word 2",                   0x02,2,0xFFF),
-                   2:("Control Word 3",                   0x04,2,0xFFF),
-                   3:("Control Word 4",                   0x06,2,0xFFF),
-                   4:("Trigger Delay",                    0x08,2,0xFF0),
-                   5:("Sampling Interval",                0x0A,2,0xFF0),
-                   6:("Number of samples to acquire",     0x0C,2,0xFF0),
-                   7:("Measurement Averaging",            0x0E,1,0xFF0),
-                   8:("Temperature Averaging",            0x10,1,0xFF0),
-                   9:("Base Offset DAC Default",          0x12,2,0xFF0),
-                  10:("Single I Offset Sampling Interval",0x14,2,0xFF0),
-                  11:("Single I Offset Number of samples",0x16,1,0xFF0),
-                  12:("Temperature DAC Offset",           0x18,2,0xFF0),
-                  13:("Temperature DAC Slope",            0x1A,2,0xFF0),
-                  14:("Too Hot Threshold",                0x174,2,0xFF4),
-                  15:("Catastrophic Threshold",           0x176,2,0xFF4),
-                  16:("System Temperature Delta Hi-Limit",0x1A6,2,0xFF4),
-                  17:("Ch1 Ideality Factor",              0,0,0x1C),
-                  18:("Ch2 Ideality Factor",              0,0,0x20),
-                  19:("Ch3 Ideality Factor",              0,0,0x24),
-                  20:("Ch4 Ideality Factor",              0,0,0x28),
-                  21:("Ch1 Early Voltage",                0,0,0x2C),
-                  22:("Ch2 Early Voltage",                0,0,0x30),
-                  23:("Ch3 Early Voltage",                0,0,0x34),
-                  24:("Ch4 Early Voltage",                0,0,0x38),
-                  25:("Ch1 Single I Slope",               0x3C,2,0xFF8),
-                  26:("Ch2 Single I Slope",               0x3E,2,0xFF8),
-                  27:("Ch3 Single I Slope",               0x40,2,0xFF8),
-                  28:("Ch4 Single I Slope",               0x42,2,0xFF8),
-                  29:("Ch1 Temperature Offset",           0,0,0x44),
-                  30:("Ch2 Temperature Offset",           0,0,0x48),
-                  31:("Ch3 Temperature Offset",           0,0,0x4C),
-                  32:("Ch4 Temperature Offset",           0,0,0x50),
-                  33:("Ch1 Force Current 1 (Ie1)",        0,0,0x54),
-                  34:("Ch1 Force Current 2 (Ie2)",        0,0,0x58),
-                  35:("Ch1 Force Current 3 (Ie3)",        0,0,0x5C),
-                  36:("Ch2 Force Current 1 (Ie1)",        0,0,0x60),
-                  37:("Ch2 Force Current 2 (Ie2)",        0,0,0x64),
-                  38:("Ch2 Force Current 3 (Ie3)",        0,0,0x68),
-                  39:("Ch3 Force Current 1 (Ie1)",        0,0,0x6C),
-                  40:("Ch3 Force Current 2 (Ie2)",        0,0,0x70),
-                  41:("Ch3 Force Current 3 (Ie3)",        0,0,0x74),
-                  42:("Ch4 Force Current 1 (Ie1)",        0,0,0x78),
-                  43:("Ch4 Force Current 2 (Ie2)",        0,0,0x7C),
-                  44:("Ch4 Force Current 3 (Ie3)",        0,0,0x80),
-                  45:("Ch1 BJT Temp Lo-Limit",            0,0,0x84),
-                  46:("Ch1 BJT Temp Hi-Limit",            0,0,0x88),
-                  47:("Ch2 BJT Temp Lo-Limit",            0,0,0x8C),
-                  48:("Ch2 BJT Temp Hi-Limit",            0,0,0x90),
-                  49:("Ch3 BJT Temp Lo-Limit",            0,0,0x94),
-                  50:("Ch3 BJT Temp Hi-Limit",            0,0,0x98),
-                  51:("Ch4 BJT Temp Lo-Limit",            0,0,0x9C),
-                  52:("Ch4 BJT Temp Hi-Limit",            0,0,0xA0),
-                  53:("Ch1 Force ie1 Lo-Limit",           0,0,0xA4),
-                  54:("Ch1 Force ie1 Hi-Limit",           0,0,0xA8),
-                  55:("Ch1 Force ie2 Lo-Limit",           0,0,0xAC),
-                  56:("Ch1 Force ie2 Hi-Limit",           0,0,0xB0),
-                  57:("Ch1 Force ie3 Lo-Limit",           0,0,0xB4),
-                  58:("Ch1 Force ie3 Hi-Limit",           0,0,0xB8),
-                  59:("Ch2 Force ie1 Lo-Limit",           0,0,0xBC),
-                  60:("Ch2 Force ie1 Hi-Limit",           0,0,0xC0),
-                  61:("Ch2 Force ie2 Lo-Limit",           0,0,0xC4),
-                  62:("Ch2 Force ie2 Hi-Limit",           0,0,0xC8),
-                  63:("Ch2 Force ie3 Lo-Limit",           0,0,0xCC),
-                  64:("Ch2 Force ie3 Hi-Limit",           0,0,0xD0),
-                  65:("Ch3 Force ie1 Lo-Limit",           0,0,0xD4),
-                  66:("Ch3 Force ie1 Hi-Limit",           0,0,0xD8),
-                  67:("Ch3 Force ie2 Lo-Limit",           0,0,0xDC),
-                  68:("Ch3 Force ie2 Hi-Limit",           0,0,0xE0),
-                  69:("Ch3 Force ie3 Lo-Limit",           0,0,0xE4),
-                  70:("Ch3 Force ie3 Hi-Limit",           0,0,0xE8),
-                  71:("Ch4 Force ie1 Lo-Limit",           0,0,0xEC),
-                  72:("Ch4 Force ie1 Hi-Limit",           0,0,0xF0),
-                  73:("Ch4 Force ie2 Lo-Limit",           0,0,0xF4),
-                  74:("Ch4 Force ie2 Hi-Limit",           0,0,0xF8),
-                  75:("Ch4 Force ie3 Lo-Limit",           0,0,0xFC),
-                  76:("Ch4 Force ie3 Hi-Limit",           0,0,0x100),
-                  77:("Ch1 Current ib1 Lo-Limit",         0,0,0x104),
-                  78:("Ch1 Current ib1 Hi-Limit",         0,0,0x108),
-                  79:("Ch1 Current ib2 Lo-Limit",         0,0,0x10C),
-                  80:("Ch1 Current ib2 Hi-Limit",         0,0,0x110),
-                  81:("Ch1 Current ib3 Lo-Limit",         0,0,0x114),
-                  82:("Ch1 Current ib3 Hi-Limit",         0,0,0x118),
-                  83:("Ch2 Current ib1 Lo-Limit",         0,0,0x11C),
-                  84:("Ch2 Current ib1 Hi-Limit",         0,0,0x120),
-                  85:("Ch2 Current ib2 Lo-Limit",         0,0,0x124),
-                  86:("Ch2 Current ib2 Hi-Limit",         0,0,0x128),
-                  87:("Ch2 Current ib3 Lo-Limit",         0,0,0x12C),
-                  88:("Ch2 Current ib3 Hi-Limit",         0,0,0x130),
-                  89:("Ch3 Current ib1 Lo-Limit",         0,0,0x134),
-                  90:("Ch3 Current ib1 Hi-Limit",         0,0,0x138),
-                  91:("Ch3 Current ib2 Lo-Limit",         0,0,0x13C),
-                  92:("Ch3 Current ib2 Hi-Limit",         0,0,0x140),
-                  93:("Ch3 Current ib3 Lo-Limit",         0,0,0x144),
-                  94:("Ch3 Current ib3 Hi-Limit",         0,0,0x148),
-                  95:("Ch4 Current ib1 Lo-Limit",         0,0,0x14C),
-                  96:("Ch4 Current ib1 Hi-Limit",         0,0,0x150),
-                  97:("Ch4 Current ib2 Lo-Limit",         0,0,0x154),
-                  98:("Ch4 Current ib2 Hi-Limit",         0,0,0x158),
-                  99:("Ch4 Current ib3 Lo-Limit",         0,0,0x15C),
-                 100:("Ch4 Current ib3 Hi-Limit",         0,0,0x160),
-                 101:("Ch1 Leakage Hi-Limit",             0,0,0x164),
-                 102:("Ch2 Leakage Hi-Limit",             0,0,0x168),
-                 103:("Ch3 Leakage Hi-Limit",             0,0,0x16C),
-                 104:("Ch4 Leakage Hi-Limit",             0,0,0x170),
-                 105:("Voltage A-D VREF",                 0,0,0x184),
-                 106:("Voltage A-D FS Calibration",       0,0,0x188),
-                 107:("Current A-D VREF",                 0,0,0x18C),
-                 108:("Current A-D FS Calibration",       0,0,0x190),
-                 109:("Current DAC VREF",                 0,0,0x194),
-                 110:("Current DAC Offset",               0x198,2,0xFF8),
-                 111:("Current DAC Scale",                0,0,0x19A),
-                 112:("CPU ADC VRef",                     0x19E,2,0xFFF),
-                 113:("Base DAC Offset",                  0x1A0,2,0xFF8),
-                 114:("Base DAC Scale",                   0,0,0x1A2),
-                 115:("Voltage A-D In 1 Offset",          0x1A8,2,0xFF8),
-                 116:("Voltage A-D In 2 Offset",          0x1AA,2,0xFF8),
-                 117:("Voltage A-D In 3 Offset",          0x1AC,2,0xFF8),
-                 118:("Voltage A-D In 4 Offset",          0x1AE,2,0xFF8),
-                 119:("Voltage A-D In 5 Offset",          0x1B0,2,0xFF8),
-                 120:("Voltage A-D In 6 Offset",          0x1B2,2,0xFF8),
-                 121:("Voltage A-D In 7 Offset",          0x1B4,2,0xFF8),
-                 122:("Voltage A-D In 8 Offset",          0x1B6,2,0xFF8),
-                 123:("Voltage A-D In 1 Scale",           0,0,0x1B8),
-                 124:("Voltage A-D In 2 Scale",           0,0,0x1BC),
-                 125:("Voltage A-D In 3 Scale",           0,0,0x1C0),
-                 126:("Voltage A-D In 4 Scale",           0,0,0x1C4),
-                 127:("Voltage A-D In 5 Scale",           0,0,0x1C8),
-                 128:("Voltage A-D In 6 Scale",           0,0,0x1CC),
-                 129:("Voltage A-D In 7 Scale",           0,0,0x1D0),
-                 130:("Voltage A-D In 8 Scale",           0,0,0x1D4),
-                 131:("Current A-D In 1 Offset",          0x1D8,2,0xFF8),
-                 132:("Current A-D In 2 Offset",          0x1DA,2,0xFF8),
-                 133:("Current A-D In 3 Offset",          0x1DC,2,0xFF8),
-                 134:("Current A-D In 4 Offset",          0x1DE,2,0xFF8),
-                 135:("Current A-D In 5 Offset",          0x1E0,2,0xFF8),
-                 136:("Current A-D In 6 Offset",          0x1E2,2,0xFF8),
-                 137:("Current A-D In 7 Offset",          0x1E4,2,0xFF8),
-                 138:("Current A-D In 8 Offset",          0x1E6,2,0xFF8),
-                 139:("Current A-D In 1 Scale",           0,0,0x1E8),
-                 140:("Current A-D In 2 Scale",           0,0,0x1EC),
-                 141:("Current A-D In 3 Scale",           0,0,0x1F0),
-                 142:("Current A-D In 4 Scale",           0,0,0x1F4),
-                 143:("Current A-D In 5 Scale",           0,0,0x1F8),
-                 144:("Current A-D In 6 Scale",           0,0,0x1FC),
-                 145:("Current A-D In 7 Scale",           0,0,0x200),
-                 146:("Current A-D In 8 Scale",           0,0,0x204),
-                 147:("+2.5v PS Voltage Lo-Limit",        0x208,2,0xFF0),
-                 148:("+2.5v PS Voltage Hi-Limit",        0x20A,2,0xFF0),
-                 149:("-2.5v PS Voltage Lo-Limit",        0x20C,2,0xFF0),
-                 150:("-2.5v PS Voltage Hi-Limit",        0x20E,2,0xFF0),
-                 151:("+5v Analog PS Voltage Lo-Limit",   0x210,2,0xFF0),
-                 152:("+5v Analog PS Voltage Hi-Limit",   0x212,2,0xFF0),
-                 153:("+5v Digital PS Voltage Lo-Limit",  0x214,2,0xFF0),
-                 154:("+5v Digital PS Voltage Hi-Limit",  0x216,2,0xFF0),
-                 155:("Internal ADC VRef Lo-Limit",       0x218,2,0xFF0),
-                 156:("Internal ADC VRef Hi-Limit",       0x21A,2,0xFF0),
-                 157:("10ua Test Resistance Lo Limit",    0,0,0x21C),
-                 158:("10ua Test Resistance Hi Limit",    0,0,0x220),
-                 159:("175ua Test Resistance Lo Limit",   0,0,0x224),
-                 160:("175ua Test Resistance Lo Limit",   0,0,0x228),
-                 161:("Voltage A-D In6 10ua Test",        0x338,4,0x3F0),
-                 162:("Voltage A-D In6 175ua Test",       0x33C,4,0x3F4),
-                 163:("Current A-D In6 10ua Test",        0x340,4,0x3F8),
-                 164:("Current A-D In6 175ua Test",       0x344,4,0x3FC),
-                 165:("Temperature DAC Calibration Offset",0x22C,2,0xFF0),
-                 166:("Raw DAC Leakage",                  0,0,0x334),
-                 167:("Temperature DAC Calibration Slope",0,0,0x22E),
-                 168:("Reserved1",                        0x232,3,0xFFF),
-                 169:("Reserved2",                        0x234,3,0xFFF),
-                 170:("Reserved3",                        0x236,3,0xFFF),
-                 171:("Reserved4",                        0x238,3,0xFFF),
-                 172:("Reserved5",                        0x178,3,0xFFF),
-                 173:("Reserved6",                        0x17A,3,0xFFF),
-                 174:("Reserved7",                        0x17C,3,0xFFF),
-                 175:("Reserved8",                        0x17E,3,0xFFF),
-                 176:("Month",                            0x23A,1,0xFF0),
-                 177:("Date",                             0x23B,1,0xFF0),
-                 178:("Year",                             0x23C,2,0xFF0),
-                 179:("Voltage A-D In1 Ie1",              0x240,4,0x464),
-                 180:("Voltage A-D In1 Ie2",              0x244,4,0x46C),
-                 181:("Voltage A-D In1 Ie3",              0x248,4,0x474),
-                 182:("Voltage A-D In2 Ie1",              0x24C,4,0x47E),
-                 183:("Voltage A-D In2 Ie2",              0x250,4,0x486),
-                 184:("Voltage A-D In2 Ie3",              0x254,4,0x48E),
-                 185:("Voltage A-D In3 Ie1",              0x258,4,0x498),
-                 186:("Voltage A-D In3 Ie2",              0x25C,4,0x4A0),
-                 187:("Voltage A-D In3 Ie3",              0x260,4,0x4A8),
-                 188:("Voltage A-D In4 Ie1",              0x264,4,0x4B2),
-                 189:("Voltage A-D In4 Ie2",              0x268,4,0x4BA),
-                 190:("Voltage A-D In4 Ie3",              0x26C,4,0x4C2),
-                 191:("Voltage A-D In5 VbOs",             0x270,4,0x368),
-                 192:("Voltage A-D In6 ie1",              0x274,4,0x36C),
-                 193:("Voltage A-D In6 ie2",              0x278,4,0x370),
-                 194:("Voltage A-D In6 ie3",              0x27C,4,0x374),
-                 195:("Voltage A-D In7 FullScale",        0x280,4,0x378),
-                 196:("Voltage A-D In8 Offset",           0x284,4,0xFF8),
-                 197:("Voltage A-D Internal Offset",      0x288,4,0xFF8),
-                 198:("Voltage A-D Internal Supply",      0x28C,4,0x380),
-                 199:("Voltage A-D Int Temperature",      0x290,4,0x384),
-                 200:("Voltage A-D Internal Gain",        0x294,4,0x388),
-                 201:("Voltage A-D External Ref",         0x298,4,0x38C),
-                 202:("Voltage A-D Factory",              0x29C,4,0xFF8),
-                 203:("Current A-D In1 Ib1",              0x2A0,4,0x468),
-                 204:("Current A-D In1 Ib2",              0x2A4,4,0x470),
-                 205:("Current A-D In1 Ib3",              0x2A8,4,0x478),
-                 206:("Current A-D In2 Ib1",              0x2AC,4,0x482),
-                 207:("Current A-D In2 Ib2",              0x2B0,4,0x48A),
-                 208:("Current A-D In2 Ib3",              0x2B4,4,0x492),
-                 209:("Current A-D In3 Ib1",              0x2B8,4,0x49C),
-                 210:("Current A-D In3 Ib2",              0x2BC,4,0x4A4),
-                 211:("Current A-D In3 Ib3",              0x2C0,4,0x4AC),
-                 212:("Current A-D In4 Ib1",              0x2C4,4,0x4B6),
-                 213:("Current A-D In4 Ib2",              0x2C8,4,0x4BE),
-                 214:("Current A-D In4 Ib3",              0x2CC,4,0x4C6),
-                 215:("Current A-D In6 Ch1 ie1",          0x2D0,4,0x41C),
-                 216:("Current A-D In6 Ch1 ie2",          0x2D4,4,0x420),
-                 217:("Current A-D In6 Ch1 ie3",          0x2D8,4,0x424),
-                 218:("Current A-D In6 Ch2 ie1",          0x2DC,4,0x428),
-                 219:("Current A-D In6 Ch2 ie2",          0x2E0,4,0x42C),
-                 220:("Current A-D In6 Ch2 ie3",          0x2E4,4,0x430),
-                 221:("Current A-D In6 Ch3 ie1",          0x2E8,4,0x434),
-                 222:("Current A-D In6 Ch3 ie2",          0x2EC,4,0x438),
-                 223:("Current A-D In6 Ch3 ie3",          0x2F0,4,0x43C),
-                 224:("Current A-D In6 Ch4 ie1",          0x2F4,4,0x440),
-                 225:("Current A-D In6 Ch4 ie2",          0x2F8,4,0x444),
-                 226:("Current A-D In6 Ch4 ie3",          0x2FC,4,0x448),
-                 227:("Current A-D In7 FullScale",        0x300,4,0x37C),
-                 228:("Current A-D In8 Offset",           0x304,4,0xFF8),
-                 229:("Current A-D Internal Offset",      0x308,4,0xFF8),
-                 230:("Current A-D Internal Supply",      0x30C,4,0xFF2),
-                 231:("Current A-D Int Temperature",      0x310,4,0xFF6),
-                 232:("Current A-D Internal Gain",        0x314,4,0x35C),
-                 233:("Current A-D External Ref",         0x318,4,0xFF2),
-                 234:("Current A-D Factory",              0x31C,4,0xFF8),
-                 235:("uC A-D In1 +2.5V",                 0x320,6,0x360),
-                 236:("uC A-D In2 -2.5V",                 0x322,6,0x362),
-                 237:("uC A-D In3 +5V Analog",            0x324,6,0x364),
-                 238:("uC A-D In4 +5V Digital",           0x326,6,0x366),
-                 239:("uC A-D Internal Vref",             0x330,2,0xFFC),
-                 240:("uC A-D Internal Offset",           0x332,2,0xFF8),
-                 241:("Ch1 Single I Offset",              0,0,0x348),
-                 242:("Ch2 Single I Offset",              0,0,0x34C),
-                 243:("Ch3 Single I Offset",              0,0,0x350),
-                 244:("Ch4 Single I Offset",              0,0,0x354),
-                 245:("Ch1 Temperature",                  0x47C,2,0xFFA),
-                 246:("Ch1 Minimum",                      0x404,2,0xFFA),
-                 247:("Ch1 Maximum",                      0x406,2,0xFFA),
-                 248:("Ch1 Average",                      0x408,2,0xFFA),
-                 249:("Ch1 Logged Minimum",               0x44C,2,0xFFA),
-                 250:("Ch1 Logged Maximum",               0x44E,2,0xFFA),
-                 251:("Ch1 Logged Average",               0x450,2,0xFFA),
-                 252:("Ch2 Temperature",                  0x496,2,0xFFA),
-                 253:("Ch2 Minimum",                      0x40A,2,0xFFA),
-                 254:("Ch2 Maximum",                      0x40C,2,0xFFA),
-                 255:("Ch2 Average",                      0x40E,2,0xFFA),
-                 256:("Ch2 Logged Minimum",               0x452,2,0xFFA),
-                 257:("Ch2 Logged Maximum",               0x454,2,0xFFA),
-                 258:("Ch2 Logged Average",               0x456,2,0xFFA),
-                 259:("Ch3 Temperature",                  0x4B0,2,0xFFA),
-                 260:("Ch3 Minimum",                      0x410,2,0xFFA),
-                 261:("Ch3 Maximum",                      0x412,2,0xFFA),
-                 262:("Ch3 Average",                      0x414,2,0xFFA),
-                 263:("Ch3 Logged Minimum",               0x458,2,0xFFA),
-                 264:("Ch3 Logged Maximum",               0x45A,2,0xFFA),
-                 265:("Ch3 Logged Average",               0x45C,2,0xFFA),
-                 266:("Ch4 Temperature",                  0x4CA,2,0xFFA),
-                 267:("Ch4 Minimum",                      0x416,2,0xFFA),
-                 268:("Ch4 Maximum",                      0x418,2,0xFFA),
-                 269:("Ch4 Average",                      0x41A,2,0xFFA),
-                 270:("Ch4 Logged Minimum",               0x45E,2,0xFFA),
-                 271:("Ch4 Logged Maximum",               0x460,2,0xFFA),
-                 272:("Ch4 Logged Average",               0x462,2,0xFFA),
-                 273:("Serial Number",                    0x180,5,0xFFF)}
         dMargin = {35:0,83:0,131:0,179:0,227:0,275:0,}
         sWrite = "NAME,ADDRESS,RAW,ADDRESS,FLOAT" + chr(13) + chr(10)
         hFile1.write(sWrite.encode('utf-8'))
         print("Please wait ",end="")
-        for x in range(len(dMemory)):
-            sName,iAddress,iType,iFloat = dMemory[x]
-            if iAddress == 0x4CA:                    # Trap to avoid end of memory range error
-                sReply = self.fnRdMemory(0x4C0)
-                WordList = sReply.split(" ")
-                sVal1 = "0x{}".format(WordList[1])
-                iVal1 = eval(sVal1)
-                sVal2 = "0x{}".format(WordList[0])
-                iVal2 = eval(sVal2)
-                if (iVal2 & 0x10) == 0x10:
-                    fVal = iVal1 * -1.0
-                sWrite = "{},x{:04X},x{}{},,{}".format(sName,iAddress,WordList[11],WordList[10],fVal)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 0:
-                fVal1 = self.fnRdFloat(iFloat)
-                sVal1 = self.fnEng(fVal1)
-                sReply = self.fnRdMemory(iFloat)
-                WordList = sReply.split(" ")
-                sWrite = "{},x{:04X},x{}{}{}{},x{:04X},{}".format(sName,iFloat,WordList[3],WordList[2],WordList[1],WordList[0],iFloat,sVal1)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 1:
-                sReply = self.fnRdMemory(iAddress)
-                WordList = sReply.split(" ")
-                if iFloat == 0xFFF:
-                    sWrite = "{},x{:04X},x{}".format(sName,iAddress,WordList[0])
-                else:
-                    sVal = "0x{}".format(WordList[0])
-                    iVal = eval(sVal)
-                    sWrite = "{},x{:04X},x{}{},,{:d}".format(sName,iAddress,WordList[1],WordList[0],iVal)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 2:
-                sReply = self.fnRdMemory(iAddress)
-                WordList = sReply.split(" ")
-                if iFloat == 0xFFF:                      # No float
-                    sWrite = "{},x{:04X},x{}{}".format(sName,iAddress,WordList[1],WordList[0])
-                elif iFloat == 0xFFC:                    # Vref
-                    sVal = "0x{}{}".format(WordList[1],WordList[0])
-                    iVal = eval(sVal)
-                    fVal = (iVal * 25) / 10000
-                    sWrite = "{},x{:04X},x{}{},,{}".format(sName,iAddress,WordList[1],WordList[0],fVal)
-                elif iFloat == 0xFFA:                    # Temp.status
-                    sVal1 = "0x{}".format(WordList[1])
-                    iVal1 = eval(sVal1)
-                    sVal2 = "0x{}".format(WordList[0])
-                    iVal2 = eval(sVal2)
-                    if (iVal2 & 0x10) == 0x10:
-                        fVal = iVal1 * -1.0
-                    else:
-                        fVal = iVal1 * 1.0
-                    fVal += ((iVal2 & 0x0F) / 10.0)
-                    sWrite = "{},x{:04X},x{}{},,{}".format(sName,iAddress,WordList[1],WordList[0],fVal)
-                elif iFloat == 0xFF8:                    # +/- offset
-                    sVal = "0x{}{}".format(WordList[1],WordList[0])
-                    iVal = eval(sVal)
-                    if iVal > 0x7FFF:
-                        iVal = (0x10000 - iVal) * -1
-                    sWrite = "{},x{:04X},x{}{},,{}".format(sName,iAddress,WordList[1],WordList[0],iVal)
-                elif iFloat == 0xFF4:                    # Divide by 100
-                    sVal = "0x{}{}".format(WordList[1],WordList[0])
-                    iVal = eval(sVal)
-                    fVal = iVal / 100.0
-                    sWrite = "{},x{:04X},x{}{},,{}".format(sName,iAddress,WordList[1],WordList[0],fVal)
-                elif iFloat == 0xFF0:                    # Decimal
-                    sVal = "0x{}{}".format(WordList[1],WordList[0])
-                    iVal = eval(sVal)
-                    sWrite = "{},x{:04X},x{}{},,{:d}".format(sName,iAddress,WordList[1],WordList[0],iVal)
-                else:
-                    fVal1 = self.fnRdFloat(iFloat)
-                    sVal1 = self.fnEng(fVal1)
-                    sWrite = "{},x{:04X},x{}{},x{:04X},{}".format(sName,iAddress,WordList[1],WordList[0],iFloat,sVal1)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 3:
-                sReply = self.fnRdMemory(iAddress)
-                WordList1 = sReply.split(" ")
-                sWrite = "{},x{:04X},x{}{}".format(sName,iAddress,WordList1[1],WordList1[0])
-                if iFloat != 0xFFF:
-                    sReply = self.fnRdMemory(iFloat)
-                    WordList2 = sReply.split(" ")
-                    sWrite += ",x{:04X},x{}".format(iFloat,WordList2[1],WordList2[0])
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 4:
-                sReply = self.fnRdMemory(iAddress)
-                WordList = sReply.split(" ")
-                if iFloat == 0xFFF:
-                    sWrite = "{},x{:04X},x{}{}{}{}".format(sName,iAddress,WordList[0],WordList[1],WordList[2],WordList[3])
-                elif iFloat == 0xFF8:                    # +/- offset
-                    sVal = "0x{}{}{}".format(WordList[1],WordList[2],WordList[3])
-                    iVal = eval(sVal)
-                    if iVal > 0x7FFFFF:
-                        iVal = (0x1000000 - iVal) * -1
-                    sWrite = "{},x{:04X},x{}{}{}{},,{}".format(sName,iAddress,WordList[0],WordList[1],WordList[2],WordList[3],iVal)
-                elif iFloat == 0xFF6:                    # Ext ADC temperature
-                    sVal = "0x{}{}{}".format(WordList[1],WordList[2],WordList[3])
-                    iVal = eval(sVal)
-                    if iVal > 0x7FFFFF:
-                        iVal = (0x1000000 - iVal) * -1
-                    fVal = iVal * 6.357829E-7
-                    fVal -= 168E-3
-                    fVal = fVal / 394E-6
-                    fVal += 25
-                    sWrite = "{},x{:04X},x{}{}{}{},,{}".format(sName,iAddress,WordList[0],WordList[1],WordList[2],WordList[3],fVal)
-                elif iFloat == 0xFF2:                    # Ext ADC voltage
-                    sVal = "0x{}{}{}".format(WordList[1],WordList[2],WordList[3])
-                    iVal = eval(sVal)
-                    if iVal > 0x7FFFFF:
-                        iVal = (0x1000000 - iVal) * -1
-                    fVal = iVal / 7.86432E5
-                    sWrite = "{},x{:04X},x{}{}{}{},,{}".format(sName,iAddress,WordList[0],WordList[1],WordList[2],WordList[3],fVal)
-                else:
-                    fVal1 = self.fnRdFloat(iFloat)
-                    sVal1 = self.fnEng(fVal1)
-                    sWrite = "{},x{:04X},x{}{}{}{},x{:04X},{}".format(sName,iAddress,WordList[0],WordList[1],WordList[2],WordList[3],iFloat,sVal1)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 5:
-                sReply = self.fnRdMemory(iAddress)
-                WordList = sReply.split(" ")
-                iVal = "0x{}{}{}{}".format(WordList[3],WordList[2],WordList[1],WordList[0])
-                fVal = eval(iVal)
-                sWrite = "{},x{:04X},x{}{}{}{},,{:d}".format(sName,iAddress,WordList[3],WordList[2],WordList[1],WordList[0],fVal)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
-            elif iType == 6:
-                sReply = self.fnRdMemory(iAddress)
-                WordList1 = sReply.split(" ")
-                sWrite = "{},x{:04X},x{}{}".format(sName,iAddress,WordList1[1],WordList1[0])
-                if iFloat != 0xFFF:
-                    sReply = self.fnRdMemory(iFloat)
-                    WordList2 = sReply.split(" ")
-                    sVal1 = "0x" + WordList2[1] + WordList2[0]
-                    iVal1 = eval(sVal1)
-                    fVal1 = iVal1 / 10000.0
-                    sWrite += ",x{:04X},{:f}".format(iFloat,fVal1)
-                sWrite += chr(13) + chr(10)
-                hFile1.write(sWrite.encode('utf-8'))
+        Image = self.fnRdImage(REG_EXPORT.Spans)
+        if Image == None:
+            hFile1.close()
+            return False
+        dValue = REG_EXPORT.fnDecode(Image)
+        for x in range(len(EXPORT_ROWS)):
+            if type(EXPORT_ROWS[x]) == str:
+                sName = sReg = EXPORT_ROWS[x]
+            else:
+                sName,sReg = EXPORT_ROWS[x]
+            iAddress,iWidth,sType,Scale = REG_MAP[sName]
+            Raw = Image[iAddress:(iAddress+iWidth)]
+            if sType not in ("adc","adct"):          # Little endian, show MSB first
+                Raw = Raw[::-1]
+            sWrite = "{},x{:04X},x{}".format(sName,iAddress,Raw.hex().upper())
+            if sReg == None:                         # Raw only
+                pass
+            elif REG_MAP[sReg][2] == "f32":
+                sWrite += ",x{:04X},{}".format(REG_MAP[sReg][0],self.fnEng(dValue[sReg]))
+            elif sReg != sName:                      # Result held elsewhere
+                sWrite += ",x{:04X},{:f}".format(REG_MAP[sReg][0],dValue[sReg])
+            else:
+                sWrite += ",,{}".format(dValue[sReg])
+            sWrite += chr(13) + chr(10)
+            hFile1.write(sWrite.encode('utf-8'))
             print(".",end="")
             if x in dMargin.keys():
                 print("")
@@ -1596,8 +2572,60 @@ class TDAU():
         self.TxBuffer[0] = CMD_SCO
         self.TxCount = 1
         self.fnWrBuffer()
-        time.sleep(0.25)
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        self.fnShadowInvalidate(*SHADOW_CAL[CMD_SCO])
+        return sReply
+
+# ---------- Enable/disable host copy of user RAM ----------
+    def fnShadow(self,bEnable=True):
+        """
+        Enable/disable host copy of user RAM
+        Parameters: bool: (optional)
+                        True = keep a host copy DEFAULT
+                        False = discard host copy, always read TDAU
+        Returns:    bool: True
+        Note:       Configuration/calibration memory (below SHADOW_SIZE) is
+                    read from TDAU once, then served from the host copy.
+                    fnWrMemory writes through to it and calibration
+                    commands invalidate the spans they rewrite. Enabling
+                    again starts with an empty copy.
+        """
+        if bEnable:
+            self.Shadow = bytearray(SHADOW_SIZE)
+            self.ShadowValid = bytearray(SHADOW_SIZE)
+            self.ShadowDirty = bytearray(SHADOW_SIZE)
+        else:
+            self.Shadow = None
+            self.ShadowValid = None
+            self.ShadowDirty = None
+        return True
+
+# ---------- List RAM spans written but not saved ----------
+    def fnShadowDirty(self,PrintMode=False):
+        """
+        List RAM spans written but not saved to EEPROM
+        Parameters: bool:  (optional)
+                        True = display messages
+                        False = don't display messages DEFAULT
+        Returns:    list: (address, quantity) for each contiguous span
+                     OR bool: False if host copy not enabled
+        Note:       Spans come from fnWrMemory and clear on fnSaveMemory
+        """
+        if self.ShadowDirty == None:
+            return False
+        LSpans = []
+        iStart = None
+        for x in range(SHADOW_SIZE + 1):
+            if (x < SHADOW_SIZE) and (self.ShadowDirty[x] != 0):
+                if iStart == None:
+                    iStart = x
+            elif iStart != None:
+                LSpans.append((iStart,x - iStart))
+                iStart = None
+        if PrintMode:
+            for iAddress,iQuan in LSpans:
+                print("Unsaved: x{:04X} {:d} bytes".format(iAddress,iQuan))
+        return LSpans
 
 # ---------- Display User Configuration ----------
     def fnShowConfiguration(self,iLevel=0):
@@ -1608,49 +2636,8 @@ class TDAU():
                          1 = no limits
         Returns:    bool: True if successful
                           False if unsuccessful
+        Note:       Fields come from REG_MAP, read in one pass (REG_CONFIG)
         """
-        dLimit =  {0:("Ch1 BJT Lo Limit",0x084,"Ch1 BJT Hi Limit",0x088),
-                   1:("Ch2 BJT Lo Limit",0x08C,"Ch2 BJT Hi Limit",0x090),
-                   2:("Ch3 BJT Lo Limit",0x094,"Ch3 BJT Hi Limit",0x098),
-                   3:("Ch4 BJT Lo Limit",0x09C,"Ch4 BJT Hi Limit",0x0A0),
-                   4:("Ch1 Ie1 Lo Limit",0x0A4,"Ch1 Ie1 Hi Limit",0x0A8),
-                   5:("Ch1 Ie2 Lo Limit",0x0AC,"Ch1 Ie2 Hi Limit",0x0B0),
-                   6:("Ch1 Ie3 Lo Limit",0x0B4,"Ch1 Ie3 Hi Limit",0x0B8),
-                   7:("Ch2 Ie1 Lo Limit",0x0BC,"Ch2 Ie1 Hi Limit",0x0C0),
-                   8:("Ch2 Ie2 Lo Limit",0x0C4,"Ch2 Ie2 Hi Limit",0x0C8),
-                   9:("Ch2 Ie3 Lo Limit",0x0CC,"Ch2 Ie3 Hi Limit",0x0D0),
-                  10:("Ch3 Ie1 Lo Limit",0x0D4,"Ch3 Ie1 Hi Limit",0x0D8),
-                  11:("Ch3 Ie2 Lo Limit",0x0DC,"Ch3 Ie2 Hi Limit",0x0E0),
-                  12:("Ch3 Ie3 Lo Limit",0x0E4,"Ch3 Ie3 Hi Limit",0x0E8),
-                  13:("Ch4 Ie1 Lo Limit",0x0EC,"Ch4 Ie1 Hi Limit",0x0F0),
-                  14:("Ch4 Ie2 Lo Limit",0x0F4,"Ch4 Ie2 Hi Limit",0x0F8),
-                  15:("Ch4 Ie3 Lo Limit",0x0FC,"Ch4 Ie3 Hi Limit",0x100),
-                  16:("Ch1 Ib1 Lo Limit",0x104,"Ch1 Ib1 Hi Limit",0x108),
-                  17:("Ch1 Ib2 Lo Limit",0x10C,"Ch1 Ib2 Hi Limit",0x110),
-                  18:("Ch1 Ib3 Lo Limit",0x114,"Ch1 Ib3 Hi Limit",0x118),
-                  19:("Ch2 Ib1 Lo Limit",0x11C,"Ch2 Ib1 Hi Limit",0x120),
-                  20:("Ch2 Ib2 Lo Limit",0x124,"Ch2 Ib2 Hi Limit",0x128),
-                  21:("Ch2 Ib3 Lo Limit",0x12C,"Ch2 Ib3 Hi Limit",0x130),
-                  22:("Ch3 Ib1 Lo Limit",0x134,"Ch3 Ib1 Hi Limit",0x138),
-                  23:("Ch3 Ib2 Lo Limit",0x13C,"Ch3 Ib2 Hi Limit",0x140),
-                  24:("Ch3 Ib3 Lo Limit",0x144,"Ch3 Ib3 Hi Limit",0x148),
-                  25:("Ch4 Ib1 Lo Limit",0x14C,"Ch4 Ib1 Hi Limit",0x150),
-                  26:("Ch4 Ib2 Lo Limit",0x154,"Ch4 Ib2 Hi Limit",0x158),
-                  27:("Ch4 Ib3 Lo Limit",0x15C,"Ch4 Ib3 Hi Limit",0x160),
-                  28:("Ch1 Leak H Limit",0x164,"Ch2 Leak H Limit",0x168),
-                  29:("Ch3 Leak H Limit",0x16C,"Ch4 Leak H Limit",0x170)}
-        dConfig = {0:("Ch1 Force Ie1   ",0x54,"Ch1 Force Ie2    ",0x58),
-                   1:("Ch1 Force Ie3   ",0x5C,"Ch1 Temp Offset  ",0x44),
-                   2:("Ch2 Force Ie1   ",0x60,"Ch2 Force Ie2    ",0x64),
-                   3:("Ch2 Force Ie3   ",0x68,"Ch2 Temp Offset  ",0x48),
-                   4:("Ch3 Force Ie1   ",0x6C,"Ch3 Force Ie2    ",0x70),
-                   5:("Ch3 Force Ie3   ",0x74,"Ch3 Temp Offset  ",0x4C),
-                   6:("Ch4 Force Ie1   ",0x78,"Ch4 Force Ie2    ",0x7C),
-                   7:("Ch4 Force Ie3   ",0x80,"Ch4 Temp Offset  ",0x50),
-                   8:("Ch1 Ideality    ",0x1C,"Ch1 Early Voltage",0x2C),
-                   9:("Ch2 Ideality    ",0x20,"Ch2 Early Voltage",0x30),
-                  10:("Ch3 Ideality    ",0x24,"Ch3 Early Voltage",0x34),
-                  11:("Ch4 Ideality    ",0x28,"Ch4 Early Voltage",0x38)}
         if not self.bCommEnabled:                    # Port not open
             return False
         if type(iLevel) == str:
@@ -1675,24 +2662,14 @@ class TDAU():
                   13:"3 Current Early/Leak",
                   14:"Single Current",
                   15:"Disabled"}
-        sReply = self.fnRdMemory(0)
-        WordList = sReply.split(" ")
-        sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-        iVal1 = eval(sVal1)
-        sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-        iVal2 = eval(sVal2)
-        sVal3 = "0x{}{}".format(WordList[5],WordList[4])
-        iVal3 = eval(sVal3)
-        sVal4 = "0x{}{}".format(WordList[7],WordList[6])
-        iVal4 = eval(sVal4)
-        sVal5 = "0x{}{}".format(WordList[9],WordList[8])
-        iVal5 = eval(sVal5)
-        sVal6 = "0x{}{}".format(WordList[11],WordList[10])
-        iVal6 = eval(sVal6)
-        sVal7 = "0x{}{}".format(WordList[13],WordList[12])
-        iVal7 = eval(sVal7)
-        sVal8 = "0x{}".format(WordList[15])
-        iVal8 = eval(sVal8)
+        Image = self.fnRdImage(REG_CONFIG.Spans)
+        if Image == None:
+            return False
+        dValue = REG_CONFIG.fnDecode(Image)
+        iVal1 = dValue["Control Word 1"]
+        iVal2 = dValue["Control Word 2"]
+        iVal3 = dValue["Control Word 3"]
+        iVal4 = dValue["Control Word 4"]
         Ch1 = iVal1 & 0x0F
         Ch2 = (iVal1 >> 4) & 0x0F
         Ch3 = (iVal1 >> 8) & 0x0F
@@ -1701,12 +2678,12 @@ class TDAU():
         Ch2s = (iVal4 >> 4) & 0x0F
         Ch3s = (iVal4 >> 8) & 0x0F
         Ch4s = (iVal4 >> 12) & 0x0F
-        print("Control Word 1: {}{}".format(WordList[1],WordList[0]))
+        print("Control Word 1: {:04X}".format(iVal1))
         print("                Ch1: {}".format(dSelect[Ch1]))
         print("                Ch2: {}".format(dSelect[Ch2]))
         print("                Ch3: {}".format(dSelect[Ch3]))
         print("                Ch4: {}".format(dSelect[Ch4]))
-        print("Control Word 2: {}{}".format(WordList[3],WordList[2]))
+        print("Control Word 2: {:04X}".format(iVal2))
         if (iVal2 & 0x8000) != 0:
             print("                Run auto calibration on falling edge")
         if (iVal2 & 0x4000) != 0:
@@ -1735,7 +2712,7 @@ class TDAU():
             print("                Ch3 Base Leakage enabled")
         if (iVal2 & 0x0080) != 0:
             print("                Ch4 Base Leakage enabled")
-        print("Control Word 3: {}{}".format(WordList[5],WordList[4]))
+        print("Control Word 3: {:04X}".format(iVal3))
         if (iVal3 & 0x0200) != 0:
             print("                Temperature DAC digital mode enabled")
         else:
@@ -1755,87 +2732,31 @@ class TDAU():
             print("                BJT range checking enabled")
         if (iVal3 & 0x0300) == 0:
             print("                Temperature DAC: Ch{:d}".format((iVal3 & 0x03)+1))
-        print("Control Word 4: {}{}".format(WordList[7],WordList[6]))
+        print("Control Word 4: {:04X}".format(iVal4))
         if iVal4 != 0:
             print("                Single I Ch1: {}".format(dSelect[Ch1s]))
             print("                Single I Ch2: {}".format(dSelect[Ch2s]))
             print("                Single I Ch3: {}".format(dSelect[Ch3s]))
             print("                Single I Ch4: {}".format(dSelect[Ch4s]))
-        print("Trigger delay (seconds)  : {:d}".format(iVal5))
-        print("Sample interval (seconds): {:d}".format(iVal6))
-        print("Number of Samples to acq : {:d}".format(iVal7))
-        print("Measurement avg count    : {:d}".format(iVal8))
-        sReply = self.fnRdMemory(0x10)
-        WordList = sReply.split(" ")
-        sVal1 = "0x{}".format(WordList[0])
-        iVal1 = eval(sVal1)
-        sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-        iVal2 = eval(sVal2)
-        sVal3 = "0x{}{}".format(WordList[5],WordList[4])
-        iVal3 = eval(sVal3)
-        sVal4 = "0x{}".format(WordList[6])
-        iVal4 = eval(sVal4)
-        sVal5 = "0x{}{}".format(WordList[9],WordList[8])
-        iVal5 = eval(sVal5)
-        sVal6 = "0x{}{}".format(WordList[11],WordList[10])
-        iVal6 = eval(sVal6)
-        print("Temperature avg count    : {:d}".format(iVal1))
-        print("Base offset DAC default  : {:d}".format(iVal2))
-        print("Single I offset interval : {:d}".format(iVal3))
-        print("Single I offset samples  : {:d}".format(iVal4))
-        print("Temperature DAC offset   : {:d}".format(iVal5))
-        print("Temperature DAC slope    : {:d}".format(iVal6))
-        sReply = self.fnRdMemory(0x174)
-        WordList = sReply.split(" ")
-        sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-        iVal1 = (eval(sVal1))
-        fVal1 = iVal1 / 100.0
-        sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-        iVal2 = (eval(sVal2))
-        fVal2 = iVal2 / 100.0
-        print("Too Hot Threshhold       : {}  \tCat Hot Threshhold: {}".format(fVal1,fVal2))
-        sReply = self.fnRdMemory(0x3C)
-        WordList = sReply.split(" ")
-        sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-        iVal1 = (eval(sVal1))
-        fVal1 = iVal1 / 10.0
-        sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-        iVal2 = (eval(sVal2))
-        fVal2 = iVal2 / 10.0
-        sVal3 = "0x{}{}".format(WordList[5],WordList[4])
-        iVal3 = (eval(sVal3))
-        fVal3 = iVal3 / 10.0
-        sVal4 = "0x{}{}".format(WordList[7],WordList[8])
-        iVal4 = (eval(sVal4))
-        fVal4 = iVal4 / 10.0
-        print("Ch1 1 I slope   : {}".format(fVal1))
-        print("Ch2 1 I slope   : {}".format(fVal2))
-        print("Ch3 1 I slope   : {}".format(fVal3))
-        print("Ch4 1 I slope   : {}".format(fVal4))
-        for x in range(len(dConfig)):
-            sName1,iAddress1,sName2,iAddress2 = dConfig[x]
-            fVal1 = self.fnRdFloat(iAddress1)
-            sVal1 = self.fnEng(fVal1)
-            fVal2 = self.fnRdFloat(iAddress2)
-            sVal2 = self.fnEng(fVal2)
-            print("{}: {}  \t{}: {}".format(sName1,sVal1,sName2,sVal2))
+        print("Trigger delay (seconds)  : {:d}".format(dValue["Trigger Delay"]))
+        print("Sample interval (seconds): {:d}".format(dValue["Sampling Interval"]))
+        print("Number of Samples to acq : {:d}".format(dValue["Number of samples to acquire"]))
+        print("Measurement avg count    : {:d}".format(dValue["Measurement Averaging"]))
+        print("Temperature avg count    : {:d}".format(dValue["Temperature Averaging"]))
+        print("Base offset DAC default  : {:d}".format(dValue["Base Offset DAC Default"]))
+        print("Single I offset interval : {:d}".format(dValue["Single I Offset Sampling Interval"]))
+        print("Single I offset samples  : {:d}".format(dValue["Single I Offset Number of samples"]))
+        print("Temperature DAC offset   : {:d}".format(dValue["Temperature DAC Offset"]))
+        print("Temperature DAC slope    : {:d}".format(dValue["Temperature DAC Slope"]))
+        print("Too Hot Threshhold       : {}  \tCat Hot Threshhold: {}".format(dValue["Too Hot Threshold"],dValue["Catastrophic Threshold"]))
+        for x in range(1,5):
+            print("Ch{:d} 1 I slope   : {}".format(x,dValue["Ch{:d} Single I Slope".format(x)] / 10.0))
+        for sName1,sReg1,sName2,sReg2 in SHOW_CONFIG:
+            print("{}: {}  \t{}: {}".format(sName1,self.fnEng(dValue[sReg1]),sName2,self.fnEng(dValue[sReg2])))
         if iLevel < 1:
-            for x in range(len(dLimit)):
-                sName1,iAddress1,sName2,iAddress2 = dLimit[x]
-                fVal1 = self.fnRdFloat(iAddress1)
-                sVal1 = self.fnEng(fVal1)
-                fVal2 = self.fnRdFloat(iAddress2)
-                sVal2 = self.fnEng(fVal2)
-                print("{}: {}  \t{}: {}".format(sName1,sVal1,sName2,sVal2))
-        sReply = self.fnRdMemory(0x230)
-        WordList = sReply.split(" ")
-        sMonth = "0x{}".format(WordList[10])
-        iMonth = eval(sMonth)
-        sDay = "0x{}".format(WordList[11])
-        iDay = eval(sDay)
-        sYear = "0x{}{}".format(WordList[13],WordList[12])
-        iYear = eval(sYear)
-        print("Manufacture Date: {:d}-{:d}-{:04d}".format(iMonth,iDay,iYear))
+            for sName1,sReg1,sName2,sReg2 in SHOW_LIMITS:
+                print("{}: {}  \t{}: {}".format(sName1,self.fnEng(dValue[sReg1]),sName2,self.fnEng(dValue[sReg2])))
+        print("Manufacture Date: {:d}-{:d}-{:04d}".format(dValue["Month"],dValue["Date"],dValue["Year"]))
         return True
 
 # ---------- Display Dynamic Readings ----------
@@ -1847,112 +2768,26 @@ class TDAU():
                          1 = no limits
         Returns:    bool: True if successful
                           False if unsuccessful
+        Note:       Printed from one fnRdDynamic snapshot
         """
-        dDynamic =  {0:("Voltage A-D in1 (Ch1 Vbe1) ",0x240,0x464),
-                     1:("Voltage A-D in1 (Ch1 Vbe2) ",0x244,0x46C),
-                     2:("Voltage A-D in1 (Ch1 Vbe3) ",0x248,0x474),
-                     3:("Voltage A-D in2 (Ch2 Vbe1) ",0x24C,0x47E),
-                     4:("Voltage A-D in2 (Ch2 Vbe2) ",0x250,0x486),
-                     5:("Voltage A-D in2 (Ch2 Vbe3) ",0x254,0x48E),
-                     6:("Voltage A-D in3 (Ch3 Vbe1) ",0x258,0x498),
-                     7:("Voltage A-D in3 (Ch3 Vbe2) ",0x25C,0x4A0),
-                     8:("Voltage A-D in3 (Ch3 Vbe3) ",0x260,0x4A8),
-                     9:("Voltage A-D in4 (Ch4 Vbe1) ",0x264,0x4B2),
-                    10:("Voltage A-D in4 (Ch4 Vbe2) ",0x268,0x4BA),
-                    11:("Voltage A-D in4 (Ch4 Vbe3) ",0x26C,0x4C2),
-                    12:("Voltage A-D in5 (VbOs)     ",0x270,0x368),
-                    13:("Voltage A-D in6 (V@ie1)    ",0x274,0x36C),
-                    14:("Voltage A-D in6 (V@ie2)    ",0x278,0x370),
-                    15:("Voltage A-D in6 (V@ie3)    ",0x27C,0x374),
-                    16:("Voltage A-D in7 (FullScale)",0x280,0x378),
-                    17:("Voltage A-D in8 (V-Offset) ",0x284,0),
-                    18:("Voltage A-D (Int Offset)   ",0x288,0),
-                    19:("Voltage A-D (Int Supply)   ",0x28C,0x380),
-                    20:("Voltage A-D (Temperature)  ",0x290,0x384),
-                    21:("Voltage A-D (Internal Gain)",0x294,0x388),
-                    22:("Voltage A-D (External Ref) ",0x298,0x38C),
-                    23:("Voltage A-D (Factory Calib)",0x29C,0),
-                    24:("Current A-D in1 (Ch1 Ib1)  ",0x2A0,0x468),
-                    25:("Current A-D in1 (Ch1 Ib2)  ",0x2A4,0x470),
-                    26:("Current A-D in1 (Ch1 Ib3)  ",0x2A8,0x478),
-                    27:("Current A-D in2 (Ch2 Ib1)  ",0x2AC,0x482),
-                    28:("Current A-D in2 (Ch2 Ib2)  ",0x2B0,0x48A),
-                    29:("Current A-D in2 (Ch2 Ib3)  ",0x2B4,0x492),
-                    30:("Current A-D in3 (Ch3 Ib1)  ",0x2B8,0x49C),
-                    31:("Current A-D in3 (Ch3 Ib2)  ",0x2BC,0x4A4),
-                    32:("Current A-D in3 (Ch3 Ib3)  ",0x2C0,0x4AC),
-                    33:("Current A-D in4 (Ch4 Ib1)  ",0x2C4,0x4B6),
-                    34:("Current A-D in4 (Ch4 Ib2)  ",0x2C8,0x4BE),
-                    35:("Current A-D in4 (Ch4 Ib3)  ",0x2CC,0x4C6),
-                    36:("Current A-D in6 (Ch1@Ie1)  ",0x2D0,0x41C),
-                    37:("Current A-D in6 (Ch1@Ie2)  ",0x2D4,0x420),
-                    38:("Current A-D in6 (Ch1@Ie3)  ",0x2D8,0x424),
-                    39:("Current A-D in6 (Ch2@Ie1)  ",0x2DC,0x428),
-                    40:("Current A-D in6 (Ch2@Ie2)  ",0x2E0,0x42C),
-                    41:("Current A-D in6 (Ch2@Ie3)  ",0x2E4,0x430),
-                    42:("Current A-D in6 (Ch3@Ie1)  ",0x2E8,0x434),
-                    43:("Current A-D in6 (Ch3@Ie2)  ",0x2EC,0x438),
-                    44:("Current A-D in6 (Ch3@Ie3)  ",0x2F0,0x43C),
-                    45:("Current A-D in6 (Ch4@Ie1)  ",0x2F4,0x440),
-                    46:("Current A-D in6 (Ch4@Ie2)  ",0x2F8,0x444),
-                    47:("Current A-D in6 (Ch4@Ie3)  ",0x2FC,0x448),
-                    48:("Current A-D in7 (FullScale)",0x300,0x37C),
-                    49:("Current A-D in8 (I-Offset) ",0x304,0),
-                    50:("Current A-D (Int Offset)   ",0x308,0),
-                    51:("Current A-D (Int Supply)   ",0x30C,0),
-                    52:("Current A-D (Temperature)  ",0x310,0),
-                    53:("Current A-D (Internal Gain)",0x314,0x35C),
-                    54:("Current A-D (External Ref) ",0x318,0),
-                    55:("Current A-D (Factory Calib)",0x31C,0),
-                    56:("Raw DAC Leakage            ",0x334,0),
-                    57:("Voltage A-D in6 (10uA test)",0x338,0x3F0),
-                    58:("Voltage A-D in6 (175uA tst)",0x33C,0x3F4),
-                    59:("Current A-D in6 (10uA test)",0x340,0x3F8),
-                    60:("Current A-D in6 (175uA tst)",0x344,0x3FC),
-                    61:("Ch 1 Single I Offset       ",0,0x348),
-                    62:("Ch 2 Single I Offset       ",0,0x34C),
-                    63:("Ch 3 Single I Offset       ",0,0x350),
-                    64:("Ch 4 Single I Offset       ",0,0x354)}
-        dInternal = {0:("          uC A-D in1 +2P5A ",0x320,0x360),
-                     1:("          uC A-D in2 -2P5A ",0x322,0x362),
-                     2:("          uC A-D in3 +5A   ",0x324,0x364),
-                     3:("          uC A-D in4 +5D   ",0x326,0x366),
-                     4:("          uC A-D Int Vref  ",0x330,1),
-                     5:("          uC A-D Int offset",0x332,0)}
-        if not self.bCommEnabled:                    # Port not open
+        dDynamic = self.fnRdDynamic()
+        if dDynamic == False:
             return False
-        for x in range(len(dDynamic)):
-            sName,iADC,iFloat = dDynamic[x]
-            if iADC != 0:
-                sReply = self.fnRdMemory(iADC)
-                WordList = sReply.split(" ")
+        for sName,iADC,Raw,fFloat in dDynamic["ADC"]:
+            if Raw != None:
+                WordList = ["{:02X}".format(b) for b in Raw]
             else:
                 WordList = ["  ","  ","  ","  "]
-            if iFloat != 0:
-                fFloat1 = self.fnRdFloat(iFloat)
-                sFloat1 = self.fnEng(fFloat1)
+            if fFloat != None:
+                sFloat1 = self.fnEng(fFloat)
             else:
                 sFloat1 = ""
             print("{}: {} {}{}{}    {}".format(sName,WordList[0],WordList[1],WordList[2],WordList[3],sFloat1))
-        for x in range(len(dInternal)):
-            sName,iADC,iResult = dInternal[x]
-            sReply = self.fnRdMemory(iADC)
-            WordList1 = sReply.split(" ")
-            if iResult == 0:
-                print("{}: {}{}".format(sName,WordList1[1],WordList1[0]))
-            elif iResult == 1:
-                WordList2 = sReply.split(" ")
-                sVal1 = "0x{}{}".format(WordList2[1],WordList2[0])
-                iVal1 = eval(sVal1)
-                fVal1 = (iVal1 * 25.0) / 10000.0
-                print("{}: {}{}    {:f}".format(sName,WordList1[1],WordList1[0],fVal1))
+        for sName,iADC,iWord,fValue in dDynamic["Internal"]:
+            if fValue == None:
+                print("{}: {:04X}".format(sName,iWord))
             else:
-                sReply = self.fnRdMemory(iResult)
-                WordList2 = sReply.split(" ")
-                sVal1 = "0x{}{}".format(WordList2[1],WordList2[0])
-                iVal1 = eval(sVal1)
-                fVal1 = iVal1 / 10000.0
-                print("{}: {}{}    {:f}".format(sName,WordList1[1],WordList1[0],fVal1))
+                print("{}: {:04X}    {:f}".format(sName,iWord,fValue))
         return True
 
 # ---------- Display Factory configuration ----------
@@ -1964,29 +2799,8 @@ class TDAU():
                          1 = no limits
         Returns:    bool: True if successful
                           False if unsuccessful
+        Note:       Fields come from REG_MAP, read in one pass (REG_PROTECTED)
         """
-        dOffScale  = {0:("Voltage A-D in 1 Offset ",0x1A8,"Voltage A-D in 1 Scale",0x1B8),
-                      1:("Voltage A-D in 2 Offset ",0x1AA,"Voltage A-D in 2 Scale",0x1BC),
-                      2:("Voltage A-D in 3 Offset ",0x1AC,"Voltage A-D in 3 Scale",0x1C0),
-                      3:("Voltage A-D in 4 Offset ",0x1AE,"Voltage A-D in 4 Scale",0x1C4),
-                      4:("Voltage A-D in 5 Offset ",0x1B0,"Voltage A-D in 5 Scale",0x1C8),
-                      5:("Voltage A-D in 6 Offset ",0x1B2,"Voltage A-D in 6 Scale",0x1CC),
-                      6:("Voltage A-D in 7 Offset ",0x1B4,"Voltage A-D in 7 Scale",0x1D0),
-                      7:("Voltage A-D in 8 Offset ",0x1B6,"Voltage A-D in 8 Scale",0x1D4),
-                      8:("Current A-D in 1 Offset ",0x1D8,"Current A-D in 1 Scale",0x1E8),
-                      9:("Current A-D in 2 Offset ",0x1DA,"Current A-D in 2 Scale",0x1EC),
-                     10:("Current A-D in 3 Offset ",0x1DC,"Current A-D in 3 Scale",0x1F0),
-                     11:("Current A-D in 4 Offset ",0x1DE,"Current A-D in 4 Scale",0x1F4),
-                     12:("Current A-D in 5 Offset ",0x1E0,"Current A-D in 5 Scale",0x1F8),
-                     13:("Current A-D in 6 Offset ",0x1E2,"Current A-D in 6 Scale",0x1FC),
-                     14:("Current A-D in 7 Offset ",0x1E4,"Current A-D in 7 Scale",0x200),
-                     15:("Current A-D in 8 Offset ",0x1E6,"Current A-D in 8 Scale",0x204),
-                     16:("Current DAC Offset      ",0x198,"Current DAC Scale     ",0x19A),
-                     17:("Base DAC Offset         ",0x1A0,"Base DAC Scale        ",0x1A2),
-                     18:("Temperature DAC Offset  ",0x22C,"Temperature DAC Scale ",0x22E),
-                     19:("uC ADC internal Vref    ",0x19E,"",0)}
-        dProtect =   {0:("Voltage A-D Vref        ",0x184,"Voltage A-D FS Calib     ",0x188),
-                      1:("Current A-D Vref        ",0x18C,"Current A-D FS Calib     ",0x190)}
         if not self.bCommEnabled:                    # Port not open
             return False
         if type(iLevel) == str:
@@ -1995,89 +2809,34 @@ class TDAU():
                 iLevel = eval(sX)
             except:
                 iLevel = 0
-        for x in range(len(dOffScale)):
-            sName1,iAddress1,sName2,iAddress2 = dOffScale[x]
-            sReply = self.fnRdMemory(iAddress1)
-            WordList = sReply.split(" ")
-            sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-            iVal1 = eval(sVal1)
-            if (iVal1 & 0x8000) != 0:
-                iVal1 = (0x10000 - iVal1) * -1
-            if iAddress2 != 0:
-                fVal1 = self.fnRdFloat(iAddress2)
-                sVal1 = self.fnEng(fVal1)
-                print("{}: {} \t{}: {}".format(sName1,iVal1,sName2,sVal1))
+        Image = self.fnRdImage(REG_PROTECTED.Spans)
+        if Image == None:
+            return False
+        dValue = REG_PROTECTED.fnDecode(Image)
+        for sName1,sReg1,sName2,sReg2 in SHOW_OFFSCALE:
+            if sReg2 != None:
+                print("{}: {} \t{}: {}".format(sName1,dValue[sReg1],sName2,self.fnEng(dValue[sReg2])))
             else:
-                print("{}: {}".format(sName1,iVal1))
-        sReply = self.fnRdMemory(0x1A6)
-        WordList = sReply.split(" ")
-        sVal1s = "0x{}".format(WordList[0])
-        iVal1s = eval(sVal1s)
-        sVal1t = "0x{}".format(WordList[1])
-        iVal1t = eval(sVal1t)
-        if (iVal1s & 0x10) != 0:
-            iVal1t *= -1
-        iVal1s &= 0x0F
-        if (iVal1s & 0x10) != 0:
-            print("System Temperature Delta:-{}.{}".format(iVal1t,iVal1s))
-        else:
-            print("System Temperature Delta: {}.{}".format(iVal1t,iVal1s))
-        for x in range(len(dProtect)):
-            sName1,iAddress1,sName2,iAddress2 = dProtect[x]
-            fVal1 = self.fnRdFloat(iAddress1)
-            sVal1 = self.fnEng(fVal1)
-            fVal2 = self.fnRdFloat(iAddress2)
-            sVal2 = self.fnEng(fVal2)
-            print("{}: {} \t{}: {}".format(sName1,sVal1,sName2,sVal2))
+                print("{}: {}".format(sName1,dValue[sReg1]))
+        print("System Temperature Delta: {:.1f}".format(dValue["System Temperature Delta"]))
+        for sName1,sReg1,sName2,sReg2 in SHOW_VREF:
+            print("{}: {} \t{}: {}".format(sName1,self.fnEng(dValue[sReg1]),sName2,self.fnEng(dValue[sReg2])))
         if iLevel < 1:
-            sReply = self.fnRdMemory(0x208)
-            WordList = sReply.split(" ")
-            sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-            iVal1 = eval(sVal1)
-            sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-            iVal2 = eval(sVal2)
-            sVal3 = "0x{}{}".format(WordList[5],WordList[4])
-            iVal3 = eval(sVal3)
-            sVal4 = "0x{}{}".format(WordList[7],WordList[6])
-            iVal4 = eval(sVal4)
-            sVal5 = "0x{}{}".format(WordList[9],WordList[8])
-            iVal5 = eval(sVal5)
-            sVal6 = "0x{}{}".format(WordList[11],WordList[10])
-            iVal6 = eval(sVal6)
-            sVal7 = "0x{}{}".format(WordList[13],WordList[12])
-            iVal7 = eval(sVal7)
-            sVal8 = "0x{}{}".format(WordList[15],WordList[14])
-            iVal8 = eval(sVal8)
-            print("+2.5 PS Voltage Lo limit:  {:d}  \t\t+2.5 PS Voltage Hi limit :  {:d}".format(iVal1,iVal2))
-            print("-2.5 PS Voltage Lo limit:  {:d}  \t\t-2.5 PS Voltage Hi limit :  {:d}".format(iVal3,iVal4))
-            print("+5 A PS Voltage Lo limit:  {:d}  \t\t+5 A PS Voltage Hi limit :  {:d}".format(iVal5,iVal6))
-            print("+5 D PS Voltage Lo limit:  {:d}  \t\t+5 D PS Voltage Hi limit :  {:d}".format(iVal7,iVal8))
-            sReply = self.fnRdMemory(0x218)
-            WordList = sReply.split(" ")
-            sVal1 = "0x{}{}".format(WordList[1],WordList[0])
-            iVal1 = eval(sVal1)
-            sVal2 = "0x{}{}".format(WordList[3],WordList[2])
-            iVal2 = eval(sVal2)
-            print("Internal ADC Vref Lo Lim:  {:3d}  \t\tInternal ADC Vref H Limit: {:d}".format(iVal1,iVal2))
-            fVal1 = self.fnRdFloat(0x21C)
-            sVal1 = self.fnEng(fVal1)
-            fVal2 = self.fnRdFloat(0x220)
-            sVal2 = self.fnEng(fVal2)
-            print("10uA Resistance Lo Limit: {} \t 10uA Resistance Hi Limit:  {}".format(sVal1,sVal2))
-            fVal1 = self.fnRdFloat(0x224)
-            sVal1 = self.fnEng(fVal1)
-            fVal2 = self.fnRdFloat(0x228)
-            sVal2 = self.fnEng(fVal2)
-            print("175uA Resistance L Limit: {} \t175uA Resistance Hi Limit:  {}".format(sVal1,sVal2))
-        sReply = self.fnRdMemory(0x230)
-        WordList = sReply.split(" ")
-        sMonth = "0x{}".format(WordList[10])
-        iMonth = eval(sMonth)
-        sDay = "0x{}".format(WordList[11])
-        iDay = eval(sDay)
-        sYear = "0x{}{}".format(WordList[13],WordList[12])
-        iYear = eval(sYear)
-        print("Manufacture Date: {:d}-{:d}-{:04d}".format(iMonth,iDay,iYear))
+            print("+2.5 PS Voltage Lo limit:  {:d}  \t\t+2.5 PS Voltage Hi limit :  {:d}".format(
+                  dValue["+2.5v PS Voltage Lo-Limit"],dValue["+2.5v PS Voltage Hi-Limit"]))
+            print("-2.5 PS Voltage Lo limit:  {:d}  \t\t-2.5 PS Voltage Hi limit :  {:d}".format(
+                  dValue["-2.5v PS Voltage Lo-Limit"],dValue["-2.5v PS Voltage Hi-Limit"]))
+            print("+5 A PS Voltage Lo limit:  {:d}  \t\t+5 A PS Voltage Hi limit :  {:d}".format(
+                  dValue["+5v Analog PS Voltage Lo-Limit"],dValue["+5v Analog PS Voltage Hi-Limit"]))
+            print("+5 D PS Voltage Lo limit:  {:d}  \t\t+5 D PS Voltage Hi limit :  {:d}".format(
+                  dValue["+5v Digital PS Voltage Lo-Limit"],dValue["+5v Digital PS Voltage Hi-Limit"]))
+            print("Internal ADC Vref Lo Lim:  {:3d}  \t\tInternal ADC Vref H Limit: {:d}".format(
+                  dValue["Internal ADC VRef Lo-Limit"],dValue["Internal ADC VRef Hi-Limit"]))
+            print("10uA Resistance Lo Limit: {} \t 10uA Resistance Hi Limit:  {}".format(
+                  self.fnEng(dValue["10ua Test Resistance Lo Limit"]),self.fnEng(dValue["10ua Test Resistance Hi Limit"])))
+            print("175uA Resistance L Limit: {} \t175uA Resistance Hi Limit:  {}".format(
+                  self.fnEng(dValue["175ua Test Resistance Lo Limit"]),self.fnEng(dValue["175ua Test Resistance Hi Limit"])))
+        print("Manufacture Date: {:d}-{:d}-{:04d}".format(dValue["Month"],dValue["Date"],dValue["Year"]))
         return True
 
 # ---------- Display TDAU's temperature memory ----------
@@ -2087,45 +2846,55 @@ class TDAU():
         Parameters: None
         Returns:    bool: True if successful
                           False if unsuccessful
+        Note:       Fields come from REG_MAP, read in one pass (REG_TEMPERATURES)
         """
-        dTemps = {0:("Ch1 Cur  Min  Max  Avg",0x404),
-                  1:("Ch2 Cur  Min  Max  Avg",0x40A),
-                  2:("Ch3 Cur  Min  Max  Avg",0x410),
-                  3:("Ch4 Cur  Min  Max  Avg",0x416),
-                  4:("Ch1 Log  Min  Max  Avg",0x44C),
-                  5:("Ch2 Log  Min  Max  Avg",0x452),
-                  6:("Ch3 Log  Min  Max  Avg",0x458),
-                  7:("Ch4 Log  Min  Max  Avg",0x45E)}
         if not self.bCommEnabled:                    # Port not open
             return False
-        for x in range(len(dTemps)):
-            sName,iAddress = dTemps[x]
-            sReply = self.fnRdMemory(iAddress)
-            WordList = sReply.split(" ")
-            sVal1s = "0x{}".format(WordList[0])
-            iVal1s = eval(sVal1s)
-            sVal1t = "0x{}".format(WordList[1])
-            iVal1t = eval(sVal1t)
-            sVal2s = "0x{}".format(WordList[2])
-            iVal2s = eval(sVal2s)
-            sVal2t = "0x{}".format(WordList[3])
-            iVal2t = eval(sVal2t)
-            sVal3s = "0x{}".format(WordList[4])
-            iVal3s = eval(sVal3s)
-            sVal3t = "0x{}".format(WordList[5])
-            iVal3t = eval(sVal3t)
-            if (iVal1s & 0x10) != 0:
-                iVal1t *= -1
-            iVal1s &= 0x0F
-            if (iVal2s & 0x10) != 0:
-                iVal2t *= -1
-            iVal2s &= 0x0F
-            if (iVal3s & 0x10) != 0:
-                iVal3t *= -1
-            iVal3s &= 0x0F
-            print("{}: {}.{}  {}.{}  {}.{}".format(sName,iVal1t,iVal1s,iVal2t,iVal2s,iVal3t,iVal3s))
+        Image = self.fnRdImage(REG_TEMPERATURES.Spans)
+        if Image == None:
+            return False
+        dValue = REG_TEMPERATURES.fnDecode(Image)
+        for sName,sReg1,sReg2,sReg3 in SHOW_TEMPERATURES:
+            print("{}: {:.1f}  {:.1f}  {:.1f}".format(sName,dValue[sReg1],dValue[sReg2],dValue[sReg3]))
         return True
 
+# ---------- Save configuration image ----------
+    def fnSnapshot(self,sFile=None,iAddress=0,iLength=SHADOW_SIZE,PrintMode=False):
+        """
+        Save configuration image of user RAM with serial number and firmware
+        Parameters: string: file name (optional)
+                        *.json = JSON, anything else = binary (SNAP_HEADER)
+                        None = don't write a file DEFAULT
+                    16 bit int: first address (optional, default 0)
+                    int: quantity of bytes (optional, default configuration map)
+                    bool: display messages (optional)
+        Returns:    dict: {"Serial":int, "Firmware":str, "Address":int, "Data":bytes}
+                     OR bool: False if not connected/unreadable
+        Note:       Restore with fnRestoreSnapshot, compare with fnDiffSnapshot
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        iSerial = self.fnSerialNumber()
+        sFirmware = str(self.fnRdFWVersion())
+        Data = self.fnRdRange(iAddress,iLength)
+        if (iSerial == None) or ("." not in sFirmware) or (type(Data) != bytes):
+            print("Unable to read configuration")
+            return False
+        dSnap = {"Serial":iSerial,"Firmware":sFirmware,"Address":iAddress,"Data":Data}
+        if sFile != None:
+            if sFile.lower().endswith(".json"):
+                with open(sFile,"w") as hFile:
+                    json.dump({"serial":dSnap["Serial"],"firmware":sFirmware,
+                               "address":iAddress,"data":Data.hex()},hFile)
+            else:
+                iMajor,iMinor = [int(s) for s in sFirmware.split(".")]
+                with open(sFile,"wb") as hFile:
+                    hFile.write(struct.pack(SNAP_HEADER,SNAP_MAGIC,dSnap["Serial"],iMajor,iMinor,iAddress,len(Data)))
+                    hFile.write(Data)
+        if PrintMode:
+            print("Snapshot of TDAU {} FW {}: x{:04X} {:d} bytes".format(dSnap["Serial"],sFirmware,iAddress,len(Data)))
+        return dSnap
+
 # ---------- Start Conversion ----------
     def fnStartConversion(self,PrintMode=False):
         """
@@ -2142,9 +2911,64 @@ class TDAU():
         self.TxBuffer[0] = CMD_START
         self.TxCount = 1
         self.fnWrBuffer()
-        time.sleep(0.25)
         return self.fnRdReply(PrintMode)
 
+# ---------- Per-command latency and byte counters ----------
+    def fnStats(self,PrintMode=False):
+        """
+        Per-command latency and byte counters
+        Parameters: bool:  (optional)
+                        True = display table
+                        False = don't display messages DEFAULT
+        Returns:    dict: command byte (or "RAW"): {
+                        "Count": commands sent,
+                        "Sent", "Received": bytes,
+                        "Checksum": replies with bad checksum,
+                        "Insufficient": short/timed out replies,
+                        "Unknown": unrecognized reply codes,
+                        "Cond": {R_COND code: count} for codes other than C_PASS,
+                        "Write", "Sleep", "Wait", "Read": {"Count", "Total", "Max" (seconds),
+                            "Histogram": counts per STAT_BUCKETS bound + slower}}
+                     OR bool: False if counters not enabled
+        Note:       Returns a copy, counting goes on. Enable with fnStatsReset.
+        Example: {7: {'Count': 42, 'Sent': 168, 'Received': 756, ...}}
+        """
+        if self.Stats == None:
+            return False
+        Stats = copy.deepcopy(self.Stats)
+        if PrintMode:
+            print("Cmd    Count     Sent     Rcvd  Write ms  Sleep ms   Wait ms   Read ms    Max ms  CS Short Unkn Cond")
+            for Key in sorted(Stats,key=str):
+                Entry = Stats[Key]
+                LAvg = []
+                fMax = 0.0
+                for sPhase in STAT_PHASES:
+                    Phase = Entry[sPhase]
+                    LAvg.append((Phase["Total"] / Phase["Count"] * 1000) if Phase["Count"] else 0.0)
+                    fMax = max(fMax,Phase["Max"])
+                sCond = " ".join(["{}:{}".format(COND_NAME.get(iCond,"x{:02X}".format(iCond)),iCount)
+                                  for iCond,iCount in sorted(Entry["Cond"].items())])
+                print("{:<4} {:>7d} {:>8d} {:>8d} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>3d} {:>5d} {:>4d} {}".format(
+                      Key if type(Key) == str else "x{:02X}".format(Key),Entry["Count"],Entry["Sent"],
+                      Entry["Received"],LAvg[0],LAvg[1],LAvg[2],LAvg[3],fMax * 1000,Entry["Checksum"],
+                      Entry["Insufficient"],Entry["Unknown"],sCond))
+        return Stats
+
+# ---------- Enable/disable/clear per-command counters ----------
+    def fnStatsReset(self,bEnable=True):
+        """
+        Enable/disable/clear per-command counters
+        Parameters: bool: (optional)
+                        True = start counting from zero DEFAULT
+                        False = stop counting, discard counters
+        Returns:    bool: True
+        Note:       Disabled, the only cost is one test per frame sent and
+                    received.
+        """
+        self.Stats = {} if bEnable else None
+        self.StatsOpen = None
+        return True
+
 # ---------- Stop Conversion ----------
     def fnStopConversion(self,PrintMode=False):
         """
@@ -2161,9 +2985,65 @@ class TDAU():
         self.TxBuffer[0] = CMD_STOP
         self.TxCount = 1
         self.fnWrBuffer()
-        time.sleep(0.25)
         return self.fnRdReply(PrintMode)
 
+# ---------- Generator of temperature samples ----------
+    def fnStream(self,ChannelMap=15,fInterval=0.1,iQueue=1000):
+        """
+        Generator of temperature samples
+        Parameters: byte: ChannelMap (see fnRdTemperature) default 15
+                    float: seconds between reads (optional)
+                    int: max samples held for the consumer (optional)
+        Yields:     tuple: (time, channel, temperature, status)
+                      status: 0 = No errors, 1 = Conversion error
+                              2 = New conversion, 4 = System error
+        Note:       Starts conversion, then reads on a worker thread. When
+                    the queue is full the worker waits for the consumer.
+                    Closing the generator stops the worker and conversion.
+                    Don't send other commands to this TDAU while streaming.
+                    StreamErrors counts replies that could not be decoded.
+                    An exception on the worker (serial error, port
+                    closed) is raised here after the samples before it.
+        Example: for Sample in Tdau.fnStream(3,0.5): ...
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return
+        if (ChannelMap < 1) or (ChannelMap > 15):
+            return                                   # Must specify at least 1 channel
+        sReply = self.fnStartConversion()
+        if str(sReply) != "PASS":
+            print("Unable to start conversion: {}".format(sReply))
+            return
+        self.StreamErrors = 0
+        self.StreamException = None
+        qSamples = queue.Queue(iQueue)
+        evStop = threading.Event()
+        hWorker = threading.Thread(target=self.fnStreamWorker,
+                                   args=(ChannelMap,fInterval,qSamples,evStop),daemon=True)
+        hWorker.start()
+        try:
+            while True:
+                try:
+                    Sample = qSamples.get(timeout=0.5)
+                except queue.Empty:
+                    if not hWorker.is_alive():
+                        break                        # Worker stopped on its own
+                    continue
+                if Sample == None:
+                    break                            # Worker stopped on its own
+                yield Sample
+            if self.StreamException != None:
+                raise self.StreamException
+        finally:
+            evStop.set()
+            hWorker.join()
+            try:
+                self.fnStopConversion()
+            except Exception:
+                if self.StreamException == None:
+                    raise
+                # Port already failed, keep the worker's exception
+
 # ---------- Unlock ----------
     def fnUnlock(self,PrintMode=False):
         """
@@ -2180,9 +3060,54 @@ class TDAU():
         self.TxBuffer[0] = CMD_UNLK
         self.TxCount = 1
         self.fnWrBuffer()
-        time.sleep(0.25)
         return self.fnRdReply(PrintMode)
 
+# ---------- Write block of memory ----------
+    def fnWrBlock(self,iAddress,Data,PrintMode=False):
+        """
+        Write block of memory
+        Parameters: 16 bit int: first memory address
+                    tuple/list/bytes: int for each byte of data (any length)
+                    bool:  (optional)
+                       True = display messages
+                       False = don't display messages DEFAULT
+        Returns:    string: string from TDAU (first error if any)
+                     OR bool: False if not connected
+        Note:       Sent as CMD_WRMEM frames of up to 32 bytes
+        Example: fnWrBlock(0x54,struct.pack("<12f",*ForceCurrents))
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        iLen = len(Data)
+        if iLen == 0:
+            return False                             # No data to write
+        for x in range(0,iLen,WRMEM_MAX):
+            sReply = self.fnWrMemory(iAddress + x,Data[x:(x+WRMEM_MAX)],PrintMode)
+            if str(sReply) != "PASS":
+                break
+        return sReply
+
+# ---------- Write Float to memory ----------
+    def fnWrFloat(self,iAddress,fValue,PrintMode=False):
+        """
+        Write Float to memory
+        Parameters: 16 bit int: memory address
+                    string/float/int: value
+                    bool:  (optional)
+                       True = display messages
+                       False = don't display messages DEFAULT
+        Returns:    string: string from TDAU
+                     OR bool: False if not connected or bad value
+        Example: PASS
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        try:
+            fValue = float(fValue)
+        except:
+            return False
+        return self.fnWrMemory(iAddress,struct.pack("<f",fValue),PrintMode)
+
 # ---------- Write FirmWare to TDAU ----------
     def fnWrFWUpdate(self,sFileName=None,iMode=1):
         """
@@ -2232,7 +3157,7 @@ class TDAU():
         self.fnWrBuffer()
         time.sleep(0.250)
         sStatus = self.fnRdReply()
-        if sStatus != "PASS":
+        if str(sStatus) != "PASS":
             print("TDAU Error")
             return False
         self.hTDAU.apply_settings({'write_timeout':30})  # Change timeouts to 30 seconds
@@ -2323,7 +3248,8 @@ class TDAU():
         """
         Write Memory
         Parameters: 16 bit int: memory address
-                    tuple: int for each byte of data
+                    int: single byte of data
+                     OR tuple/list/bytes: int for each byte of data (max 32)
                     bool:  (optional)
                        True = display messages
                        False = don't display messages DEFAULT
@@ -2335,31 +3261,40 @@ class TDAU():
         """
         if not self.bCommEnabled:                    # Port not open
             return False
-        #iQuan = len(tData)
-        iQuan = 1
-        if iQuan == 0:
-            return False                             # No data to write
-        if (iQuan+6) > len(self.TxBuffer):
-            print("Writing too much data (max = 32 bytes)")
+        iQuan = self.fnBuildWrMemory(iAddress,tData)
+        if not iQuan:
             return False
-        iCS = iQuan
-        self.TxBuffer[3] = iQuan
-        iTemp = (iAddress & 0xFF)
-        iCS += iTemp
-        self.TxBuffer[1] = iTemp                     # Address
-        iTemp = ((iAddress >> 8) & 0xFF)
-        iCS += iTemp
-        self.TxBuffer[2] = iTemp
-        iCS += CMD_WRMEM
-        self.TxBuffer[0] = CMD_WRMEM                 # Command
-        for x in range(0,iQuan,1):
-            self.TxBuffer[(x+4)] = tData #[x]
-            iCS += tData #[x]
-        self.TxBuffer[(4+iQuan)] = (iCS & 0xFF)
-        self.TxCount = iQuan+5
         self.fnWrBuffer()
-        time.sleep(0.25)
-        return self.fnRdReply(PrintMode)
+        sReply = self.fnRdReply(PrintMode)
+        if str(sReply) == "PASS":
+            self.fnShadowPut(iAddress,self.TxBuffer[4:(4+iQuan)],True)
+        else:
+            self.fnShadowInvalidate(iAddress,iQuan)
+        return sReply
+
+# ---------- Write 16 bit int to memory ----------
+    def fnWrWord(self,iAddress,iValue,PrintMode=False):
+        """
+        Write 16 bit int to memory
+        Parameters: 16 bit int: memory address
+                    string/int: value (0 to 0xFFFF, or -0x8000 to 0x7FFF)
+                    bool:  (optional)
+                       True = display messages
+                       False = don't display messages DEFAULT
+        Returns:    string: string from TDAU
+                     OR bool: False if not connected or bad value
+        Example: PASS
+        """
+        if not self.bCommEnabled:                    # Port not open
+            return False
+        if type(iValue) == str:
+            try:
+                iValue = eval(iValue)
+            except:
+                return False
+        if (type(iValue) != int) or (iValue < -0x8000) or (iValue > 0xFFFF):
+            return False
+        return self.fnWrMemory(iAddress,(iValue & 0xFF,(iValue >> 8) & 0xFF),PrintMode)
 
 
 # =================== SUBROUTINES ===================
@@ -2382,6 +3317,190 @@ class TDAU():
             return (Value - 48)                      # Number 0 to 9
         return (Value - 55)                          # A to F
 
+# ---------- Read spans of user RAM into one image ----------
+    def fnRdImage(self,LSpans):
+        """
+        INTERNAL USE ONLY: Read spans of user RAM into one image
+        Parameters: list: (address, length) of each span needed
+        Returns:    bytearray: copy of user RAM from address 0 (only the
+                               spans are read, other bytes are 0)
+                     OR None upon error
+        """
+        Image = bytearray(max([iStart + iLength for iStart,iLength in LSpans]))
+        for iStart,iLength in self.fnPlanWindows(LSpans):
+            Block = self.fnRdRange(iStart,iLength)
+            if type(Block) != bytes:
+                print("Unable to read x{:04X}".format(iStart))
+                return None
+            Image[iStart:(iStart+iLength)] = Block
+        return Image
+
+# ---------- Spans where two images differ ----------
+    def fnChangedSpans(self,Old,New):
+        """
+        INTERNAL USE ONLY: Spans where two images differ
+        Parameters: bytes: first image
+                    bytes: second image (same length)
+        Returns:    list: (offset, quantity) for each contiguous changed span
+        """
+        LSpans = []
+        iStart = None
+        for x in range(len(Old) + 1):
+            if (x < len(Old)) and (Old[x] != New[x]):
+                if iStart == None:
+                    iStart = x
+            elif iStart != None:
+                LSpans.append((iStart,x - iStart))
+                iStart = None
+        return LSpans
+
+# ---------- Serial number as int ----------
+    def fnSerialNumber(self):
+        """
+        INTERNAL USE ONLY: Serial number as int
+        Parameters: None
+        Returns:    int: serial number
+                     OR None if it could not be read
+        Note:       Works with and without bTypedReplies
+        """
+        Serial = self.fnRdSerialNumber()
+        if type(Serial) == ReplySerial:
+            return Serial.Serial
+        if type(Serial) == int:
+            return Serial
+        return None                                  # Error string, ReplyRaw, ReplyCond or False
+
+# ---------- Read configuration snapshot ----------
+    def fnSnapshotLoad(self,Snapshot):
+        """
+        INTERNAL USE ONLY: Read configuration snapshot
+        Parameters: dict: from fnSnapshot
+                     OR string: file written by fnSnapshot
+        Returns:    dict: as fnSnapshot
+                     OR None if unreadable
+        """
+        if type(Snapshot) == dict:
+            return Snapshot
+        try:
+            if Snapshot.lower().endswith(".json"):
+                with open(Snapshot,"r") as hFile:
+                    dFile = json.load(hFile)
+                return {"Serial":dFile["serial"],"Firmware":dFile["firmware"],
+                        "Address":dFile["address"],"Data":bytes.fromhex(dFile["data"])}
+            with open(Snapshot,"rb") as hFile:
+                Header = hFile.read(struct.calcsize(SNAP_HEADER))
+                sMagic,iSerial,iMajor,iMinor,iAddress,iLength = struct.unpack(SNAP_HEADER,Header)
+                Data = hFile.read(iLength)
+        except Exception as e:
+            print("Unable to read snapshot {}: {}".format(Snapshot,e))
+            return None
+        if (sMagic != SNAP_MAGIC) or (len(Data) != iLength):
+            print("{} is not a TDAU snapshot".format(Snapshot))
+            return None
+        return {"Serial":iSerial,"Firmware":"{}.{}".format(iMajor,iMinor),"Address":iAddress,"Data":Data}
+
+# ---------- Minimal read windows covering spans ----------
+    def fnPlanWindows(self,LSpans,iWindow=16):
+        """
+        INTERNAL USE ONLY: Minimal read windows covering every span
+        Parameters: list: (address, length) of each span needed
+                    int: max bytes per read (optional)
+        Returns:    list: (address, length) of each read, in address order
+        Note:       Each window starts at the lowest byte not yet covered and
+                    ends at the last needed byte within iWindow, so no read
+                    goes past what was asked for
+        """
+        LNeeded = sorted(set([x for iStart,iLength in LSpans for x in range(iStart,iStart+iLength)]))
+        LWindows = []
+        i = 0
+        while i < len(LNeeded):
+            iStart = LNeeded[i]
+            while (i < len(LNeeded)) and (LNeeded[i] < iStart + iWindow):
+                i += 1
+            LWindows.append((iStart,LNeeded[i-1] - iStart + 1))
+        return LWindows
+
+# ---------- Build read memory command in TxBuffer ----------
+    def fnBuildRdMemory(self,iAddress,iQuan=16,iType=4):
+        """
+        INTERNAL USE ONLY: Build read memory command in TxBuffer
+        Parameters: 16 bit int: memory address
+                    int: quantity of bytes to read (1-16, type 4 only)
+                    int: memory type/map (see fnRdMemory)
+        Returns:    int: expected length of reply
+        Note:        0         1       2       3
+                    <command> <addrL> <addrH> [quan]
+        """
+        TxCmd,CountRx,self.TxCount,sRegion = MEM_MAP[iType]
+        self.TxBuffer[0] = TxCmd                     # Command to send
+        self.TxBuffer[1] = (iAddress & 0xFF)         # Address
+        self.TxBuffer[2] = ((iAddress >> 8) & 0xFF)
+        self.TxBuffer[3] = iQuan                     # Quantity of bytes to read (type 4 only)
+        if iType == 4:
+            CountRx = iQuan + 2                      # R_MEM + data + CS
+        return CountRx
+
+# ---------- Build save memory command in TxBuffer ----------
+    def fnBuildSaveMemory(self,iAddress,iQuan):
+        """
+        INTERNAL USE ONLY: Build save memory command in TxBuffer
+        Parameters: 16 bit int: memory address
+                    8 bit int: quantity of bytes to save
+        Returns:    bool: True
+        Note:        0         1       2       3      4
+                    <command> <addrL> <addrH> <quan> <CS>
+        """
+        iCS = iQuan
+        self.TxBuffer[3] = iQuan
+        iTemp = (iAddress & 0xFF)                    # Low half of address
+        iCS += iTemp
+        self.TxBuffer[1] = iTemp                     # Address L
+        iTemp = ((iAddress >> 8) & 0xFF)             # High half of address
+        iCS += iTemp
+        self.TxBuffer[2] = iTemp                     # Address H
+        iCS += CMD_SAVEM
+        self.TxBuffer[0] = CMD_SAVEM                 # Command
+        self.TxBuffer[4] = (iCS & 0xFF)              # CS
+        self.TxCount = 5                             # Number of chars to send
+        return True
+
+# ---------- Build write memory command in TxBuffer ----------
+    def fnBuildWrMemory(self,iAddress,tData):
+        """
+        INTERNAL USE ONLY: Build write memory command in TxBuffer
+        Parameters: 16 bit int: memory address
+                    int: single byte of data
+                     OR tuple/list/bytes: int for each byte of data (max 32)
+        Returns:    int: quantity of bytes in command
+                     OR bool: False if nothing/too much to write
+        Note:        0         1       2       3      4
+                    <command> <addrL> <addrH> <quan> <data> <CS>
+        """
+        if type(tData) == int:
+            tData = (tData,)                         # Single byte
+        iQuan = len(tData)
+        if iQuan == 0:
+            return False                             # No data to write
+        if iQuan > WRMEM_MAX:
+            print("Writing too much data (max = {:d} bytes)".format(WRMEM_MAX))
+            return False
+        iCS = iQuan
+        self.TxBuffer[3] = iQuan
+        iTemp = (iAddress & 0xFF)
+        iCS += iTemp
+        self.TxBuffer[1] = iTemp                     # Address
+        iTemp = ((iAddress >> 8) & 0xFF)
+        iCS += iTemp
+        self.TxBuffer[2] = iTemp
+        iCS += CMD_WRMEM
+        self.TxBuffer[0] = CMD_WRMEM                 # Command
+        for x in range(0,iQuan,1):
+            self.TxBuffer[(x+4)] = (tData[x] & 0xFF)
+            iCS += (tData[x] & 0xFF)
+        self.TxBuffer[(4+iQuan)] = (iCS & 0xFF)
+        self.TxCount = iQuan+5
+        return iQuan
+
 # ---------- Convert float of time into d h:mm:ss ----------
     def fnCalcTime(self,fTime,bForce=False):
         """
@@ -2442,6 +3561,317 @@ class TDAU():
             print
         return True  # !!!
 
+# ---------- Decode temperature reply ----------
+    def fnDecodeTemperatures(self,RxChars):
+        """
+        INTERNAL USE ONLY: Decode R_STAT1-R_STAT4 reply
+        Parameters: list: int for each byte received
+        Returns:    list: (temperature, status) for each channel in reply
+                     OR None if not a complete temperature reply
+        Note:       Per channel: <sign.status.decimal> <integer degrees>
+        """
+        Count = len(RxChars)
+        if (Count < 4) or (RxChars[0] not in (R_STAT1,R_STAT2,R_STAT3,R_STAT4)):
+            return None
+        if (sum(RxChars[0:(Count-1)]) & 0xFF) != RxChars[(Count-1)]:
+            return None                              # Checksum error
+        LTemps = []
+        for i in range(0,(Count-2) // 2,1):
+            iFlags = RxChars[((i*2)+1)]
+            iDecimal = min(iFlags & 0x0F,9)
+            fTemperature = ((RxChars[((i*2)+2)] * 10) + iDecimal) / 10
+            if (iFlags & 0x10) != 0:
+                fTemperature = 0 - fTemperature      # Negative number
+            LTemps.append((fTemperature,(iFlags >> 4) & 0x0E))
+        return LTemps
+
+# ---------- Read temperatures for fnStream ----------
+    def fnStreamWorker(self,ChannelMap,fInterval,qSamples,evStop):
+        """
+        INTERNAL USE ONLY: Read temperatures for fnStream (worker thread)
+        Parameters: byte: ChannelMap
+                    float: seconds between reads
+                    queue.Queue: samples for the consumer
+                    threading.Event: set by consumer to stop
+        Returns:    None
+        """
+        LChannels = [x+1 for x in range(4) if (ChannelMap >> x) & 0x01]
+        tNext = time.time()
+        try:
+            while not evStop.is_set():
+                self.TxBuffer[0] = 0x10 | ChannelMap
+                self.TxCount = 1
+                self.fnWrBuffer(0)
+                RxChars = self.fnRdFrame()
+                fTime = time.time()
+                LTemps = self.fnDecodeTemperatures(RxChars)
+                if (LTemps == None) or (len(LTemps) != len(LChannels)):
+                    self.StreamErrors += 1
+                else:
+                    for x in range(len(LChannels)):
+                        Sample = (fTime,LChannels[x],LTemps[x][0],LTemps[x][1])
+                        while not evStop.is_set():
+                            try:
+                                qSamples.put(Sample,timeout=0.1)
+                                break
+                            except queue.Full:
+                                continue     # Consumer is behind, wait for it
+                tNext += fInterval
+                fWait = tNext - time.time()
+                if fWait > 0:
+                    evStop.wait(fWait)
+                else:
+                    tNext = time.time()      # Running late, don't try to catch up
+        except Exception as e:
+            self.StreamException = e         # fnStream raises it at the end marker
+        finally:
+            while True:                      # End marker wakes consumer if worker ended first
+                try:
+                    qSamples.put(None,timeout=0.1)
+                    break
+                except queue.Full:
+                    if evStop.is_set():
+                        break                # Consumer is closing, won't read it
+        return None
+
+# ---------- Convert received bytes to string of hex characters ----------
+    def fnFrame2Asc(self,RxChars):
+        """
+        INTERNAL USE ONLY: Convert received bytes to string of hex characters
+        Parameters: list: int for each byte received
+        Returns:    string: "xx " for each byte
+        """
+        return "".join(["{:02x} ".format(RxChar) for RxChar in RxChars])
+
+# ---------- Return total length of reply frame ----------
+    def fnFrameLength(self,RxChars,iLength=0):
+        """
+        INTERNAL USE ONLY: Return total length of reply frame
+        Parameters: list: int for each byte received so far (at least 1)
+                    int: expected length of R_MEM reply (optional)
+        Returns:    int: number of bytes in complete frame
+                     OR None if reply code is not recognized
+        """
+        iCode = RxChars[0]
+        if iCode in REPLY_LEN:
+            return REPLY_LEN[iCode]
+        if iCode == R_MEM:
+            if iLength != 0:
+                return iLength
+            return 18                                # 16 bytes of user RAM + CS
+        if iCode == R_LOG:
+            if len(RxChars) < 3:
+                return 3                             # Need REP Quan Size first
+            return (RxChars[1] * RxChars[2]) + 4     # Plus REP Quan Size CS
+        return None
+
+# ---------- Read one reply frame from TDAU ----------
+    def fnRdFrame(self,iLength=0,fTimeout=None):
+        """
+        INTERNAL USE ONLY: Read one reply frame from TDAU
+        Parameters: int: expected length of R_MEM reply (optional)
+                    float: seconds to wait for complete frame (optional)
+                        None = dReplyTimeout of command in TxBuffer[0],
+                               else ReplyTimeout
+        Returns:    list: int for each byte received
+        Note:       Returns as soon as the checksum byte arrives. A partial
+                    frame is returned if the deadline expires. After a
+                    partial or unknown frame the input buffer is flushed
+                    so the rest of it can't be taken as the next reply.
+        """
+        if fTimeout == None:
+            fTimeout = self.dReplyTimeout.get(self.TxBuffer[0],self.ReplyTimeout)
+        tDeadline = time.time() + fTimeout
+        RxChars = []
+        iTotal = 1                                   # Reply code tells the rest
+        tFirst = None                                # First byte arrived (fnStats only)
+        while len(RxChars) < iTotal:
+            iWaiting = self.hTDAU.inWaiting()
+            if iWaiting == 0:
+                if time.time() >= tDeadline:
+                    break                            # Deadline expired
+                time.sleep(0.001)
+                continue
+            if (tFirst == None) and (self.Stats != None):
+                tFirst = time.perf_counter()
+            Rx = self.hTDAU.read(min(iWaiting,iTotal - len(RxChars)))
+            RxChars.extend(bytearray(Rx))
+            iTotal = self.fnFrameLength(RxChars,iLength)
+            if iTotal == None:                       # Unknown reply, drain it
+                time.sleep(0.05)
+                RxChars.extend(bytearray(self.hTDAU.read(self.hTDAU.inWaiting())))
+                break
+        if (iTotal == None) or (len(RxChars) < iTotal):
+            self.hTDAU.reset_input_buffer()          # Late or unknown reply, resync
+        if self.Stats != None:
+            self.fnStatsReply(RxChars,iTotal,iLength,tFirst)
+        return RxChars
+
+# ---------- Count command written for fnStats ----------
+    def fnStatsWrite(self,LsCommand,tStart,tWritten,bSleep):
+        """
+        INTERNAL USE ONLY: Count command written for fnStats
+        Parameters: bytes/list: frame written
+                    float: time.perf_counter() before the write
+                    float: time.perf_counter() after the write
+                    bool: True if fnWrSerialPort slept after the write
+        Returns:    bool: True
+        """
+        tEnd = time.perf_counter()
+        Key = "RAW"
+        if (len(LsCommand) > 1) and (LsCommand[0] == SLAVE):
+            Key = LsCommand[1]
+        Entry = self.fnStatsEntry(Key)
+        Entry["Count"] += 1
+        Entry["Sent"] += len(LsCommand)
+        self.fnStatsTime(Entry,"Write",tWritten - tStart)
+        if bSleep:
+            self.fnStatsTime(Entry,"Sleep",tEnd - tWritten)
+        self.StatsOpen = (Key,Entry,tEnd)
+        return True
+
+# ---------- Count reply frame for fnStats ----------
+    def fnStatsReply(self,RxChars,iTotal,iLength,tFirst):
+        """
+        INTERNAL USE ONLY: Count reply frame for fnStats
+        Parameters: list: int for each byte received
+                    int: frame length from fnFrameLength (None = unknown code)
+                    int: expected length of R_MEM reply (see fnRdFrame)
+                    float: time.perf_counter() at first byte, None if none came
+        Returns:    bool: True
+        Note:       Reply is charged to the last command written. Wait runs
+                    from the end of the delay after that write. Whether
+                    the frame has a checksum follows from the command.
+        """
+        tEnd = time.perf_counter()
+        if self.StatsOpen != None:
+            Key,Entry,tWritten = self.StatsOpen
+        else:                                        # Read without a write
+            Key = self.TxBuffer[0]
+            Entry,tWritten = self.fnStatsEntry(Key),None
+        self.StatsOpen = None
+        Entry["Received"] += len(RxChars)
+        if tWritten != None:
+            self.fnStatsTime(Entry,"Wait",(tEnd if tFirst == None else tFirst) - tWritten)
+        if tFirst != None:
+            self.fnStatsTime(Entry,"Read",tEnd - tFirst)
+        Count = len(RxChars)
+        if iTotal == None:
+            Entry["Unknown"] += 1
+        elif (Count < 3) or (Count < iTotal):
+            Entry["Insufficient"] += 1
+        elif (RxChars[0] == R_MEM) and (Key in STAT_NOCS):
+            pass                                     # SRAM/flash pages carry no checksum
+        elif (sum(RxChars[0:(iTotal-1)]) & 0xFF) != RxChars[(iTotal-1)]:
+            Entry["Checksum"] += 1
+        elif (RxChars[0] == R_COND) and (RxChars[1] != C_PASS):
+            Entry["Cond"][RxChars[1]] = Entry["Cond"].get(RxChars[1],0) + 1
+        return True
+
+# ---------- Counters of one command for fnStats ----------
+    def fnStatsEntry(self,Key):
+        """
+        INTERNAL USE ONLY: Counters of one command for fnStats
+        Parameters: int: command byte
+                     OR string: "RAW"
+        Returns:    dict: counters (see fnStats), created empty if new
+        """
+        Entry = self.Stats.get(Key)
+        if Entry == None:
+            Entry = {"Count":0,"Sent":0,"Received":0,"Checksum":0,"Insufficient":0,"Unknown":0,"Cond":{}}
+            for sPhase in STAT_PHASES:
+                Entry[sPhase] = {"Count":0,"Total":0.0,"Max":0.0,"Histogram":[0] * (len(STAT_BUCKETS) + 1)}
+            self.Stats[Key] = Entry
+        return Entry
+
+# ---------- Add one phase time for fnStats ----------
+    def fnStatsTime(self,Entry,sPhase,fSeconds):
+        """
+        INTERNAL USE ONLY: Add one phase time for fnStats
+        Parameters: dict: counters from fnStatsEntry
+                    string: "Write", "Wait" or "Read"
+                    float: seconds
+        Returns:    bool: True
+        """
+        Phase = Entry[sPhase]
+        Phase["Count"] += 1
+        Phase["Total"] += fSeconds
+        Phase["Max"] = max(Phase["Max"],fSeconds)
+        Phase["Histogram"][bisect.bisect_left(STAT_BUCKETS,fSeconds)] += 1
+        return True
+
+# ---------- Get bytes from host copy of user RAM ----------
+    def fnShadowGet(self,iAddress,iQuan):
+        """
+        INTERNAL USE ONLY: Get bytes from host copy of user RAM
+        Parameters: 16 bit int: memory address
+                    int: quantity of bytes
+        Returns:    bytes: cached contents
+                     OR None if not enabled or not every byte is cached
+        """
+        if self.Shadow == None:
+            return None
+        iEnd = iAddress + iQuan
+        if (iAddress < 0) or (iEnd > SHADOW_SIZE):
+            return None                              # Dynamic memory is never cached
+        if 0 in self.ShadowValid[iAddress:iEnd]:
+            return None
+        return bytes(self.Shadow[iAddress:iEnd])
+
+# ---------- Put bytes in host copy of user RAM ----------
+    def fnShadowPut(self,iAddress,Data,bDirty=False):
+        """
+        INTERNAL USE ONLY: Put bytes in host copy of user RAM
+        Parameters: 16 bit int: memory address
+                    list/bytes: byte values read from or written to TDAU
+                    bool: True if written to RAM and not yet saved (optional)
+        Returns:    bool: True
+        """
+        if self.Shadow == None:
+            return True
+        for x in range(len(Data)):
+            iByte = iAddress + x
+            if (iByte < 0) or (iByte >= SHADOW_SIZE):
+                continue                             # Outside cached span
+            self.Shadow[iByte] = Data[x] & 0xFF
+            self.ShadowValid[iByte] = 1
+            if bDirty:
+                self.ShadowDirty[iByte] = 1
+        return True
+
+# ---------- Empty host copy of user RAM ----------
+    def fnShadowClear(self):
+        """
+        INTERNAL USE ONLY: Empty host copy of user RAM, keep it enabled
+        Parameters: None
+        Returns:    bool: True
+        Note:       Used when the port is opened, attached or closed, so a
+                    copy (and its unsaved spans) never outlives the unit
+                    it was read from
+        """
+        if self.Shadow == None:
+            return True
+        self.fnShadowInvalidate()
+        self.ShadowDirty[:] = bytes(SHADOW_SIZE)
+        return True
+
+# ---------- Invalidate host copy of user RAM ----------
+    def fnShadowInvalidate(self,iAddress=0,iQuan=SHADOW_SIZE):
+        """
+        INTERNAL USE ONLY: Invalidate host copy of user RAM
+        Parameters: 16 bit int: memory address (optional)
+                    int: quantity of bytes (optional)
+                        Default is the whole copy
+        Returns:    bool: True
+        """
+        if self.Shadow == None:
+            return True
+        iStart = max(iAddress,0)
+        iEnd = min(iAddress + iQuan,SHADOW_SIZE)
+        for x in range(iStart,iEnd,1):
+            self.ShadowValid[x] = 0
+        return True
+
 # ---------- Convert hex nibble to ASCII character ----------
     def fnHex2Asc(self,Byte,Upper=False):
         """
@@ -2477,40 +3907,62 @@ class TDAU():
         return xx
 
 # ---------- Write Buffer to TDAU ----------
-    def fnWrBuffer(self):
+    def fnWrBuffer(self,fDelay=0.050):
         """
         INTERNAL USE ONLY: Write Buffer to TDAU
-        Parameters: None
+        Parameters: float: seconds to delay after write (optional)
         Returns:    bool: True
         """
         bDebug = False
-        sWrite = str(chr(SLAVE))
-        for x in range(0,self.TxCount,1):
-            TxChar = chr(self.TxBuffer[x])
-            sWrite += str(TxChar)
-        self.fnWrSerialPort(sWrite)
+        TxFrame = self.fnTxFrame()
+        self.fnWrSerialPort(TxFrame,fDelay)
         if bDebug:
-            print(sWrite)
+            print(self.fnFrame2Asc(TxFrame))
         return True
 
+# ---------- Return TxBuffer as frame to send ----------
+    def fnTxFrame(self):
+        """
+        INTERNAL USE ONLY: Return TxBuffer as frame to send
+        Parameters: None
+        Returns:    bytes: <slave> followed by TxCount bytes of TxBuffer
+        """
+        return bytes([SLAVE] + self.TxBuffer[0:self.TxCount])
+
 # ---------- Write to Serial Port and delay ----------
-    def fnWrSerialPort(self,sCommand):
+    def fnWrSerialPort(self,sCommand,fDelay=0.050):
         """
         Write to Serial Port and delay 50mS
         Parameters: string: raw string to send
+                     OR bytes: frame to send
+                    float: seconds to delay after write (optional)
         Returns:    bool: True if successful
                           False if unsuccessful
-        """
-        if type(sCommand) != str:
+        Note:       Unread bytes (a late reply to an earlier command) are
+                    discarded before the write
+        """
+        if type(sCommand) == bytes:
+            LsCommand = sCommand
+        elif type(sCommand) == str:
+            LsCommand = []
+            for x in range(len(sCommand)):
+                LsCommand.append(ord(sCommand[x:x+1]))
+        else:
             return False
-        iLen = len(sCommand)
-        if iLen == 0:
+        if len(LsCommand) == 0:
             return True
-        LsCommand = []
-        for x in range(iLen):
-            LsCommand.append(ord(sCommand[x:x+1]))
+        self.hTDAU.reset_input_buffer()              # Drop late replies
+        if self.Stats == None:
+            self.hTDAU.write(LsCommand)
+            if fDelay != 0:
+                time.sleep(fDelay)
+            return True
+        tStart = time.perf_counter()
         self.hTDAU.write(LsCommand)
-        time.sleep(0.050)
+        tWritten = time.perf_counter()
+        if fDelay != 0:
+            time.sleep(fDelay)
+        self.fnStatsWrite(LsCommand,tStart,tWritten,fDelay != 0)
         return True
 
 # ---------- Convert Float to Hex ----------
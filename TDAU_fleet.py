@@ -0,0 +1,160 @@
+# ---------- TDAU Fleet Module
+# Owns several connected TDAUs and polls their channel maps in parallel,
+# one worker thread per port. Results from all units are merged into one
+# timestamped stream keyed by (serial number, channel), so a sweep takes
+# as long as the slowest unit rather than the sum of all units.
+#
+# Functions in this module:
+#           fnAdd()                              Add an already connected TDAU
+#           fnConnect()                          Connect a TDAU and add it
+#           fnDisconnect()                       Disconnect all units
+#           fnStream()                           Generator of samples from repeated sweeps
+#           fnSweep()                            Read every unit once, in parallel
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import TDAU_c
+
+
+class TDAUFleet():
+    def __init__(self):
+        self.Module_Name = "TDAUFleet"
+        self.LUnits = []                         # [TDAU, serial number, channel map] per unit
+        self.hPool = None                        # One worker per unit
+        self.LastSweepTime = 0.0                 # Seconds taken by last fnSweep
+        return
+
+# ---------- Add an already connected TDAU ----------
+    def fnAdd(self,Unit,ChannelMap=15):
+        """
+        Add an already connected TDAU
+        Parameters: TDAU_c.TDAU: connected unit
+                    int: ChannelMap to poll (see TDAU.fnRdTemperature) default 15
+        Returns:    int: serial number of unit
+                     OR bool: False if serial number can't be read
+        """
+        iSerial = Unit.fnRdSerialNumber()
+        if type(iSerial) == TDAU_c.ReplySerial:  # Unit has bTypedReplies set
+            iSerial = iSerial.Serial
+        if type(iSerial) != int:
+            print("Unable to read TDAU serial number: {}".format(iSerial))
+            return False
+        self.LUnits.append([Unit,iSerial,ChannelMap])
+        self.fnResetPool()
+        return iSerial
+
+# ---------- Connect a TDAU and add it ----------
+    def fnConnect(self,COMPort,ChannelMap=15):
+        """
+        Connect a TDAU and add it
+        Parameters: int: Port number
+                    int: ChannelMap to poll default 15
+        Returns:    int: serial number of unit
+                     OR bool: False if unsuccessful
+        """
+        Unit = TDAU_c.TDAU()
+        if not Unit.fnConnect(COMPort):
+            return False
+        iSerial = self.fnAdd(Unit,ChannelMap)
+        if iSerial is False:
+            Unit.fnDisconnect()
+        return iSerial
+
+# ---------- Disconnect all units ----------
+    def fnDisconnect(self):
+        """
+        Disconnect all units and stop worker threads
+        Parameters: None
+        Returns:    bool: True
+        """
+        for Unit,iSerial,ChannelMap in self.LUnits:
+            Unit.fnDisconnect()
+        self.LUnits = []
+        self.fnResetPool()
+        return True
+
+# ---------- Generator of samples from repeated sweeps ----------
+    def fnStream(self,fInterval=0,iSweeps=None):
+        """
+        Generator of samples from repeated sweeps
+        Parameters: float: seconds from start of one sweep to the next (optional)
+                    int: number of sweeps, None = until closed (optional)
+        Yields:     tuple: (time, serial number, channel, temperature, status)
+                    in time order within each sweep
+        """
+        iCount = 0
+        while (iSweeps == None) or (iCount < iSweeps):
+            tStart = time.time()
+            dSweep = self.fnSweep()
+            LSamples = sorted([(fTime,iSerial,iChannel,fTemp,iStatus)
+                               for (iSerial,iChannel),(fTime,fTemp,iStatus) in dSweep.items()])
+            for Sample in LSamples:
+                yield Sample
+            iCount += 1
+            fWait = fInterval - (time.time() - tStart)
+            if fWait > 0:
+                time.sleep(fWait)
+
+# ---------- Read every unit once, in parallel ----------
+    def fnSweep(self):
+        """
+        Read every unit once, in parallel
+        Parameters: None
+        Returns:    dict: (serial number, channel):(time, temperature, status)
+        Note:       status is the nibble from fnRdTemperature
+                      0 = No errors, 1 = Conversion error
+                      2 = New conversion, 4 = System error
+        """
+        dSweep = {}
+        if len(self.LUnits) == 0:
+            return dSweep
+        if self.hPool == None:
+            self.hPool = ThreadPoolExecutor(max_workers=len(self.LUnits))
+        tStart = time.time()
+        LFutures = [self.hPool.submit(self.fnPollUnit,Entry) for Entry in self.LUnits]
+        for Future in LFutures:
+            dSweep.update(Future.result())
+        self.LastSweepTime = time.time() - tStart
+        return dSweep
+
+
+# =================== SUBROUTINES ===================
+
+# ---------- Read one unit ----------
+    def fnPollUnit(self,Entry):
+        """
+        INTERNAL USE ONLY: Read one unit (runs on a worker thread)
+        Parameters: list: [TDAU, serial number, channel map]
+        Returns:    dict: (serial number, channel):(time, temperature, status)
+        """
+        Unit,iSerial,ChannelMap = Entry
+        sReply = Unit.fnRdTemperature(ChannelMap)
+        fTime = time.time()
+        dSamples = {}
+        LChannels = [x+1 for x in range(4) if (ChannelMap >> x) & 0x01]
+        if type(sReply) == TDAU_c.ReplyTemps:    # Unit has bTypedReplies set
+            LTemps = sReply.Temps
+        elif type(sReply) == str:
+            LFields = sReply.split(",")
+            LTemps = [(float(LFields[2*x]),int(LFields[(2*x)+1],16)) for x in range(len(LFields) // 2)]
+        else:
+            print("TDAU {} did not reply".format(iSerial))
+            return dSamples
+        if len(LTemps) != len(LChannels):
+            print("TDAU {} reply: {}".format(iSerial,sReply))
+            return dSamples
+        for x in range(len(LChannels)):
+            dSamples[(iSerial,LChannels[x])] = (fTime,LTemps[x][0],LTemps[x][1])
+        return dSamples
+
+# ---------- Restart worker threads to match units ----------
+    def fnResetPool(self):
+        """
+        INTERNAL USE ONLY: Stop worker threads, next sweep starts new ones
+        Parameters: None
+        Returns:    bool: True
+        """
+        if self.hPool != None:
+            self.hPool.shutdown(wait=True)
+            self.hPool = None
+        return True
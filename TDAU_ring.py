@@ -0,0 +1,133 @@
+# ---------- TDAU Sample Ring Buffer Module
+# Fixed-capacity store for TDAU temperature samples, one ring per channel.
+# Time, temperature and status nibble are kept in typed arrays, so memory
+# stays flat over multi-day runs and nothing is stored as text.
+#
+# Each sample is written twice, at i and at i + capacity, so the latest N
+# samples are always one contiguous slice. fnWindow returns memoryviews of
+# that slice without copying (numpy.frombuffer can wrap them directly).
+#
+# Functions in this module:
+#           fnAppend()                           Add one sample
+#           fnClear()                            Discard all samples
+#           fnCount()                            Number of samples held for a channel
+#           fnExtend()                           Add samples from an iterable (e.g. TDAU.fnStream)
+#           fnStats()                            Count/min/max/mean/std of latest samples
+#           fnWindow()                           Zero-copy views of latest samples
+
+import math
+from array import array
+
+
+class TDAURing():
+    def __init__(self,iCapacity=100000,LChannels=(1,2,3,4)):
+        self.Module_Name = "TDAURing"
+        self.Capacity = iCapacity                # Samples held per channel
+        self.dTimes = {}                         # 'd' seconds since epoch
+        self.dTemps = {}                         # 'f' degrees C
+        self.dStatus = {}                        # 'B' status nibble from R_STATn
+        self.dHead = {}                          # Next index to write (0 to Capacity-1)
+        self.dCount = {}                         # Samples held (max Capacity)
+        for iChannel in LChannels:
+            self.dTimes[iChannel] = array("d",bytes(16 * iCapacity))
+            self.dTemps[iChannel] = array("f",bytes(8 * iCapacity))
+            self.dStatus[iChannel] = array("B",bytes(2 * iCapacity))
+            self.dHead[iChannel] = 0
+            self.dCount[iChannel] = 0
+        return
+
+# ---------- Add one sample ----------
+    def fnAppend(self,fTime,iChannel,fTemperature,iStatus):
+        """
+        Add one sample, overwriting the oldest when full
+        Parameters: float: time (seconds)
+                    int: channel
+                    float: temperature
+                    int: status (see TDAU.fnRdTemperature)
+        Returns:    bool: True
+                          False if channel not held
+        Note:       Same field order as TDAU.fnStream samples
+        """
+        if iChannel not in self.dHead:
+            return False
+        i = self.dHead[iChannel]
+        j = i + self.Capacity                    # Mirror copy
+        self.dTimes[iChannel][i] = self.dTimes[iChannel][j] = fTime
+        self.dTemps[iChannel][i] = self.dTemps[iChannel][j] = fTemperature
+        self.dStatus[iChannel][i] = self.dStatus[iChannel][j] = iStatus & 0xFF
+        self.dHead[iChannel] = (i + 1) % self.Capacity
+        if self.dCount[iChannel] < self.Capacity:
+            self.dCount[iChannel] += 1
+        return True
+
+# ---------- Discard all samples ----------
+    def fnClear(self):
+        """
+        Discard all samples (storage is kept)
+        Parameters: None
+        Returns:    bool: True
+        """
+        for iChannel in self.dHead:
+            self.dHead[iChannel] = 0
+            self.dCount[iChannel] = 0
+        return True
+
+# ---------- Number of samples held for a channel ----------
+    def fnCount(self,iChannel):
+        """
+        Number of samples held for a channel
+        Parameters: int: channel
+        Returns:    int: samples held (0 if channel not held)
+        """
+        return self.dCount.get(iChannel,0)
+
+# ---------- Add samples from an iterable ----------
+    def fnExtend(self,Samples):
+        """
+        Add samples from an iterable
+        Parameters: iterable: (time, channel, temperature, status) tuples
+        Returns:    int: number of samples added
+        """
+        iAdded = 0
+        for fTime,iChannel,fTemperature,iStatus in Samples:
+            if self.fnAppend(fTime,iChannel,fTemperature,iStatus):
+                iAdded += 1
+        return iAdded
+
+# ---------- Count/min/max/mean/std of latest samples ----------
+    def fnStats(self,iChannel,iLast=None):
+        """
+        Count/min/max/mean/std of latest temperatures
+        Parameters: int: channel
+                    int: number of latest samples, None = all held (optional)
+        Returns:    tuple: (count, min, max, mean, std)
+                     OR None if no samples
+        """
+        Times,Temps,Status = self.fnWindow(iChannel,iLast)
+        iCount = len(Temps)
+        if iCount == 0:
+            return None
+        fMean = math.fsum(Temps) / iCount
+        fVar = math.fsum([(fTemp - fMean) ** 2 for fTemp in Temps]) / iCount
+        return (iCount,min(Temps),max(Temps),fMean,math.sqrt(fVar))
+
+# ---------- Zero-copy views of latest samples ----------
+    def fnWindow(self,iChannel,iLast=None):
+        """
+        Zero-copy views of latest samples, oldest first
+        Parameters: int: channel
+                    int: number of latest samples, None = all held (optional)
+        Returns:    tuple: (times, temperatures, status) memoryviews
+        Note:       Views stay valid but are overwritten as new samples
+                    arrive; copy them (bytes()/list()) to keep a snapshot
+        """
+        if iChannel not in self.dHead:
+            return (memoryview(b"").cast("d"),memoryview(b"").cast("f"),memoryview(b""))
+        iCount = self.dCount[iChannel]
+        if (iLast != None) and (iLast < iCount):
+            iCount = max(iLast,0)
+        iStart = (self.dHead[iChannel] - iCount) % self.Capacity
+        iEnd = iStart + iCount
+        return (memoryview(self.dTimes[iChannel])[iStart:iEnd],
+                memoryview(self.dTemps[iChannel])[iStart:iEnd],
+                memoryview(self.dStatus[iChannel])[iStart:iEnd])
@@ -0,0 +1,507 @@
+# ---------- TDAU Simulator Module
+# Stand-in for a TDAU on a COM port, for testing and benchmarking the
+# driver without hardware. TDAUSim has the pyserial calls the driver uses
+# (write, read, inWaiting, timeout, close) and answers with the frames
+# defined by the CMD_*/R_*/C_* constants in TDAU_c.
+#
+# Simulated: user RAM and EEPROM (CMD_RDMEM/WRMEM/SAVEM), absolute RAM and
+# flash pages, conversion start/stop, temperatures (R_STATn, each
+# channel's Temperature/Minimum/Maximum/Average at its REG_MAP address), a log of one record per conversion
+# (CMD_RDLOG/BLOCK/FLLOG), extended errors, lock/unlock, calibrations
+# (busy for CalTime), checksums on WRMEM/SAVEM and resend.
+# Not simulated: firmware update (CMD_PGM1 replies C_BOOT) and test modes.
+#
+# Timing: a reply becomes readable ReplyDelay seconds after its command,
+# then one byte every ByteTime seconds (default 38400 baud, 10 bits/byte).
+# Set both to 0 to measure the driver alone.
+#
+# Example:  Sim = TDAU_sim.TDAUSim()
+#           Tdau = TDAU_c.TDAU()
+#           Tdau.fnAttach(Sim)
+#
+# Functions in this module:
+#           fnCheckResync()                      Check driver resyncs after a late reply
+#           fnAddLog()                           Add a log record
+#           fnReset()                            Power cycle (reload RAM from EEPROM)
+#           fnSetError()                         Set extended error bits
+#           fnSetTemperature()                   Set temperature of a channel
+#           close()                              pyserial: close port
+#           inWaiting()                          pyserial: bytes ready to read
+#           read()                               pyserial: read bytes
+#           reset_input_buffer()                 pyserial: discard unread reply bytes
+#           write()                              pyserial: send command bytes
+
+import random
+import threading
+import time
+from collections import deque
+from TDAU_c import (CMD_BLOCK,CMD_CAL,CMD_EXTC,CMD_FACC,CMD_FLLOG,CMD_LOCK,CMD_PGM1,
+                    CMD_RDERR,CMD_RDF0,CMD_RDF1,CMD_RDLOG,CMD_RDMEM,CMD_RDR0,CMD_RDR1,
+                    CMD_RDSER,CMD_RSEND,CMD_RTD,CMD_SAVEM,CMD_SCO,CMD_START,CMD_STATA,
+                    CMD_STOP,CMD_TEST1,CMD_UNLK,CMD_VREQ,CMD_WRMEM,SLAVE,REG_MAP,
+                    R_COND,R_ERR,R_FWVER,R_LOG,R_MEM,R_SER,R_STAT1,
+                    C_BADCS,C_BOOT,C_BUSY,C_INAC,C_INVC,C_NODATA,C_PASS,C_RANGE,TDAU)
+
+MEM_SIZE   = 0x500                       # User RAM (configuration + dynamic)
+PAGE_SIZE  = 0x10000                     # Absolute RAM/flash page
+# ----- Temperature memory per channel, addresses from the driver's REG_MAP
+TEMP_CUR   = [REG_MAP["Ch{} Temperature".format(x)][0] for x in range(1,5)]
+TEMP_MIN   = [REG_MAP["Ch{} Minimum".format(x)][0] for x in range(1,5)]
+TEMP_MAX   = [REG_MAP["Ch{} Maximum".format(x)][0] for x in range(1,5)]
+TEMP_AVG   = [REG_MAP["Ch{} Average".format(x)][0] for x in range(1,5)]
+LOG_SIZE   = 8                           # Bytes per log record: flags,integer x 4 channels
+LOG_BLOCK  = 8                           # Max records per CMD_BLOCK reply
+
+# ----- Command frame lengths including slave address
+#  CMD_WRMEM is 6 + quan, anything not listed is 2
+CMD_LEN    = {CMD_RDMEM:5,CMD_RDR0:4,CMD_RDR1:4,CMD_RDF0:4,CMD_RDF1:4,
+              CMD_SAVEM:6,CMD_FACC:7,CMD_PGM1:3,CMD_TEST1:3}
+
+
+class TDAUSim():
+    def __init__(self,iSerial=12345,Version=(1,15),LTemps=(25.0,25.0,25.0,25.0)):
+        self.Module_Name = "TDAUSim"
+        self.Serial = iSerial                    # Reply to CMD_RDSER
+        self.Version = Version                   # (major, minor) reply to CMD_VREQ
+        self.ByteTime = 10.0 / 38400             # Seconds per reply byte
+        self.ReplyDelay = 0.001                  # Seconds from command to first reply byte
+        self.CalTime = 0.5                       # Seconds a calibration keeps the unit busy
+        self.ConversionTime = 0.1                # Seconds per conversion of all channels
+        self.Noise = 0.0                         # Std dev of converted temperature (deg C)
+        self.LogMax = 1000                       # Records kept, oldest dropped when full
+        self.timeout = None                      # pyserial: read() timeout (seconds)
+        self.write_timeout = None
+        self.is_open = True
+        self.EEPROM = bytearray(MEM_SIZE)
+        self.RAM = bytearray(MEM_SIZE)
+        self.dPages = {CMD_RDR0:bytearray(PAGE_SIZE),CMD_RDR1:bytearray(PAGE_SIZE),
+                       CMD_RDF0:bytearray(PAGE_SIZE),CMD_RDF1:bytearray(PAGE_SIZE)}
+        self.Temps = list(LTemps)                # Set point of each channel
+        self.Converted = list(LTemps)            # Last converted value of each channel
+        self.LNew = [False] * 4                  # Conversion since channel last read
+        self.TempSum = [0.0] * 4                 # Conversions summed for Average since reset
+        self.TempCount = [0] * 4
+        self.Log = deque()                       # bytes of LOG_SIZE per record
+        self.Error1 = 0                          # 16 bit extended error flags
+        self.Error2 = 0                          # 8 bit extended error flags
+        self.LastCond = C_PASS                   # Last R_COND sent
+        self.bLocked = False                     # CMD_WRMEM/SAVEM refused when True
+        self.bConverting = False
+        self.tConversion = 0.0                   # Time of last conversion
+        self.tBusy = 0.0                         # Busy until this time
+        self.RxPending = bytearray()             # Command bytes not yet a full frame
+        self.TxQueue = deque()                   # (time readable, byte) of reply bytes
+        self.LastReply = b""                     # For CMD_RSEND
+        self.hLock = threading.Lock()
+        self.fnReset()
+        return
+
+# ---------- Add a log record ----------
+    def fnAddLog(self,Record):
+        """
+        Add a log record (conversions add one each)
+        Parameters: bytes: LOG_SIZE bytes
+        Returns:    int: records held
+        """
+        with self.hLock:
+            return self.fnLogRecord(bytes(Record))
+
+# ---------- Power cycle ----------
+    def fnReset(self):
+        """
+        Power cycle: reload RAM from EEPROM, stop conversions, clear log
+        Parameters: None
+        Returns:    bool: True
+        Note:       Sets "Power on CPU reset detected" in extended error
+        """
+        with self.hLock:
+            self.RAM[:] = self.EEPROM
+            self.bConverting = False
+            self.Log.clear()
+            self.TxQueue.clear()
+            self.RxPending = bytearray()
+            self.Error1 |= 0x0080
+            for x in range(4):
+                self.fnStoreTemperature(x,self.Converted[x],True)
+        return True
+
+# ---------- Set extended error bits ----------
+    def fnSetError(self,iError1=0,iError2=0):
+        """
+        Set extended error bits (cleared when read with CMD_RDERR)
+        Parameters: int: 16 bit flags (see TDAU_c.EXT_ERROR1)
+                    int: 8 bit flags (see TDAU_c.EXT_ERROR2)
+        Returns:    bool: True
+        """
+        with self.hLock:
+            self.Error1 |= iError1 & 0xFFFF
+            self.Error2 |= iError2 & 0xFF
+        return True
+
+# ---------- Set temperature of a channel ----------
+    def fnSetTemperature(self,iChannel,fTemperature):
+        """
+        Set temperature seen by a channel
+        Parameters: int: channel 1 to 4
+                    float: degrees C (-255.9 to 255.9)
+        Returns:    bool: True
+                          False if channel out of range
+        Note:       Reported from the next conversion
+        """
+        if (iChannel < 1) or (iChannel > 4):
+            return False
+        with self.hLock:
+            self.Temps[iChannel-1] = fTemperature
+        return True
+
+# ========== pyserial compatible calls =======================================
+
+    def close(self):
+        self.is_open = False
+        return None
+
+    def inWaiting(self):
+        with self.hLock:
+            tNow = time.time()
+            iCount = 0
+            for tReady,iByte in self.TxQueue:
+                if tReady > tNow:
+                    break
+                iCount += 1
+        return iCount
+
+    @property
+    def in_waiting(self):
+        return self.inWaiting()
+
+    def apply_settings(self,dSettings):
+        for sKey,Value in dSettings.items():
+            setattr(self,sKey,Value)
+        return None
+
+    def read(self,size=1):
+        """pyserial: wait up to timeout for size bytes"""
+        tDeadline = None if self.timeout == None else time.time() + self.timeout
+        Data = bytearray()
+        while len(Data) < size:
+            with self.hLock:
+                tNow = time.time()
+                while (len(Data) < size) and self.TxQueue and (self.TxQueue[0][0] <= tNow):
+                    Data.append(self.TxQueue.popleft()[1])
+                tNext = self.TxQueue[0][0] if self.TxQueue else None
+            if len(Data) >= size:
+                break
+            if (tDeadline != None) and (tNow >= tDeadline):
+                break
+            fWait = 0.001 if tNext == None else max(tNext - tNow,0)
+            if tDeadline != None:
+                fWait = min(fWait,tDeadline - tNow)
+            time.sleep(fWait)
+        return bytes(Data)
+
+    def reset_input_buffer(self):
+        with self.hLock:
+            self.TxQueue.clear()
+        return None
+
+    flushInput = reset_input_buffer
+
+    def write(self,Data):
+        """pyserial: send command bytes, replies are queued as frames complete"""
+        if type(Data) == str:
+            Data = Data.encode("latin-1")
+        with self.hLock:
+            self.RxPending.extend(bytes(Data))
+            while len(self.RxPending) >= 2:
+                if self.RxPending[0] != SLAVE:   # Not addressed to us
+                    del self.RxPending[0]
+                    continue
+                iCmd = self.RxPending[1]
+                iLength = CMD_LEN.get(iCmd,2)
+                if iCmd == CMD_WRMEM:
+                    if len(self.RxPending) < 5:
+                        break
+                    iLength = 6 + self.RxPending[4]
+                if len(self.RxPending) < iLength:
+                    break
+                Frame = bytes(self.RxPending[1:iLength])
+                del self.RxPending[0:iLength]
+                self.fnQueueReply(self.fnCommand(Frame))
+        return len(Data)
+
+
+# =================== SUBROUTINES ===================
+
+# ---------- Reply to one command ----------
+    def fnCommand(self,Frame):
+        """
+        INTERNAL USE ONLY: Reply to one command
+        Parameters: bytes: command frame without slave address
+        Returns:    bytes: reply frame
+                     OR tuple: (reply frame, extra seconds before reply)
+        """
+        iCmd = Frame[0]
+        tNow = time.time()
+        self.fnConvert(tNow)
+        if iCmd == CMD_RSEND:
+            return self.LastReply
+        if tNow < self.tBusy:                    # Calibrating
+            return self.fnCond(C_BUSY)
+        if iCmd == CMD_VREQ:
+            return self.fnFrame([R_FWVER,self.Version[0],self.Version[1]])
+        if iCmd == CMD_RDSER:
+            return self.fnFrame([R_SER] + list(self.Serial.to_bytes(4,"little")))
+        if iCmd == CMD_RDERR:
+            Reply = self.fnFrame([R_ERR,self.Error1 >> 8,self.Error1 & 0xFF,self.LastCond,self.Error2])
+            self.Error1 = 0
+            self.Error2 = 0
+            return Reply
+        if iCmd == CMD_START:
+            if not self.bConverting:
+                self.bConverting = True
+                self.tConversion = tNow
+            return self.fnCond(C_PASS)
+        if iCmd == CMD_STOP:
+            self.bConverting = False
+            return self.fnCond(C_PASS)
+        if (iCmd > CMD_STOP) and (iCmd <= CMD_STATA):
+            return self.fnTemperatures(iCmd & 0x0F)
+        if iCmd in (CMD_RDMEM,CMD_RDR0,CMD_RDR1,CMD_RDF0,CMD_RDF1):
+            return self.fnRdMemory(Frame)
+        if iCmd in (CMD_WRMEM,CMD_SAVEM):
+            return self.fnWrMemory(Frame)
+        if iCmd == CMD_LOCK:
+            self.bLocked = True
+            return self.fnCond(C_PASS)
+        if iCmd == CMD_UNLK:
+            self.bLocked = False
+            return self.fnCond(C_PASS)
+        if iCmd in (CMD_RDLOG,CMD_BLOCK):
+            iQuan = min(len(self.Log),1 if iCmd == CMD_RDLOG else LOG_BLOCK)
+            if iQuan == 0:
+                return self.fnCond(C_NODATA)
+            LRecords = [self.Log.popleft() for x in range(iQuan)]
+            return self.fnFrame([R_LOG,iQuan,LOG_SIZE] + list(b"".join(LRecords)))
+        if iCmd == CMD_FLLOG:
+            self.Log.clear()
+            return self.fnCond(C_PASS)
+        if iCmd in (CMD_CAL,CMD_EXTC,CMD_FACC,CMD_RTD,CMD_SCO):
+            self.tBusy = tNow + self.CalTime
+            return (self.fnCond(C_PASS),self.CalTime)
+        if iCmd == CMD_PGM1:
+            return self.fnCond(C_BOOT)
+        return self.fnCond(C_INVC)
+
+# ---------- Build R_COND reply ----------
+    def fnCond(self,iCond):
+        """
+        INTERNAL USE ONLY: Build R_COND reply
+        Parameters: int: condition (C_PASS etc)
+        Returns:    bytes: reply frame
+        """
+        self.LastCond = iCond
+        return self.fnFrame([R_COND,iCond])
+
+# ---------- Run conversions due by now ----------
+    def fnConvert(self,tNow):
+        """
+        INTERNAL USE ONLY: Run conversions due by now
+        Parameters: float: time now
+        Returns:    int: number of conversions run
+        """
+        if (not self.bConverting) or (self.ConversionTime <= 0):
+            return 0
+        iCount = int((tNow - self.tConversion) / self.ConversionTime)
+        if iCount <= 0:
+            return 0
+        self.tConversion += iCount * self.ConversionTime
+        for x in range(min(iCount,self.LogMax)):  # Older ones would drop out of the log anyway
+            Record = bytearray()
+            for iChannel in range(4):
+                fTemperature = self.Temps[iChannel]
+                if self.Noise > 0:
+                    fTemperature = random.gauss(fTemperature,self.Noise)
+                self.Converted[iChannel] = fTemperature
+                self.LNew[iChannel] = True
+                Record.extend(self.fnStoreTemperature(iChannel,fTemperature))
+            self.fnLogRecord(bytes(Record))
+        return iCount
+
+# ---------- Build frame with checksum ----------
+    def fnFrame(self,LBytes):
+        """
+        INTERNAL USE ONLY: Append checksum
+        Parameters: list: int for each byte of reply
+        Returns:    bytes: reply frame
+        """
+        return bytes(LBytes + [sum(LBytes) & 0xFF])
+
+# ---------- Add a log record ----------
+    def fnLogRecord(self,Record):
+        """
+        INTERNAL USE ONLY: Add a log record, dropping the oldest when full
+        Parameters: bytes: LOG_SIZE bytes
+        Returns:    int: records held
+        """
+        self.Log.append(Record)
+        while len(self.Log) > self.LogMax:
+            self.Log.popleft()
+        return len(self.Log)
+
+# ---------- Queue reply bytes with their ready times ----------
+    def fnQueueReply(self,Reply):
+        """
+        INTERNAL USE ONLY: Queue reply bytes with the time each can be read
+        Parameters: bytes: reply frame
+                     OR tuple: (reply frame, extra seconds before reply)
+        Returns:    None
+        """
+        fExtra = 0.0
+        if type(Reply) == tuple:
+            Reply,fExtra = Reply
+        self.LastReply = Reply
+        tReady = time.time() + self.ReplyDelay + fExtra
+        if self.TxQueue:
+            tReady = max(tReady,self.TxQueue[-1][0])     # Behind earlier replies
+        for x in range(len(Reply)):
+            self.TxQueue.append((tReady + ((x + 1) * self.ByteTime),Reply[x]))
+        return None
+
+# ---------- Read memory ----------
+    def fnRdMemory(self,Frame):
+        """
+        INTERNAL USE ONLY: Reply to CMD_RDMEM and absolute RAM/flash reads
+        Parameters: bytes: command frame without slave address
+        Returns:    bytes: reply frame
+        """
+        iAddress = Frame[1] | (Frame[2] << 8)
+        if Frame[0] != CMD_RDMEM:                # 16 bytes, no checksum
+            return bytes([R_MEM]) + bytes(self.dPages[Frame[0]][iAddress:iAddress+16]).ljust(16,b"\x00")
+        iQuan = Frame[3]
+        if (iQuan < 1) or (iQuan > 16) or (iAddress + iQuan > MEM_SIZE):
+            return self.fnCond(C_RANGE)
+        return self.fnFrame([R_MEM] + list(self.RAM[iAddress:iAddress+iQuan]))
+
+# ---------- Store temperature in memory map ----------
+    def fnStoreTemperature(self,iChannel,fTemperature,bReset=False):
+        """
+        INTERNAL USE ONLY: Store temperature as current/min/max/average in memory map
+        Parameters: int: channel 0 to 3
+                    float: degrees C
+                    bool: restart min/max/average (optional)
+        Returns:    bytes: <sign.status.decimal> <integer degrees>
+        """
+        Pair = self.fnTemperaturePair(fTemperature)
+        self.RAM[TEMP_CUR[iChannel]:TEMP_CUR[iChannel]+2] = Pair
+        if bReset:
+            self.TempSum[iChannel] = 0.0
+            self.TempCount[iChannel] = 0
+        self.TempSum[iChannel] += fTemperature
+        self.TempCount[iChannel] += 1
+        iMin = TEMP_MIN[iChannel]
+        iMax = TEMP_MAX[iChannel]
+        iAvg = TEMP_AVG[iChannel]
+        if bReset or (fTemperature < self.fnMemoryTemperature(iMin)):
+            self.RAM[iMin:iMin+2] = Pair
+        if bReset or (fTemperature > self.fnMemoryTemperature(iMax)):
+            self.RAM[iMax:iMax+2] = Pair
+        self.RAM[iAvg:iAvg+2] = self.fnTemperaturePair(self.TempSum[iChannel] / self.TempCount[iChannel])
+        return Pair
+
+# ---------- Temperature as memory map pair ----------
+    def fnTemperaturePair(self,fTemperature):
+        """
+        INTERNAL USE ONLY: Temperature as memory map pair
+        Parameters: float: degrees C
+        Returns:    bytes: <sign.status.decimal> <integer degrees>
+        """
+        iTenths = int(round(abs(fTemperature) * 10))
+        iFlags = (iTenths % 10) | (0x10 if fTemperature < 0 else 0)
+        return bytes([iFlags,(iTenths // 10) & 0xFF])
+
+# ---------- Temperature held in memory map ----------
+    def fnMemoryTemperature(self,iAddress):
+        """
+        INTERNAL USE ONLY: Temperature held in memory map
+        Parameters: 16 bit int: address of <flags> <integer> pair
+        Returns:    float: degrees C
+        """
+        iFlags = self.RAM[iAddress]
+        fTemperature = ((self.RAM[iAddress+1] * 10) + min(iFlags & 0x0F,9)) / 10
+        if (iFlags & 0x10) != 0:
+            fTemperature = 0 - fTemperature
+        return fTemperature
+
+# ---------- Reply to R_STATn request ----------
+    def fnTemperatures(self,ChannelMap):
+        """
+        INTERNAL USE ONLY: Reply to temperature request
+        Parameters: byte: ChannelMap (see TDAU.fnRdTemperature)
+        Returns:    bytes: R_STATn reply frame
+        Note:       Status 2 (new conversion) is set once per conversion,
+                    status 4 (system error) while extended errors other
+                    than CPU resets are set
+        """
+        LBytes = []
+        for iChannel in range(4):
+            if (ChannelMap >> iChannel) & 0x01:
+                fTemperature = self.Converted[iChannel]
+                iTenths = int(round(abs(fTemperature) * 10))
+                iFlags = (iTenths % 10) | (0x10 if fTemperature < 0 else 0)
+                if self.LNew[iChannel]:
+                    iFlags |= 0x20
+                    self.LNew[iChannel] = False
+                if ((self.Error1 & ~0x0F80) | self.Error2) != 0:
+                    iFlags |= 0x40                   # Reset flags (bits 7-11) aren't errors
+                LBytes += [iFlags,(iTenths // 10) & 0xFF]
+        return self.fnFrame([R_STAT1 + (len(LBytes) // 2) - 1] + LBytes)
+
+# ---------- Write or save memory ----------
+    def fnWrMemory(self,Frame):
+        """
+        INTERNAL USE ONLY: Reply to CMD_WRMEM and CMD_SAVEM
+        Parameters: bytes: command frame without slave address
+        Returns:    bytes: reply frame
+        """
+        if (sum(Frame[:-1]) & 0xFF) != Frame[-1]:
+            return self.fnCond(C_BADCS)
+        if self.bLocked:
+            return self.fnCond(C_INAC)
+        iAddress = Frame[1] | (Frame[2] << 8)
+        iQuan = Frame[3]
+        if (iQuan == 0) or (iAddress + iQuan > MEM_SIZE):
+            return self.fnCond(C_RANGE)
+        if Frame[0] == CMD_WRMEM:
+            self.RAM[iAddress:iAddress+iQuan] = Frame[4:4+iQuan]
+        else:
+            self.EEPROM[iAddress:iAddress+iQuan] = self.RAM[iAddress:iAddress+iQuan]
+        return self.fnCond(C_PASS)
+
+
+# ---------- Check driver resyncs after a late reply ----------
+def fnCheckResync(fDelay=0.3,fTimeout=0.1):
+    """
+    Check driver resyncs after a late reply
+    Parameters: float: ReplyDelay of the late reply (optional)
+                float: driver ReplyTimeout, shorter than fDelay (optional)
+    Returns:    bool: True if the next commands get their own replies
+    Note:       One fnRdSerialNumber times out, its reply arrives while
+                fnRdFWVersion/fnRdSerialNumber are asked for afterwards
+    """
+    Sim = TDAUSim()
+    Tdau = TDAU()
+    if not Tdau.fnAttach(Sim):
+        return False
+    Tdau.ReplyTimeout = fTimeout
+    Sim.ReplyDelay = fDelay
+    Tdau.fnRdSerialNumber()                  # Times out
+    Sim.ReplyDelay = 0.001
+    sVersion = "{}.{}".format(*Sim.Version)
+    for x in range(3):
+        if (str(Tdau.fnRdFWVersion()) != sVersion) or (str(Tdau.fnRdSerialNumber()) != str(Sim.Serial)):
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    print("Resync after late reply: {}".format("PASS" if fnCheckResync() else "FAIL"))
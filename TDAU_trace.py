@@ -0,0 +1,402 @@
+# ---------- TDAU Serial Trace Module
+# Records the bytes exchanged with a TDAU to a binary trace file and plays
+# them back to the driver without hardware, so a slow or flaky session
+# can be profiled and its replies fed through fnRdReply/fnRdMemory/
+# fnWrFWUpdate again.
+#
+# TraceRecorder wraps an open port (pyserial or TDAU_sim.TDAUSim) and
+# writes every write() frame and every non-empty read() to the trace.
+# Each record is flushed to the file as it is written.
+# TraceReplay has the pyserial calls the driver uses and answers each
+# write() with the bytes that followed the same write in the recording.
+# A write that differs from the trace does not use up the recorded write:
+# replay resyncs on the next few recorded writes, or answers with the
+# reply recorded for the same frame elsewhere (e.g. the fnAttach
+# version request), or sends nothing.
+#
+# Trace file: TRACE_HEADER, then one record per write/read:
+#   <kind> <microseconds since previous record> <length> <bytes>
+#   kind is TRACE_TX (host to TDAU) or TRACE_RX (TDAU to host)
+#   TX is stamped when the write returned, RX when its first byte was
+#   seen waiting (the recorder polls the port every PollTime seconds),
+#   not when the driver got round to reading it.
+#
+# Timing: with Speed=1.0 reply bytes become readable as long after the
+# write as they arrived in the recording (Speed=2.0 twice as soon).
+# Speed=None makes them readable at once. The driver's own delays
+# (fnWrBuffer waits 50mS after a write) still apply.
+#
+# Example:  Tdau.fnConnect(3)
+#           Tdau.fnRecord("session.trc")         # or TraceRecorder(port,"session.trc")
+#           ...
+#           Tdau.fnRecord(None)
+#
+#           Tdau.fnAttach(TDAU_trace.TraceReplay("session.trc",Speed=None))
+#
+# Functions in this module:
+#           fnRdTrace()                          Read trace file as records
+#           fnShowTrace()                        Display trace file
+#           TraceRecorder                        Port wrapper writing a trace
+#           TraceReplay                          Port replaying a trace
+
+import struct
+import threading
+import time
+from collections import deque
+
+TRACE_MAGIC  = b"TDTR"
+TRACE_HEADER = "<4sBxxxd"                # magic, version, pad, start time (time.time())
+TRACE_RECORD = "<BIH"                    # kind, microseconds since previous record, length
+TRACE_TX     = 0x54                      # "T" host to TDAU
+TRACE_RX     = 0x52                      # "R" TDAU to host
+TRACE_MAXGAP = 0xFFFFFFFF                # Longest gap one record holds (about 71 minutes)
+TRACE_RESYNC = 8                         # Recorded writes searched after a mismatch
+
+
+# ---------- Read trace file as records ----------
+def fnRdTrace(sFile):
+    """
+    Read trace file as records
+    Parameters: string: trace file name
+    Returns:    tuple: (start time, list of (kind, seconds from start, bytes))
+    Note:       Raises ValueError if not a trace file
+    """
+    with open(sFile,"rb") as hFile:
+        Data = hFile.read()
+    iHeader = struct.calcsize(TRACE_HEADER)
+    iRecord = struct.calcsize(TRACE_RECORD)
+    if len(Data) < iHeader:
+        raise ValueError("{} is not a TDAU trace".format(sFile))
+    sMagic,iVersion,tStart = struct.unpack_from(TRACE_HEADER,Data,0)
+    if (sMagic != TRACE_MAGIC) or (iVersion != 1):
+        raise ValueError("{} is not a TDAU trace".format(sFile))
+    LRecords = []
+    iMicro = 0
+    iOffset = iHeader
+    while iOffset + iRecord <= len(Data):
+        iKind,iGap,iLength = struct.unpack_from(TRACE_RECORD,Data,iOffset)
+        iOffset += iRecord
+        if iOffset + iLength > len(Data):
+            break                                # Recording cut short
+        iMicro += iGap
+        LRecords.append((iKind,iMicro / 1000000,bytes(Data[iOffset:iOffset+iLength])))
+        iOffset += iLength
+    return (tStart,LRecords)
+
+# ---------- Display trace file ----------
+def fnShowTrace(sFile):
+    """
+    Display trace file, one line per record
+    Parameters: string: trace file name
+    Returns:    int: number of records
+    Example:    0.050213 TX 01 07 00 00 07
+    """
+    tStart,LRecords = fnRdTrace(sFile)
+    print("Trace {} started {}".format(sFile,time.strftime("%Y-%m-%d %H:%M:%S",time.localtime(tStart))))
+    for iKind,fTime,Data in LRecords:
+        print("{:>12.6f} {} {}".format(fTime,"TX" if iKind == TRACE_TX else "RX",
+                                       " ".join(["{:02x}".format(x) for x in Data])))
+    return len(LRecords)
+
+
+class TraceRecorder():
+    def __init__(self,hPort,sFile,PollTime=0.001):
+        self.Module_Name = "TraceRecorder"
+        self.hPort = hPort                       # Port being recorded
+        self.PollTime = PollTime                 # Seconds between checks for arriving bytes
+        self.hFile = open(sFile,"wb")
+        self.hLock = threading.Lock()            # Trace file
+        self.hRxLock = threading.Lock()          # Port reads and arrival times
+        self.tLast = time.perf_counter_ns()      # Time of previous record
+        self.iWaiting = 0                        # Bytes seen waiting, not read yet
+        self.Arrivals = deque()                  # [time seen, bytes] of those bytes, oldest first
+        self.hFile.write(struct.pack(TRACE_HEADER,TRACE_MAGIC,1,time.time()))
+        self.hFile.flush()
+        self.evStop = threading.Event()
+        self.hPoll = threading.Thread(target=self.fnPoll,name="TraceRecorder",daemon=True)
+        self.hPoll.start()
+        return
+
+# ---------- Stop recording ----------
+    def fnStop(self):
+        """
+        Stop recording, leave port open
+        Parameters: None
+        Returns:    object: port that was recorded
+        """
+        self.evStop.set()
+        if self.hPoll != threading.current_thread():
+            self.hPoll.join()
+        with self.hLock:
+            if not self.hFile.closed:
+                self.hFile.close()
+        return self.hPort
+
+# ========== pyserial compatible calls =======================================
+
+    def close(self):
+        self.fnStop()
+        return self.hPort.close()
+
+    def inWaiting(self):
+        with self.hRxLock:
+            return self.fnSeen()
+
+    @property
+    def in_waiting(self):
+        return self.inWaiting()
+
+    def read(self,size=1):
+        with self.hRxLock:
+            Data = self.hPort.read(size)
+            tArrived = self.fnConsume(len(Data))
+        if len(Data) > 0:
+            self.fnRecord(TRACE_RX,Data,tArrived)
+        return Data
+
+    def write(self,Data):
+        if type(Data) == str:
+            Frame = Data.encode("latin-1")
+        else:
+            Frame = bytes(Data)
+        Result = self.hPort.write(Data)
+        self.fnRecord(TRACE_TX,Frame)
+        return Result
+
+    def reset_input_buffer(self):
+        with self.hRxLock:
+            self.hPort.reset_input_buffer()
+            self.iWaiting = 0
+            self.Arrivals.clear()
+        return None
+
+    flushInput = reset_input_buffer
+
+    def __getattr__(self,sName):
+        return getattr(self.hPort,sName)         # timeout, apply_settings, ...
+
+
+# =================== SUBROUTINES ===================
+
+# ---------- Append one record ----------
+    def fnRecord(self,iKind,Data,tStamp=None):
+        """
+        INTERNAL USE ONLY: Append one record and flush it to the file
+        Parameters: int: TRACE_TX or TRACE_RX
+                    bytes: data written or read
+                    int: time.perf_counter_ns() of the record (optional)
+                        None = now
+        Returns:    bool: True
+                          False if recording stopped
+        Note:       Records stay in time order, a stamp before the previous
+                    record is moved up to it.
+        """
+        with self.hLock:
+            if self.hFile.closed:
+                return False
+            if tStamp == None:
+                tStamp = time.perf_counter_ns()
+            tStamp = max(tStamp,self.tLast)
+            iGap = (tStamp - self.tLast) // 1000
+            if iGap > TRACE_MAXGAP:
+                iGap = TRACE_MAXGAP
+            self.tLast = tStamp
+            for x in range(0,max(len(Data),1),0xFFFF):   # Length field is 16 bits
+                self.hFile.write(struct.pack(TRACE_RECORD,iKind,iGap,len(Data[x:x+0xFFFF])))
+                self.hFile.write(Data[x:x+0xFFFF])
+                iGap = 0
+            self.hFile.flush()
+        return True
+
+# ---------- Note arrival of bytes ----------
+    def fnSeen(self):
+        """
+        INTERNAL USE ONLY: Check port, stamp bytes not seen before (caller holds hRxLock)
+        Parameters: None
+        Returns:    int: bytes waiting
+        """
+        iWaiting = self.hPort.inWaiting()
+        if iWaiting > self.iWaiting:
+            self.Arrivals.append([time.perf_counter_ns(),iWaiting - self.iWaiting])
+        self.iWaiting = iWaiting
+        return iWaiting
+
+# ---------- Arrival time of bytes read ----------
+    def fnConsume(self,iCount):
+        """
+        INTERNAL USE ONLY: Arrival time of bytes read (caller holds hRxLock)
+        Parameters: int: bytes just read
+        Returns:    int: time.perf_counter_ns() the first of them was seen
+                         waiting, now if it never was
+        """
+        tArrived = self.Arrivals[0][0] if self.Arrivals else time.perf_counter_ns()
+        self.iWaiting = max(self.iWaiting - iCount,0)
+        while (iCount > 0) and self.Arrivals:
+            if self.Arrivals[0][1] > iCount:
+                self.Arrivals[0][1] -= iCount
+                break
+            iCount -= self.Arrivals.popleft()[1]
+        return tArrived
+
+# ---------- Stamp arriving bytes until stopped ----------
+    def fnPoll(self):
+        """
+        INTERNAL USE ONLY: Stamp arriving bytes every PollTime until fnStop
+        Parameters: None
+        Returns:    None
+        """
+        while not self.evStop.wait(self.PollTime):
+            try:
+                with self.hRxLock:
+                    self.fnSeen()
+            except Exception:
+                break                            # Port closed under us
+        return None
+
+
+class TraceReplay():
+    def __init__(self,sFile,Speed=1.0,bStrict=False):
+        self.Module_Name = "TraceReplay"
+        self.Speed = Speed                       # Recorded seconds per replay second, None = no waiting
+        self.bStrict = bStrict                   # Raise ValueError when a write differs from the trace
+        self.timeout = None                      # pyserial: read() timeout (seconds)
+        self.write_timeout = None
+        self.is_open = True
+        self.tStart,LRecords = fnRdTrace(sFile)
+        self.LWrites = []                        # (frame, [(seconds after frame, bytes), ...])
+        LBefore = []                             # Replies recorded before the first write
+        for iKind,fTime,Data in LRecords:
+            if iKind == TRACE_TX:
+                self.LWrites.append((Data,fTime,[]))
+            elif self.LWrites:
+                self.LWrites[-1][2].append((fTime - self.LWrites[-1][1],Data))
+            else:
+                LBefore.append(Data)
+        self.dReplies = {}                       # frame: replies to its first recorded write
+        for Frame,fTime,LReplies in self.LWrites:
+            if Frame not in self.dReplies:
+                self.dReplies[Frame] = LReplies
+        self.iNext = 0                           # Next write expected
+        self.iAhead = None                       # Recorded write matched ahead of iNext by the last write
+        self.Mismatches = []                     # (write index, expected frame, frame written)
+        self.RxQueue = deque()                   # (time readable, byte) of reply bytes
+        self.hLock = threading.Lock()
+        for Data in LBefore:
+            self.fnQueue(0.0,Data)
+        return
+
+# ---------- Replay progress ----------
+    def fnRemaining(self):
+        """
+        Writes of the trace not replayed yet
+        Parameters: None
+        Returns:    int: number of writes
+        """
+        return len(self.LWrites) - self.iNext
+
+# ========== pyserial compatible calls =======================================
+
+    def close(self):
+        self.is_open = False
+        return None
+
+    def inWaiting(self):
+        with self.hLock:
+            tNow = time.time()
+            iCount = 0
+            for tReady,iByte in self.RxQueue:
+                if tReady > tNow:
+                    break
+                iCount += 1
+        return iCount
+
+    @property
+    def in_waiting(self):
+        return self.inWaiting()
+
+    def apply_settings(self,dSettings):
+        for sKey,Value in dSettings.items():
+            setattr(self,sKey,Value)
+        return None
+
+    def read(self,size=1):
+        """pyserial: wait up to timeout for size bytes"""
+        tDeadline = None if self.timeout == None else time.time() + self.timeout
+        Data = bytearray()
+        while len(Data) < size:
+            with self.hLock:
+                tNow = time.time()
+                while (len(Data) < size) and self.RxQueue and (self.RxQueue[0][0] <= tNow):
+                    Data.append(self.RxQueue.popleft()[1])
+                tNext = self.RxQueue[0][0] if self.RxQueue else None
+            if len(Data) >= size:
+                break
+            if (tNext == None) or ((tDeadline != None) and (tNow >= tDeadline)):
+                break                            # Nothing more will arrive
+            fWait = max(tNext - tNow,0)
+            if tDeadline != None:
+                fWait = min(fWait,tDeadline - tNow)
+            time.sleep(fWait)
+        return bytes(Data)
+
+    def reset_input_buffer(self):
+        with self.hLock:
+            self.RxQueue.clear()
+        return None
+
+    flushInput = reset_input_buffer
+
+    def write(self,Data):
+        """pyserial: match the next write of the trace, queue the bytes that followed it"""
+        if type(Data) == str:
+            Frame = Data.encode("latin-1")
+        else:
+            Frame = bytes(Data)
+        tNow = time.time()
+        with self.hLock:
+            iMatch = None
+            iAhead = self.iAhead
+            self.iAhead = None
+            if (iAhead != None) and (iAhead + 1 < len(self.LWrites)) and (self.LWrites[iAhead+1][0] == Frame) \
+               and (self.LWrites[self.iNext][0] != Frame):
+                iMatch = iAhead + 1              # Driver did skip the writes before iAhead
+            else:
+                for x in range(self.iNext,min(self.iNext + TRACE_RESYNC + 1,len(self.LWrites))):
+                    if self.LWrites[x][0] == Frame:
+                        iMatch = x
+                        break
+                if iMatch != self.iNext:
+                    Expected = self.LWrites[self.iNext][0] if self.iNext < len(self.LWrites) else None
+                    self.Mismatches.append((self.iNext,Expected,Frame))
+                    if self.bStrict:
+                        raise ValueError("Write {} is {}, trace has {}".format(
+                                         self.iNext,Frame.hex(),"end" if Expected == None else Expected.hex()))
+            if iMatch == None:                   # Not in the trace near here, recorded writes stay next
+                LReplies = self.dReplies.get(Frame,[])
+            elif (iMatch > self.iNext) and (iAhead == None):
+                LReplies = self.LWrites[iMatch][2]   # Extra write or skipped writes, the next write tells
+                self.iAhead = iMatch
+            else:                                # In step, or resynced past skipped writes
+                LReplies = self.LWrites[iMatch][2]
+                self.iNext = iMatch + 1
+            for fAfter,Reply in LReplies:
+                if self.Speed == None:
+                    self.fnQueue(0.0,Reply)
+                else:
+                    self.fnQueue(tNow + fAfter / self.Speed,Reply)
+        return len(Frame)
+
+
+# =================== SUBROUTINES ===================
+
+# ---------- Queue reply bytes ----------
+    def fnQueue(self,tReady,Data):
+        """
+        INTERNAL USE ONLY: Queue reply bytes (caller holds hLock or is __init__)
+        Parameters: float: time.time() the bytes become readable
+                    bytes: reply bytes
+        Returns:    bool: True
+        """
+        for iByte in Data:
+            self.RxQueue.append((tReady,iByte))
+        return True
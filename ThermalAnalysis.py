@@ -0,0 +1,189 @@
+# Series resistance and ideality for sweep results
+# Same calculation and constants as DBController.updateRs_Idea, done on
+# whole columns of the Test table instead of one row at a time:
+#
+#   r    = ln(Ic3/Ic2) / ln(Ic2/Ic1)
+#   RS   = ((Vbe3 - Vbe2) - (Vbe2 - Vbe1) * r) / ((Ie3 - Ie2) - (Ie2 - Ie1) * r)
+#   Idea = q * ((Vbe2 - Vbe1) - (Ie2 - Ie1) * RS) / ((Temperature + 273.15) * k * ln(Ic2/Ic1))
+#
+# The rows are read with one SELECT, computed with numpy and written back
+# with one executemany inside a single transaction. Rows that are not
+# measured yet (NULL inputs) or give no finite result get NULL RS/Idea.
+#
+# fit_database() instead fits each unit over all of its points at once,
+# every current combination at every temperature, by linear least squares:
+#
+#   Vbe = n * Vt * (ln(Ic) - XTI * ln(T/T0)) - n * ln(Is) * Vt + Eg * (1 - T/T0) + RS * Ie
+#
+# with Vt = k * T / q and Is the saturation current at T0 (25 C). The model
+# is linear in n, n * ln(Is), Eg and RS, so all units are solved together
+# as a stack of 4x4 normal equations. Units with a single temperature
+# keep Eg at EG. With workers > 1 units are split across a process pool
+# (standalone Python only, see fit_database).
+#
+# Example:
+#   import ThermalAnalysis
+#   rows = ThermalAnalysis.update_rs_idea()                 # whole database
+#   rows = ThermalAnalysis.update_rs_idea(project_id=3)     # one sweep
+#   for unit in ThermalAnalysis.fit_database(project_id=3):
+#       print(unit["unit_id"], unit["ideality"], unit["rs"], unit["is"])
+#   units = ThermalAnalysis.fit_database(workers=None)      # one process per CPU
+
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+DB_FILE = "ThermalBath.db"      # as DBController.connectionString
+Q = 1.602176634E-19             # electron charge (C)
+K = 1.380649E-23                # Boltzmann constant (J/K)
+KELVIN = 273.15
+T0 = 298.15                     # K, reference temperature of the fitted saturation current
+XTI = 3.0                       # saturation current temperature exponent
+EG = 1.11                       # eV, band gap used for units measured at one temperature
+
+COLUMNS = ("TestId", "Temperature", "Vbe1", "Vbe2", "Vbe3",
+           "Ie1_measured", "Ie2_measured", "Ie3_measured", "Ic1", "Ic2", "Ic3")
+
+
+def load_columns(connection, project_id=None):
+    # One SELECT into {column: float64 array}, NULL as nan
+    query = "SELECT {} FROM Test".format(", ".join(COLUMNS))
+    params = ()
+    if project_id is not None:
+        query += " WHERE project_id = ?"
+        params = (project_id,)
+    rows = connection.execute(query, params).fetchall()
+    data = np.array(rows, dtype=np.float64).reshape(len(rows), len(COLUMNS))
+    return {name: data[:, i] for i, name in enumerate(COLUMNS)}
+
+
+def compute_rs_idea(columns):
+    # RS and ideality arrays for column arrays from load_columns
+    vbe1, vbe2, vbe3 = columns["Vbe1"], columns["Vbe2"], columns["Vbe3"]
+    ie1, ie2, ie3 = columns["Ie1_measured"], columns["Ie2_measured"], columns["Ie3_measured"]
+    ic1, ic2, ic3 = columns["Ic1"], columns["Ic2"], columns["Ic3"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ic3ic2 = np.log(ic3 / ic2)
+        ic2ic1 = np.log(ic2 / ic1)
+        ratio = ic3ic2 / ic2ic1
+        rs = ((vbe3 - vbe2) - (vbe2 - vbe1) * ratio) / ((ie3 - ie2) - (ie2 - ie1) * ratio)
+        idea = (Q * ((vbe2 - vbe1) - (ie2 - ie1) * rs)) / ((columns["Temperature"] + KELVIN) * K * ic2ic1)
+    return rs, idea
+
+
+def update_rs_idea(db_file=DB_FILE, project_id=None):
+    # Recompute RS and Idea for every Test row (or one project), returns rows written
+    connection = sqlite3.connect(db_file)
+    try:
+        columns = load_columns(connection, project_id)
+        rs, idea = compute_rs_idea(columns)
+        valid = np.isfinite(rs) & np.isfinite(idea)
+        test_ids = columns["TestId"].astype(np.int64).tolist()
+        rows = [(r if ok else None, i if ok else None, test_id)
+                for r, i, ok, test_id in zip(rs.tolist(), idea.tolist(), valid.tolist(), test_ids)]
+        with connection:            # one transaction, committed on success
+            connection.executemany("UPDATE Test SET RS = ?, Idea = ? WHERE TestId = ?", rows)
+        return len(rows)
+    finally:
+        connection.close()
+
+
+def load_points(connection, project_id=None):
+    # Every measured (Vbe, Ic, Ie) point of the Test table, three per row.
+    # Returns (units, points): units is [(project_id, unit_id), ...] and
+    # points is {"unit": index into units, "t": K, "vbe", "ic", "ie"} arrays
+    query = ("SELECT project_id, unit_id, Temperature, Vbe1, Vbe2, Vbe3, Ic1, Ic2, Ic3, "
+             "Ie1_measured, Ie2_measured, Ie3_measured FROM Test")
+    params = ()
+    if project_id is not None:
+        query += " WHERE project_id = ?"
+        params = (project_id,)
+    rows = connection.execute(query, params).fetchall()
+    data = np.array(rows, dtype=np.float64).reshape(len(rows), 12)
+    keys = np.nan_to_num(data[:, 0:2], nan=-1.0)       # project_id is NULL for older sweeps
+    found, unit = np.unique(keys, axis=0, return_inverse=True)
+    points = {"unit": np.repeat(unit.reshape(-1), 3),
+              "t": np.repeat(data[:, 2] + KELVIN, 3),
+              "vbe": data[:, 3:6].reshape(-1),
+              "ic": data[:, 6:9].reshape(-1),
+              "ie": data[:, 9:12].reshape(-1)}
+    keep = np.isfinite(points["t"]) & np.isfinite(points["vbe"]) & np.isfinite(points["ie"]) & (points["ic"] > 0)
+    points = {name: column[keep] for name, column in points.items()}
+    units = [(None if p < 0 else int(p), None if u < 0 else int(u)) for p, u in found.tolist()]
+    return units, points
+
+
+def fit_points(points, count):
+    # Least squares fit of count units, points["unit"] in 0..count-1.
+    # Returns {"ideality", "rs", "is", "eg", "rms", "points"} arrays of length count
+    unit, t, ie = points["unit"], points["t"], points["ie"]
+    vt = K * t / Q
+    a = np.column_stack((vt * (np.log(points["ic"]) - XTI * np.log(t / T0)), -vt, 1.0 - t / T0, ie))
+    y = points["vbe"].copy()
+    n_points = np.bincount(unit, minlength=count)
+    t_min = np.full(count, np.inf)
+    t_max = np.full(count, -np.inf)
+    np.minimum.at(t_min, unit, t)
+    np.maximum.at(t_max, unit, t)
+    one_temp = (t_max - t_min) < 0.5
+    fixed = one_temp[unit]                      # Eg column replaced by the constant EG
+    y[fixed] -= EG * a[fixed, 2]
+    a[fixed, 2] = 0.0
+    ata = np.zeros((count, 4, 4))
+    atb = np.zeros((count, 4))
+    np.add.at(ata, unit, a[:, :, None] * a[:, None, :])
+    np.add.at(atb, unit, a * y[:, None])
+    ata[one_temp, 2, 2] = 1.0                   # solves to Eg = EG
+    atb[one_temp, 2] = EG
+    scale = np.sqrt(np.einsum("uii->ui", ata))  # columns differ by ~6 decades
+    scale[scale == 0] = 1.0
+    x = np.einsum("uij,uj->ui", np.linalg.pinv(ata / (scale[:, :, None] * scale[:, None, :])), atb / scale) / scale
+    residual = y - np.einsum("pi,pi->p", a, x[unit])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rms = np.sqrt(np.bincount(unit, residual ** 2, minlength=count) / n_points)
+        saturation = np.exp(x[:, 1] / x[:, 0])
+    result = {"ideality": x[:, 0], "rs": x[:, 3], "is": saturation, "eg": x[:, 2],
+              "rms": rms, "points": n_points}
+    short = n_points < np.where(one_temp, 3, 4)  # fewer points than unknowns
+    for name in ("ideality", "rs", "is", "eg", "rms"):
+        result[name][short] = np.nan
+    return result
+
+
+def fit_database(db_file=DB_FILE, project_id=None, workers=1):
+    # Fit ideality, RS and saturation current of every unit (or one project).
+    # workers = processes to use, 1 = this process only, None = one per CPU.
+    # Keep 1 when embedded (pythonnet): sys.executable is then the GUI, so a
+    # process pool would start copies of it. Returns a dict per unit:
+    # project_id, unit_id, ideality, rs (ohm), is (A at T0), eg (eV),
+    # rms (V, fit residual) and points
+    connection = sqlite3.connect(db_file)
+    try:
+        units, points = load_points(connection, project_id)
+    finally:
+        connection.close()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    order = np.argsort(points["unit"], kind="stable")
+    points = {name: column[order] for name, column in points.items()}
+    bounds = np.linspace(0, len(units), min(workers, len(units)) + 1).astype(int)
+    jobs = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        lo, hi = np.searchsorted(points["unit"], [first, last])
+        chunk = {name: column[lo:hi] for name, column in points.items()}
+        chunk["unit"] = chunk["unit"] - first
+        jobs.append((chunk, last - first))
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            fits = list(pool.map(fit_points, *zip(*jobs)))
+    else:
+        fits = [fit_points(*job) for job in jobs]
+    results = []
+    for (first, last), fit in zip(zip(bounds[:-1], bounds[1:]), fits):
+        for i in range(last - first):
+            unit = {"project_id": units[first + i][0], "unit_id": units[first + i][1]}
+            for name, values in fit.items():
+                unit[name] = values[i].item()
+            results.append(unit)
+    return results
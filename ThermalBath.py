@@ -1,35 +1,223 @@
 import time
 from pymeasure.instruments.fluke import Fluke7341
 from pymeasure.instruments import list_resources
+from pyvisa.errors import VisaIOError
+import math
 import re
+import threading
+from collections import deque
 
 
+BATH_RESOURCE = "GPIB::22"
+STABLE_WINDOW = 15.0        # seconds of readings StabilityDetector judges
+STABLE_TIMEOUT = 3600.0     # seconds wait_stable waits before giving up
+_bath_factory = Fluke7341   # replaced by use_simulator()
+_sleep = time.sleep
+_clock = time.time
 
 
-def set_temp(temp, stable_time):
-    fluke = Fluke7341("GPIB::22")
+_baths = {}                 # resource -> Bath, see get_bath()
+moves = []                  # (start, set point, settle seconds) per set_temp, see ThermalSweep.RateModel.learn
+_SESSION_ERRORS = (VisaIOError, OSError)
+
+
+class Bath:
+    # One open instrument session, reused for every call and reopened once
+    # if a query fails because the session was lost (bath power cycled,
+    # GPIB controller reset, ...).
+
+    def __init__(self, resource=BATH_RESOURCE):
+        self.resource = resource
+        self.instrument = None
+        self._lock = threading.Lock()   # C# may poll from another thread
+
+    def connect(self):
+        with self._lock:
+            if self.instrument is None:
+                self.instrument = _bath_factory(self.resource)
+        return self
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    @property
+    def connected(self):
+        return self.instrument is not None
+
+    @property
+    def temperature(self):
+        return self._call(lambda fluke: fluke.temperature)
+
+    @property
+    def set_point(self):
+        return self._call(lambda fluke: fluke.set_point)
+
+    @set_point.setter
+    def set_point(self, value):
+        def write(fluke):
+            fluke.set_point = value
+        self._call(write)
+
+    def _call(self, action):
+        with self._lock:
+            for attempt in (0, 1):
+                if self.instrument is None:
+                    self.instrument = _bath_factory(self.resource)
+                try:
+                    return action(self.instrument)
+                except _SESSION_ERRORS:
+                    self._close()
+                    if attempt == 1:
+                        raise
+
+    def _close(self):
+        if self.instrument is None:
+            return
+        adapter = getattr(self.instrument, "adapter", None)
+        self.instrument = None
+        if adapter is not None:
+            try:
+                adapter.close()
+            except _SESSION_ERRORS:
+                pass            # session already gone
+
+
+def get_bath(resource=BATH_RESOURCE):
+    # Shared Bath for resource, connected on first use
+    if resource not in _baths:
+        _baths[resource] = Bath(resource)
+    return _baths[resource].connect()
+
+
+def close_baths():
+    for bath in _baths.values():
+        bath.close()
+    _baths.clear()
+
+
+def use_simulator(sim=None):
+    # Route set_temp/get_temperture to a ThermalBath_sim.Fluke7341Sim, including its clock
+    global _bath_factory, _sleep, _clock
+    if sim is None:
+        import ThermalBath_sim
+        sim = ThermalBath_sim.Fluke7341Sim()
+    close_baths()
+    _bath_factory = lambda resource: sim
+    _sleep = sim.sleep
+    _clock = sim.now
+    return sim
+
+
+def now():
+    # Seconds on the bath clock (the simulator's clock after use_simulator)
+    return _clock()
+
+
+class StabilityDetector:
+    # Declares the bath settled once the readings of the last `window`
+    # seconds are all within `band` of the set point, their least-squares
+    # slope is below `max_slope` (deg C per minute) and their standard
+    # deviation is below `max_std`. Feed it one reading every `interval`.
+
+    def __init__(self, window=STABLE_WINDOW, band=0.1, max_slope=0.05, max_std=0.03, interval=1.0):
+        self.window = window
+        self.band = band
+        self.max_slope = max_slope
+        self.max_std = max_std
+        self.interval = interval
+        self.samples = deque()      # (time, temperature - set point)
+        self.stats = None           # (max |error|, std, slope per minute) of last full window
+
+    def reset(self):
+        self.samples.clear()
+        self.stats = None
+
+    def add(self, t, temperature, set_point):
+        # Add one reading, True once the window meets every criterion
+        self.samples.append((t, temperature - set_point))
+        while len(self.samples) > 1 and t - self.samples[1][0] >= self.window:
+            self.samples.popleft()      # oldest kept sample is the one spanning the window
+        return self.settled()
+
+    def settled(self):
+        if len(self.samples) < 3 or self.samples[-1][0] - self.samples[0][0] < self.window:
+            return False
+        n = len(self.samples)
+        t0 = self.samples[0][0]
+        times = [t - t0 for t, error in self.samples]
+        errors = [error for t, error in self.samples]
+        mean_t = sum(times) / n
+        mean_e = sum(errors) / n
+        var_t = sum((t - mean_t) ** 2 for t in times)
+        slope = 0.0
+        if var_t > 0:
+            slope = sum((t - mean_t) * (e - mean_e) for t, e in zip(times, errors)) / var_t * 60.0
+        std = math.sqrt(sum((e - mean_e) ** 2 for e in errors) / n)
+        worst = max(abs(e) for e in errors)
+        self.stats = (worst, std, slope)
+        return worst <= self.band and abs(slope) <= self.max_slope and std <= self.max_std
+
+
+def wait_stable(set_point, detector=None, timeout=STABLE_TIMEOUT, bath=None):
+    # Sample the bath until detector declares it settled at set_point.
+    # Returns seconds taken, or None if timeout (seconds, None = no limit)
+    # expires first.
+    if bath is None:
+        bath = get_bath()
+    if detector is None:
+        detector = StabilityDetector()
+    detector.reset()
+    start = _clock()
+    last_print = None
+    while True:
+        now = _clock()
+        reading = bath.temperature
+        if last_print is None or now - last_print >= 20:
+            print(reading)
+            last_print = now
+        if detector.add(now, conver2Float(reading), set_point):
+            return now - start
+        if timeout is not None and now - start >= timeout:
+            return None
+        _sleep(detector.interval)
+
+
+def set_temp(temp, stable_time, detector=None, timeout=None):
+    # Set the bath and return once it is stable. The detector judges the
+    # last STABLE_WINDOW seconds; stable_time (the old fixed soak) only caps
+    # that window. Returns the measured settle time in seconds. By default
+    # it waits as long as the bath takes; with a timeout (seconds) it
+    # returns None if the bath did not settle in time.
+    fluke = get_bath()
+    start_temp = conver2Float(fluke.temperature)
     fluke.set_point = temp
-    while abs(conver2Float(fluke.temperature) - conver2Float(fluke.set_point)) > 0.1:
-        print(fluke.temperature)
-        time.sleep(20)
-    time.sleep(stable_time)
-    print(fluke.temperature)
-    pass
+    if detector is None:
+        detector = StabilityDetector(window=min(STABLE_WINDOW, stable_time))
+    settle_time = wait_stable(temp, detector, timeout, fluke)
+    if settle_time is None:
+        print("Not settled at {} after {:.0f} s".format(temp, timeout))
+        return None
+    worst, std, slope = detector.stats
+    print("Settled at {} after {:.0f} s (max error {:.3f}, std {:.3f}, slope {:.3f}/min)".format(
+        temp, settle_time, worst, std, slope))
+    moves.append((start_temp, temp, settle_time))
+    return settle_time
 
 
 def set_temp_without_sync(temp):
-    fluke = Fluke7341("GPIB::22")
+    fluke = get_bath()
     fluke.set_point = temp
     pass
 
 	
 def get_temperture():
-    fluke = Fluke7341("GPIB::22")
+    fluke = get_bath()
     return fluke.temperature
 
 
 def conver2Float(string):
-    match = re.search(r'\d+\.\d+', string)
+    match = re.search(r'-?\d+\.\d+', string)
     if match:
         number = float(match.group())
         return number
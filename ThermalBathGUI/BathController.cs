@@ -17,6 +17,7 @@ namespace ThermalBathGUI
         dynamic getTemperatureFunction;
         dynamic convertToFloatFunction;
         dynamic setTempWithoutSync;
+        dynamic closeBathsFunction;
 
 
         public BathController()
@@ -32,13 +33,18 @@ namespace ThermalBathGUI
             getTemperatureFunction = bath_Module.get_temperture;
             convertToFloatFunction = bath_Module.conver2Float;
             setTempWithoutSync = bath_Module.set_temp_without_sync;
+            closeBathsFunction = bath_Module.close_baths;
 
         }
 
         public void setTemp(int temp=25)
         {
-            // Call the set_temp function
-            setTempFunction(temp, 60);  // Example values
+            // Call the set_temp function, None means the bath never settled
+            PyObject settleTime = setTempFunction(temp, 60);  // Example values
+            if (settleTime.IsNone())
+            {
+                throw new TimeoutException($"Bath did not settle at {temp}");
+            }
 
             // Call the get_temperture function
             dynamic temperature = getTemperatureFunction();
@@ -52,6 +58,8 @@ namespace ThermalBathGUI
 
         public void disconnectPy()
         {
+            // Close the bath session kept open between calls
+            closeBathsFunction();
 
             // Shut down the Python engine
             PythonEngine.Shutdown();
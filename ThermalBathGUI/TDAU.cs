@@ -120,21 +120,9 @@ internal class TDAU
 
         public void writeMemorey(int baseAddress, int channel, int curr, float data)
         {
-            String hexString = FloatToHex(data);
-            // Check if the length is even
-            if (hexString.Length % 2 == 0)
-            {
-                byte[] byteArray = new byte[hexString.Length / 2];
-
-                // Convert each pair of characters to a byte
-                for (int i = 0; i < byteArray.Length; i++)
-                {
-                    string hexPair = hexString.Substring(i * 2, 2);
-                    byteArray[i] = Convert.ToByte(hexPair, 16);
-                    int address = baseAddress + (12 * channel) + (4 * curr) +i;
-                    TDAU_class.fnWrMemory(address, byteArray[i]);
-                }
-            }
+            // One 4-byte frame per float instead of one frame per byte
+            int address = baseAddress + (12 * channel) + (4 * curr);
+            TDAU_class.fnWrFloat(address, data);
         }
 
         public float readMemorey(int address)
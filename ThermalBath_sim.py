@@ -0,0 +1,93 @@
+# Fluke 7341 bath simulator
+# Local stand-in for pymeasure's Fluke7341 so ThermalBath.set_temp, sweep
+# logic and settle detection can run without the GPIB bath.
+#
+# The bath follows the set point with a first-order response (time
+# constant tau). With overshoot > 0 the step response is underdamped:
+# the first peak passes the set point by that fraction of the step and
+# the oscillation decays with the same time constant.
+#
+# The simulator keeps its own clock. sleep() advances it and only waits
+# seconds / speed of real time, so speed=600 runs a 10 minute settle in
+# one second and speed=None does not wait at all.
+#
+# Example:
+#   import ThermalBath, ThermalBath_sim
+#   ThermalBath.use_simulator(ThermalBath_sim.Fluke7341Sim(tau=120, speed=None))
+#   ThermalBath.set_temp(40, 60)
+
+import math
+import random
+import time
+
+
+class Fluke7341Sim():
+    def __init__(self, temperature=25.0, tau=300.0, noise=0.005, overshoot=0.0, speed=1.0):
+        self.tau = tau                  # seconds, time constant of the response
+        self.noise = noise              # deg C, std dev added to each temperature read
+        self.overshoot = overshoot      # fraction of the step, 0 = plain first-order
+        self.speed = speed              # simulated seconds per real second, None = no waiting
+        self.min_temp = -40.0           # Fluke7341 set point range
+        self.max_temp = 150.0
+        self.unit = "c"
+        self._now = 0.0                 # simulated seconds
+        self._real = time.time()        # real time at _now
+        self._set_point = temperature
+        self._start_temp = temperature  # temperature when set point last changed
+        self._start_time = 0.0
+
+    # ---------- pymeasure Fluke7341 interface ----------
+    @property
+    def temperature(self):
+        """Bath temperature as the instrument prints it, e.g. 't: 25.01 C'"""
+        value = self.true_temperature()
+        if self.noise > 0:
+            value += random.gauss(0.0, self.noise)
+        return "t: {:.2f} {}".format(value, self.unit.upper())
+
+    @property
+    def set_point(self):
+        """Set point as the instrument prints it, e.g. 'set: 25.00 C'"""
+        return "set: {:.2f} {}".format(self._set_point, self.unit.upper())
+
+    @set_point.setter
+    def set_point(self, value):
+        value = float(value)
+        if not (self.min_temp <= value <= self.max_temp):
+            raise ValueError("Value of {:g} is out of range [{:g},{:g}]".format(value, self.min_temp, self.max_temp))
+        self._start_temp = self.true_temperature()
+        self._start_time = self.now()
+        self._set_point = value
+
+    # ---------- Simulated clock ----------
+    def now(self):
+        """Simulated seconds since the simulator was created"""
+        if self.speed is None:
+            return self._now
+        return self._now + (time.time() - self._real) * self.speed
+
+    def sleep(self, seconds):
+        """Advance the simulated clock, waiting seconds / speed of real time"""
+        if self.speed is None:
+            self._now += seconds
+            return
+        time.sleep(seconds / self.speed)
+
+    # ---------- Model ----------
+    def true_temperature(self, at=None):
+        """Noise-free bath temperature at simulated time at (default now)"""
+        elapsed = max((self.now() if at is None else at) - self._start_time, 0.0)
+        step = self._set_point - self._start_temp
+        if self.tau <= 0:
+            return self._set_point
+        if self.overshoot <= 0:
+            return self._set_point - step * math.exp(-elapsed / self.tau)
+        # Underdamped second order: damping ratio from the first peak overshoot,
+        # natural frequency chosen so the envelope decays with tau
+        log_os = math.log(min(self.overshoot, 0.99))
+        zeta = -log_os / math.sqrt(math.pi ** 2 + log_os ** 2)
+        wn = 1.0 / (zeta * self.tau)
+        wd = wn * math.sqrt(1.0 - zeta ** 2)
+        envelope = math.exp(-elapsed / self.tau)
+        return self._set_point - step * envelope * (math.cos(wd * elapsed)
+                                                    + zeta / math.sqrt(1.0 - zeta ** 2) * math.sin(wd * elapsed))
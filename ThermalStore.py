@@ -0,0 +1,180 @@
+# Batched measurement writer for ThermalBath.db
+# Samples are queued in memory and written by one background thread with
+# executemany, at most flush_rows samples per transaction, WAL journaling
+# on. A batch is written once it holds flush_rows samples or its oldest
+# sample is flush_age seconds old, so producers (one thread per TDAU)
+# never wait on the database.
+#
+# A sample is a dict of Test columns:
+#   - with TestId: fills in the measurement columns of that row, as
+#     Form1.insertMesurment2DB does
+#   - without TestId: appends a new Test row
+#
+# Example:
+#   import ThermalStore
+#   with ThermalStore.MeasurementWriter(flush_rows=1000, flush_age=2.0) as writer:
+#       writer.add({"TestId": 17, "Vbe1": 0.652, "Ib1": 1.2e-7, ...})
+#   print(writer.report())
+
+import sqlite3
+import threading
+import time
+
+DB_FILE = "ThermalBath.db"      # as DBController.connectionString
+
+KEY_COLUMNS = ("TestId", "Temperature", "project_id", "unit_id", "curr_combination_id", "Voltage")
+MEASUREMENT_COLUMNS = ("Vbe1", "Ib1", "Vbe2", "Ib2", "Vbe3", "Ib3",
+                       "Ie1_measured", "Ie2_measured", "Ie3_measured",
+                       "Ic1", "Ic2", "Ic3",
+                       "Ie1_leak", "Ie2_leak", "Ie3_leak",
+                       "Ib1_leak", "Ib2_leak", "Ib3_leak")
+COLUMNS = KEY_COLUMNS + MEASUREMENT_COLUMNS
+
+# Existing rows keep their keys and only take the measurement columns that
+# the sample has (NULL in the sample leaves the stored value alone)
+UPSERT = ("INSERT INTO Test ({}) VALUES ({}) ON CONFLICT(TestId) DO UPDATE SET {}".format(
+    ", ".join(COLUMNS), ", ".join("?" * len(COLUMNS)),
+    ", ".join("{0} = coalesce(excluded.{0}, {0})".format(c) for c in MEASUREMENT_COLUMNS)))
+
+
+class MeasurementWriter:
+    def __init__(self, db_file=DB_FILE, flush_rows=500, flush_age=1.0):
+        self.db_file = db_file
+        self.flush_rows = flush_rows    # write once this many samples are queued
+        self.flush_age = flush_age      # seconds, write once the oldest sample is this old
+        self.rows = 0                   # samples written
+        self.flushes = 0                # transactions committed
+        self.db_seconds = 0.0           # time spent inside executemany/commit
+        self.error = None               # exception that stopped the writer thread
+        self._batch = []
+        self._oldest = None             # time.time() of the oldest queued sample
+        self._added = 0
+        self._started = None
+        self._stop = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def start(self):
+        if self._thread is None:
+            self._started = time.time()
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="MeasurementWriter", daemon=True)
+            self._thread.start()
+        return self
+
+    def add(self, sample):
+        # Queue one sample (dict of Test columns), safe from any thread
+        unknown = set(sample) - set(COLUMNS)
+        if unknown:
+            raise KeyError("Not Test columns: {}".format(", ".join(sorted(unknown))))
+        row = tuple(sample.get(c) for c in COLUMNS)
+        with self._cond:
+            self._queue([row])
+
+    def add_many(self, samples):
+        rows = []
+        for sample in samples:
+            unknown = set(sample) - set(COLUMNS)
+            if unknown:
+                raise KeyError("Not Test columns: {}".format(", ".join(sorted(unknown))))
+            rows.append(tuple(sample.get(c) for c in COLUMNS))
+        with self._cond:
+            self._queue(rows)
+
+    def flush(self):
+        # Block until everything queued so far is committed
+        with self._cond:
+            target = self._added
+            self._oldest = 0.0          # due now
+            self._cond.notify_all()
+            while self.rows < target and self.error is None and self._alive():
+                self._cond.wait(0.1)
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        # Write what is queued and stop the writer thread
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+        if self.error is not None:
+            raise self.error
+
+    def stats(self):
+        elapsed = (time.time() - self._started) if self._started is not None else 0.0
+        return {"rows": self.rows, "queued": self._added - self.rows, "flushes": self.flushes,
+                "rows_per_sec": self.rows / elapsed if elapsed > 0 else 0.0,
+                "db_rows_per_sec": self.rows / self.db_seconds if self.db_seconds > 0 else 0.0}
+
+    def report(self):
+        s = self.stats()
+        return ("{rows} rows in {flushes} transactions, {rows_per_sec:.0f} rows/s overall, "
+                "{db_rows_per_sec:.0f} rows/s while writing, {queued} queued".format(**s))
+
+    def _alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _queue(self, rows):
+        if self.error is not None:
+            raise self.error
+        if not self._alive():
+            raise RuntimeError("MeasurementWriter is not started")
+        if not rows:
+            return
+        first = not self._batch
+        if first:
+            self._oldest = time.time()
+        self._batch.extend(rows)
+        self._added += len(rows)
+        if first or len(self._batch) >= self.flush_rows:
+            self._cond.notify_all()     # first sample arms the writer's flush_age timeout
+
+    def _run(self):
+        connection = None
+        try:
+            connection = sqlite3.connect(self.db_file)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")     # durable at checkpoints, safe with WAL
+            while True:
+                with self._cond:
+                    while not self._stop:
+                        if self._batch and (len(self._batch) >= self.flush_rows
+                                            or time.time() - self._oldest >= self.flush_age):
+                            break
+                        timeout = None
+                        if self._batch:
+                            timeout = max(self.flush_age - (time.time() - self._oldest), 0.0)
+                        self._cond.wait(timeout)
+                    batch, self._batch = self._batch, []
+                    stop = self._stop
+                for first in range(0, len(batch), self.flush_rows):
+                    chunk = batch[first:first + self.flush_rows]
+                    start = time.time()
+                    with connection:            # one transaction per flush_rows samples
+                        connection.executemany(UPSERT, chunk)
+                    with self._cond:
+                        self.db_seconds += time.time() - start
+                        self.rows += len(chunk)
+                        self.flushes += 1
+                        self._cond.notify_all()
+                if stop:
+                    break
+        except Exception as e:
+            with self._cond:
+                self.error = e
+                self._cond.notify_all()
+        finally:
+            if connection is not None:
+                connection.close()
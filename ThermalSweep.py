@@ -0,0 +1,222 @@
+# Bath sweep planning
+# Orders a set of bath set points so the whole sweep takes the least
+# predicted wall time. The bath heats and cools at different rates, so
+# the cost of a move depends on its direction:
+#
+#   seconds(a -> b) = settle + |b - a| * 60 / (heat_rate if b > a else cool_rate)
+#
+# Rates are configured in deg C per minute or learned from recorded moves
+# with RateModel.learn(ThermalBath.moves). Because that cost adds up along the temperature
+# axis, an optimal sweep only ever extends the range of visited set points
+# to the left or right, so plan_sweep() can search every such order exactly.
+#
+# Example:
+#   model = RateModel(heat_rate=2.0, cool_rate=0.7, settle=120)
+#   order, timeline = plan_sweep(25, [-10, 0, 10, 40, 60, 80], model)
+#
+# SweepRunner then visits the order, overlapping TDAU work with the bath:
+#   runner = SweepRunner(tdau, measure, housekeeping=write_config, on_result=store)
+#   results = runner.run(order)     # [(set point, measurement, settle s or None), ...]
+#   print(runner.report())
+
+from concurrent.futures import ThreadPoolExecutor
+import ThermalBath
+
+
+class RateModel:
+    def __init__(self, heat_rate=1.0, cool_rate=0.5, settle=60.0):
+        self.heat_rate = heat_rate      # deg C per minute while heating
+        self.cool_rate = cool_rate      # deg C per minute while cooling
+        self.settle = settle            # seconds from reaching a set point to stable
+
+    def ramp_time(self, start, end):
+        if end > start:
+            return (end - start) * 60.0 / self.heat_rate
+        return (start - end) * 60.0 / self.cool_rate
+
+    def move_time(self, start, end):
+        return self.ramp_time(start, end) + self.settle
+
+    def learn(self, moves):
+        # Fit heat_rate, cool_rate and settle to recorded (start, end, seconds)
+        # moves by least squares: seconds = settle + up * a + down * b
+        rows = []
+        for start, end, seconds in moves:
+            rows.append((1.0, max(end - start, 0.0), max(start - end, 0.0), seconds))
+        if len(rows) < 3:
+            return False
+        normal = [[sum(r[i] * r[j] for r in rows) for j in range(3)] + [sum(r[i] * r[3] for r in rows)]
+                  for i in range(3)]
+        solution = _solve3(normal)
+        if solution is None or solution[1] <= 0 or solution[2] <= 0:
+            return False        # need moves in both directions to fit both rates
+        settle, per_up, per_down = solution
+        self.settle = max(settle, 0.0)
+        self.heat_rate = 60.0 / per_up
+        self.cool_rate = 60.0 / per_down
+        return True
+
+
+def plan_sweep(start, set_points, model):
+    # Order set_points (duplicates visited once) for least predicted time.
+    # Returns (order, timeline), timeline entries being
+    # (set point, start s, ramp s, settle s, end s) from the first move.
+    points = sorted(set(set_points))
+    n = len(points)
+    if n == 0:
+        return [], []
+    # best[(i, j, side)] = (seconds, previous state) having visited points[i..j],
+    # standing on points[i] (side 0) or points[j] (side 1)
+    best = {}
+    for k in range(n):
+        best[(k, k, 0)] = (model.move_time(start, points[k]), None)
+    for width in range(1, n):
+        for i in range(0, n - width):
+            j = i + width
+            for side, here, inner in ((0, points[i], (i + 1, j)), (1, points[j], (i, j - 1))):
+                options = []
+                for inner_side in (0, 1):
+                    state = inner + (inner_side,)
+                    if state not in best:
+                        continue
+                    there = points[state[0]] if inner_side == 0 else points[state[1]]
+                    options.append((best[state][0] + model.move_time(there, here), state))
+                best[(i, j, side)] = min(options)
+    finals = [s for s in ((0, n - 1, 0), (0, n - 1, 1)) if s in best]
+    state = min(finals, key=lambda s: best[s][0])
+    order = []
+    while state is not None:
+        i, j, side = state
+        order.append(points[i] if side == 0 else points[j])
+        state = best[state][1]
+    order.reverse()
+    return order, predict_timeline(start, order, model)
+
+
+def predict_timeline(start, order, model):
+    # Predicted (set point, start s, ramp s, settle s, end s) for visiting order
+    timeline = []
+    now = 0.0
+    here = start
+    for point in order:
+        ramp = model.ramp_time(here, point)
+        timeline.append((point, now, ramp, model.settle, now + ramp + model.settle))
+        now += ramp + model.settle
+        here = point
+    return timeline
+
+
+def _solve3(m):
+    # Gaussian elimination on a 3x4 augmented matrix, None if singular
+    m = [row[:] for row in m]
+    for col in range(3):
+        pivot = max(range(col, 3), key=lambda r: abs(m[r][col]))
+        if abs(m[pivot][col]) < 1e-12:
+            return None
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(3):
+            if r != col:
+                f = m[r][col] / m[col][col]
+                m[r] = [a - f * b for a, b in zip(m[r], m[col])]
+    return [m[i][3] / m[i][i] for i in range(3)]
+
+
+class SweepRunner:
+    # Runs an ordered sweep with the bath and a TDAU working at the same time:
+    #   - the next set point is sent as soon as the current measurement returns,
+    #     so on_result (database writes etc.) runs during the next ramp
+    #   - housekeeping(set point, tdau) (config writes, calibration, log
+    #     drains) runs on the TDAU while the bath ramps and settles
+    #   - measure(set point, tdau) runs as soon as the stability detector
+    #     fires and housekeeping for that point has finished. A point that
+    #     does not settle within settle_timeout is not measured unless
+    #     measure_unsettled is set.
+    # Settled moves are added to ThermalBath.moves for RateModel.learn.
+    # Every phase is recorded in timeline as (set point, phase, start, end),
+    # seconds on the bath clock from the start of run().
+
+    def __init__(self, tdau, measure, housekeeping=None, on_result=None, detector=None,
+                 settle_timeout=ThermalBath.STABLE_TIMEOUT, bath=None, measure_unsettled=False):
+        self.tdau = tdau
+        self.measure = measure
+        self.housekeeping = housekeeping
+        self.on_result = on_result
+        self.detector = detector
+        self.settle_timeout = settle_timeout
+        self.bath = bath
+        self.measure_unsettled = measure_unsettled
+        self.timeline = []
+        self._start = 0.0
+
+    def run(self, order):
+        # Visit set points in order, returns [(set point, measurement, settle
+        # seconds), ...]; settle is None after a settle timeout, measurement
+        # then None too unless measure_unsettled. Raises the first on_result
+        # error once the sweep has finished.
+        bath = self.bath if self.bath is not None else ThermalBath.get_bath()
+        detector = self.detector if self.detector is not None else ThermalBath.StabilityDetector()
+        self.timeline = []
+        self._start = ThermalBath.now()
+        results = []
+        stores = []
+        tdau_worker = ThreadPoolExecutor(max_workers=1)     # housekeeping, one TDAU command at a time
+        store_worker = ThreadPoolExecutor(max_workers=1)    # on_result, in set point order
+        try:
+            for point in order:
+                start_temp = ThermalBath.conver2Float(bath.temperature)
+                set_time = ThermalBath.now()
+                bath.set_point = point
+                pending = None
+                if self.housekeeping is not None:
+                    pending = tdau_worker.submit(self._timed, point, "housekeeping", self.housekeeping)
+                settle = ThermalBath.wait_stable(point, detector, self.settle_timeout, bath)
+                self._record(point, "settle" if settle is not None else "settle timeout", set_time)
+                if settle is not None:
+                    ThermalBath.moves.append((start_temp, point, settle))
+                if pending is not None:
+                    wait_start = ThermalBath.now()
+                    pending.result()
+                    self._record(point, "wait housekeeping", wait_start)
+                if settle is None and not self.measure_unsettled:
+                    results.append((point, None, None))
+                    continue
+                result = self._timed(point, "measure", self.measure)
+                results.append((point, result, settle))
+                if self.on_result is not None:
+                    stores.append(store_worker.submit(self._timed, point, "store", self.on_result, result))
+        finally:
+            tdau_worker.shutdown(wait=True)
+            store_worker.shutdown(wait=True)
+        for store in stores:
+            store.result()                  # re-raise a failed store
+        return results
+
+    def report(self):
+        # One line per set point with the seconds spent in each phase
+        phases = ["settle", "housekeeping", "wait housekeeping", "measure", "store"]
+        totals = {}
+        order = []
+        for point, phase, start, end in self.timeline:
+            if point not in totals:
+                totals[point] = {}
+                order.append(point)
+            key = "settle" if phase == "settle timeout" else phase
+            totals[point][key] = totals[point].get(key, 0.0) + (end - start)
+        lines = ["{:>8} ".format("set") + " ".join("{:>17}".format(p) for p in phases)]
+        for point in order:
+            lines.append("{:>8} ".format(point)
+                         + " ".join("{:>17.1f}".format(totals[point].get(p, 0.0)) for p in phases))
+        end = max([e for p, ph, s, e in self.timeline] or [0.0])
+        hidden = sum(e - s for p, ph, s, e in self.timeline if ph in ("housekeeping", "store"))
+        lines.append("total {:.1f} s, {:.1f} s of housekeeping/store overlapped with the bath".format(end, hidden))
+        return "\n".join(lines)
+
+    def _timed(self, point, phase, action, *args):
+        start = ThermalBath.now()
+        try:
+            return action(point, self.tdau, *args)
+        finally:
+            self._record(point, phase, start)
+
+    def _record(self, point, phase, start):
+        self.timeline.append((point, phase, start - self._start, ThermalBath.now() - self._start))